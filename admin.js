@@ -600,12 +600,20 @@ class AdminDataManager {
         const index = this.phones.findIndex(p => p.id === id);
         if (index === -1) return null;
 
+        const previous = this.phones[index];
         this.phones[index] = {
-            ...this.phones[index],
+            ...previous,
             ...phoneData,
             updatedAt: new Date().toISOString()
         };
 
+        // The catalog placeholder previews the old image; drop it once the image is replaced
+        const imagePath = image => (image || '').split('?')[0];
+        if (phoneData.image !== undefined && phoneData.placeholder === undefined &&
+            imagePath(phoneData.image) !== imagePath(previous.image)) {
+            this.phones[index].placeholder = '';
+        }
+
         this.savePhones();
         return this.phones[index];
     }
@@ -807,9 +815,12 @@ if (isOnAdminPage()) {
     cleanupImageUrls();
 } else {
     // On customer pages (sell-phones.html, quote.html), create minimal adminManager
-    // Just to expose phones array from localStorage without initializing phoneDatabase
+    // Just to expose phones array from localStorage without initializing phoneDatabase.
+    // Phones assigned on the page (catalog bundles, see loadBrandBundle in quote.js)
+    // are kept in memory next to the stored ones and never written to localStorage.
     adminManager = {
-        get phones() {
+        pagePhones: [],
+        get storedPhones() {
             const stored = localStorage.getItem('ktmobile_phones');
             if (stored) {
                 try {
@@ -820,6 +831,15 @@ if (isOnAdminPage()) {
                 }
             }
             return [];
+        },
+        get phones() {
+            const stored = this.storedPhones;
+            const storedIds = new Set(stored.map(p => p.id));
+            return stored.concat(this.pagePhones.filter(p => !storedIds.has(p.id)));
+        },
+        set phones(phones) {
+            const storedIds = new Set(this.storedPhones.map(p => p.id));
+            this.pagePhones = phones.filter(p => !storedIds.has(p.id));
         }
     };
     console.log('✅ Minimal adminManager created for customer page (read-only access to localStorage)');
@@ -5987,56 +6007,32 @@ async function runExactPriceImport() {
         importButton.innerHTML = '⏳ Importing Exact Prices...';
         importButton.disabled = true;
 
-        // Load the exact price import script with cache-busting
-        const cacheBuster = Date.now();
-        const response = await fetch(`import-exact-prices.js?v=${cacheBuster}`);
-        if (!response.ok) {
-            throw new Error(`Failed to load exact price import script: ${response.status}`);
-        }
-
-        const scriptText = await response.text();
-        console.log('📥 Loaded exact price import script, length:', scriptText.length);
+        // Load the catalog bundles (content-hashed chunks from python -m tools.bundles)
+        const result = await window.catalogBundles.importAll();
 
-        // Execute the script (this will define the importExactPrices function)
-        try {
-            eval(scriptText);
-            console.log('✅ Import script executed successfully');
-        } catch (error) {
-            console.error('❌ Import script syntax error:', error);
-            throw new Error(`Import script has syntax error: ${error.message}`);
-        }
-
-        // Run the import function if it exists
-        if (typeof importExactPrices === 'function') {
-            console.log('▶️ Running importExactPrices()...');
-            const result = importExactPrices();
-
-            // Update timestamp (in case import script didn't set it)
-            localStorage.setItem('ktmobile_last_update', new Date().toISOString());
+        // Update timestamp (in case import script didn't set it)
+        localStorage.setItem('ktmobile_last_update', new Date().toISOString());
 
-            // Reload phone data from localStorage
-            adminManager.phones = adminManager.loadPhones();
+        // Reload phone data from localStorage
+        adminManager.phones = adminManager.loadPhones();
 
-            // Refresh the UI
-            renderPhones();
-            renderPriceTable();
+        // Refresh the UI
+        renderPhones();
+        renderPriceTable();
 
-            // Sync to Firebase cloud
-            if (window.firebaseSync && window.priceDB) {
-                const database = window.priceDB.loadDatabase();
-                window.firebaseSync.syncPriceDatabase(database).catch(err => {
-                    console.warn('Firebase sync failed, data saved locally only:', err);
-                });
-            }
+        // Sync to Firebase cloud
+        if (window.firebaseSync && window.priceDB) {
+            const database = window.priceDB.loadDatabase();
+            window.firebaseSync.syncPriceDatabase(database).catch(err => {
+                console.warn('Firebase sync failed, data saved locally only:', err);
+            });
+        }
 
-            // Close modal
-            closeImportModal();
+        // Close modal
+        closeImportModal();
 
-            console.log('✅ Price import completed successfully');
-            console.log(`   Updated: ${result.updated}, Added: ${result.added}, Total: ${result.total}`);
-        } else {
-            throw new Error('importExactPrices function not found in script');
-        }
+        console.log('✅ Price import completed successfully');
+        console.log(`   Updated: ${result.updated}, Added: ${result.added}, Total: ${result.total}`);
 
         // Reset button (in case modal didn't close)
         importButton.innerHTML = originalText;
@@ -6091,74 +6087,52 @@ async function clearAndReimport() {
         importButton.innerHTML = '⏳ Clearing & Importing...';
         importButton.disabled = true;
 
-        // Load the exact price import script with cache-busting
-        const cacheBuster = Date.now();
-        const response = await fetch(`import-exact-prices.js?v=${cacheBuster}`);
-        if (!response.ok) {
-            throw new Error(`Failed to load import script: ${response.status}`);
-        }
-
-        const scriptText = await response.text();
-        console.log('📄 Loaded import script, length:', scriptText.length);
-
-        // Check for syntax errors before eval
-        try {
-            eval(scriptText);
-            console.log('✅ Import script executed successfully');
-        } catch (error) {
-            console.error('❌ Import script syntax error:', error);
-            throw new Error(`Import script has syntax error: ${error.message}`);
-        }
-
-        if (typeof importExactPrices === 'function') {
-            const result = importExactPrices();
+        // Load the catalog bundles (content-hashed chunks from python -m tools.bundles)
+        const result = await window.catalogBundles.importAll();
 
-            // Update timestamp (in case import script didn't set it)
-            localStorage.setItem('ktmobile_last_update', new Date().toISOString());
+        // Update timestamp (in case import script didn't set it)
+        localStorage.setItem('ktmobile_last_update', new Date().toISOString());
 
-            // Reload from localStorage
-            adminManager.phones = adminManager.loadPhones();
+        // Reload from localStorage
+        adminManager.phones = adminManager.loadPhones();
 
-            // Refresh UI
-            renderPhones();
-            renderPriceTable();
+        // Refresh UI
+        renderPhones();
+        renderPriceTable();
 
-            // CRITICAL FIX: Sync complete reset data to Firebase so mobile gets fresh data
-            if (typeof firebaseSync !== 'undefined' && firebaseSync.syncPriceDatabase) {
-                console.log('🔄 Syncing complete reset data to Firebase...');
+        // CRITICAL FIX: Sync complete reset data to Firebase so mobile gets fresh data
+        if (typeof firebaseSync !== 'undefined' && firebaseSync.syncPriceDatabase) {
+            console.log('🔄 Syncing complete reset data to Firebase...');
 
-                // Get database object from priceDB
-                if (window.priceDB) {
-                    const database = window.priceDB.loadDatabase();
+            // Get database object from priceDB
+            if (window.priceDB) {
+                const database = window.priceDB.loadDatabase();
 
-                    // Call with parameter and error handling
-                    firebaseSync.syncPriceDatabase(database).catch(err => {
-                        console.error('❌ Failed to sync to Firebase:', err);
-                        alert(
-                            '⚠️ SYNC WARNING\n\n' +
-                            'Reset data saved locally but failed to sync to Firebase.\n\n' +
-                            'Mobile devices may not see updates until you retry.\n\n' +
-                            'Error: ' + err.message
-                        );
-                    });
-                } else {
-                    console.error('❌ priceDB not available - cannot sync to Firebase');
-                }
+                // Call with parameter and error handling
+                firebaseSync.syncPriceDatabase(database).catch(err => {
+                    console.error('❌ Failed to sync to Firebase:', err);
+                    alert(
+                        '⚠️ SYNC WARNING\n\n' +
+                        'Reset data saved locally but failed to sync to Firebase.\n\n' +
+                        'Mobile devices may not see updates until you retry.\n\n' +
+                        'Error: ' + err.message
+                    );
+                });
+            } else {
+                console.error('❌ priceDB not available - cannot sync to Firebase');
             }
+        }
 
-            closeImportModal();
+        closeImportModal();
 
-            alert(`✅ COMPLETE RESET & IMPORT SUCCESSFUL!\n\n` +
-                  `🗑️  Cleared all old data\n` +
-                  `➕ Added: ${result.added} phones\n` +
-                  `📦 Total: ${result.total} phones\n\n` +
-                  `✨ USED & NEW prices loaded from Excel.\n` +
-                  `✨ For NEW-only models, USED prices calculated at 65%.`);
+        alert(`✅ COMPLETE RESET & IMPORT SUCCESSFUL!\n\n` +
+              `🗑️  Cleared all old data\n` +
+              `➕ Added: ${result.added} phones\n` +
+              `📦 Total: ${result.total} phones\n\n` +
+              `✨ USED & NEW prices loaded from Excel.\n` +
+              `✨ For NEW-only models, USED prices calculated at 65%.`);
 
-            console.log('✅ Complete reset and import successful');
-        } else {
-            throw new Error('importExactPrices function not found');
-        }
+        console.log('✅ Complete reset and import successful');
 
         importButton.innerHTML = originalText;
         importButton.disabled = false;
@@ -6566,27 +6540,9 @@ function resetToDefaultPrices() {
         localStorage.removeItem('ktmobile_phones_backup');
         console.log('✅ Cleared existing phone data');
 
-        // Load import script and run it
-        const scriptUrl = `import-exact-prices.js?v=${Date.now()}`;
-
-        fetch(scriptUrl)
-            .then(response => {
-                if (!response.ok) {
-                    throw new Error(`Failed to load import script: ${response.status}`);
-                }
-                return response.text();
-            })
-            .then(scriptText => {
-                // Execute the script
-                eval(scriptText);
-
-                if (typeof importExactPrices !== 'function') {
-                    throw new Error('importExactPrices function not found in script');
-                }
-
-                // Run the import
-                const result = importExactPrices();
-
+        // Load the catalog bundles and run the import
+        window.catalogBundles.importAll()
+            .then(result => {
                 // Update timestamp
                 localStorage.setItem('ktmobile_last_update', new Date().toISOString());
 
@@ -79,6 +79,7 @@ function loadProducts() {
                     quantity: quantity,
                     available: quantity > 0,
                     image: phone.image,
+                    placeholder: phone.placeholder || '',
                     colors: phone.colors || [],
                     display: phone.display !== false // Default to true if not set
                 };
@@ -116,6 +117,7 @@ function loadProducts() {
                             quantity: 0,
                             available: false,
                             image: data.image,
+                            placeholder: data.placeholder || '',
                             colors: data.colors || [],
                             display: true
                         };
@@ -168,6 +170,7 @@ function renderProducts() {
                 brand: product.brand,
                 model: product.model,
                 image: product.image,
+                placeholder: product.placeholder,
                 variants: []
             };
         }
@@ -213,7 +216,7 @@ function createProductCard(group, minPrice, totalStock, available) {
     
     card.innerHTML = `
         <div class="product-image-container">
-            <img src="${group.image}" alt="${group.model}" onerror="this.src='data:image/svg+xml,%3Csvg xmlns=\\'http://www.w3.org/2000/svg\\' width=\\'200\\' height=\\'200\\'%3E%3Crect fill=\\'%23f0f0f0\\' width=\\'200\\' height=\\'200\\'/%3E%3Ctext x=\\'50%25\\' y=\\'50%25\\' text-anchor=\\'middle\\' dy=\\'.3em\\' fill=\\'%23999\\' font-family=\\'sans-serif\\' font-size=\\'14\\'%3E${group.model}%3C/text%3E%3C/svg%3E';">
+            <img src="${group.image}" alt="${group.model}" style="${placeholderStyle(group.placeholder)}" onload="this.style.background='';" onerror="this.src='data:image/svg+xml,%3Csvg xmlns=\\'http://www.w3.org/2000/svg\\' width=\\'200\\' height=\\'200\\'%3E%3Crect fill=\\'%23f0f0f0\\' width=\\'200\\' height=\\'200\\'/%3E%3Ctext x=\\'50%25\\' y=\\'50%25\\' text-anchor=\\'middle\\' dy=\\'.3em\\' fill=\\'%23999\\' font-family=\\'sans-serif\\' font-size=\\'14\\'%3E${group.model}%3C/text%3E%3C/svg%3E';">
             ${available ? '<div class="product-badge">In Stock</div>' : '<div class="product-badge" style="background: #EF4444;">Out of Stock</div>'}
         </div>
         <div class="product-info">
@@ -227,6 +230,10 @@ function createProductCard(group, minPrice, totalStock, available) {
             </div>
         </div>
     `;
+
+    if (window.responsiveImages) {
+        window.responsiveImages.apply(card.querySelector('img'), '(max-width: 480px) 100vw, 320px');
+    }
     
     return card;
 }
@@ -299,6 +306,10 @@ function applyFilters() {
     const conditionFilter = document.getElementById('conditionFilter')?.value || '';
     const availabilityFilter = document.getElementById('availabilityFilter')?.value || '';
     const searchInput = document.getElementById('searchInput')?.value.toLowerCase() || '';
+
+    // Models matching the search (names, aliases, storages, colours) from the prebuilt index
+    const indexed = searchInput && window.modelSearch ? window.modelSearch.search(searchInput) : null;
+    const searchHits = indexed ? new Set(indexed.map(hit => `${hit.brand}|${hit.model}`)) : null;
     
     filteredProducts = allProducts.filter(product => {
         // Brand filter
@@ -327,7 +338,9 @@ function applyFilters() {
         // Search filter
         if (searchInput) {
             const searchTerm = searchInput.toLowerCase();
-            if (!product.model.toLowerCase().includes(searchTerm) &&
+            // Substring check covers models added in the admin panel after the index was built
+            if (!(searchHits && searchHits.has(`${product.brand}|${product.model}`)) &&
+                !product.model.toLowerCase().includes(searchTerm) &&
                 !product.brand.toLowerCase().includes(searchTerm)) {
                 return false;
             }
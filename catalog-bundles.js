@@ -0,0 +1,86 @@
+/**
+ * CATALOG BUNDLES
+ * ===============
+ * Loads the built-in price catalog one brand at a time from the chunks
+ * built by `python -m tools.bundles`:
+ *
+ *   data/bundles/index.json              brand -> content-hashed chunk file
+ *   data/bundles/<brand>.<hash>.json     expanded phones of that brand
+ *
+ * Chunk names change whenever their content does, so they are fetched
+ * without cache-busting and stay in the browser cache; only the index is
+ * revalidated. Every fetch is made once per page and shared by callers.
+ *
+ * If the bundles have not been built (local development), importAll()
+ * falls back to importExactPrices() from import-exact-prices.js.
+ */
+
+(function() {
+    const BUNDLE_DIR = 'data/bundles/';
+
+    const requests = {};
+
+    function fetchJson(url, options) {
+        return fetch(url, options).then(response => {
+            if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`);
+            return response.json();
+        });
+    }
+
+    /**
+     * Shares one in-flight request; a failed one is forgotten so it can be retried
+     */
+    function once(key, load) {
+        if (!requests[key]) {
+            requests[key] = load();
+            requests[key].catch(() => { delete requests[key]; });
+        }
+        return requests[key];
+    }
+
+    function loadIndex() {
+        return once('index', () => fetchJson(BUNDLE_DIR + 'index.json', { cache: 'no-cache' }));
+    }
+
+    /**
+     * Phones of one brand ([] if the catalog has none)
+     */
+    function loadBrand(brand) {
+        return once('brand:' + brand, () => loadIndex().then(index => {
+            const entry = index.brands[brand];
+            if (!entry) return [];
+            return fetchJson(BUNDLE_DIR + entry.file).then(chunk => chunk.phones);
+        }));
+    }
+
+    function loadAll() {
+        return loadIndex()
+            .then(index => Promise.all(Object.keys(index.brands).map(loadBrand)))
+            .then(lists => [].concat(...lists));
+    }
+
+    /**
+     * Replaces ktmobile_phones with the full catalog, like importExactPrices()
+     */
+    async function importAll() {
+        let phones;
+        try {
+            phones = await loadAll();
+        } catch (error) {
+            if (typeof importExactPrices !== 'function') throw error;
+            console.warn('⚠️ Catalog bundles unavailable, using import-exact-prices.js:', error.message);
+            return importExactPrices();
+        }
+
+        localStorage.setItem('ktmobile_phones', JSON.stringify(phones));
+        console.log('Imported ' + phones.length + ' phones to localStorage');
+
+        return {
+            added: phones.length,
+            updated: 0,
+            total: phones.length
+        };
+    }
+
+    window.catalogBundles = { loadIndex, loadBrand, loadAll, importAll };
+})();
@@ -112,6 +112,7 @@ class FirebaseSync {
 
                 // Update localStorage
                 localStorage.setItem('ktmobile_condition_modifiers', JSON.stringify(data));
+                window.dispatchEvent(new Event('conditionmodifierschange'));
 
                 // Trigger callback
                 if (callback) callback(data);
@@ -393,6 +394,7 @@ class FirebaseSync {
                 const data = modifiersDoc.data();
                 delete data.lastUpdate;
                 localStorage.setItem('ktmobile_condition_modifiers', JSON.stringify(data));
+                window.dispatchEvent(new Event('conditionmodifierschange'));
                 console.log('✅ Condition modifiers loaded from cloud');
             }
 
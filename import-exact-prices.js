@@ -1,3150 +1,113 @@
 /**
- * Import Exact Prices - Complete Hardcoded Phone Database
+ * Import Exact Prices - GENERATED, DO NOT EDIT
  *
- * Contains ALL phone entries from Excel files with CORRECT prices:
- * - Apple_USED_NEW_FULL_REVIEW.xlsx (32 models, 102 storage entries)
- * - Samsung_USED_NEW_FULL_REVIEW.xlsx (36 models, 74 storage entries)
+ * Built by `python -m tools.prices` from:
+ * - Apple_USED_NEW_FULL_REVIEW.xlsx (e29dc16646b7)
+ * - Samsung_USED_NEW_FULL_REVIEW.xlsx (dbb933775488)
  *
- * Each phone includes:
- * - storagePrices: USED prices from USED_HIGHEST_ALL sheet
- * - newPhonePrices: NEW prices from NEW_HIGHEST_ALL sheet (only for models that exist in that sheet, empty {} otherwise)
- * - buyPrices: Excellent: USED, Good: USED×0.95, Fair: USED×0.85
+ * Phones: Apple: 32, Samsung: 36
+ *
+ * Each record expands to a full phone entry:
+ * - storagePrices: USED prices from the USED_HIGHEST_ALL sheet
+ * - newPhonePrices: NEW prices from the NEW_HIGHEST_ALL sheet ({} if the model isn't listed there)
+ * - buyPrices: Excellent: USED, Good: floor(USED×0.95), Fair: floor(USED×0.85)
+ * - placeholder: 16px WebP preview of the image, shown while it loads
  */
 
-function importExactPrices() {
-    const phones = [
-        // ========== APPLE PHONES ==========
-
-        // Apple iPhone XR
-        {
-            id: 'apple-iphone-xr',
-            brand: 'Apple',
-            model: 'iPhone XR',
-            image: 'images/phones/apple-iphone-xr.jpg',
-            storages: ["64GB", "128GB", "256GB"],
-            basePrice: 50,
-            storagePrices: {"64GB": 50, "128GB": 80, "256GB": 110},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 50,
-                                "good": 47,
-                                "fair": 42
-                },
-                "128GB": {
-                                "excellent": 80,
-                                "good": 76,
-                                "fair": 68
-                },
-                "256GB": {
-                                "excellent": 110,
-                                "good": 104,
-                                "fair": 93
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone XS
-        {
-            id: 'apple-iphone-xs',
-            brand: 'Apple',
-            model: 'iPhone XS',
-            image: 'images/phones/apple-iphone-xs.jpg',
-            storages: ["64GB", "256GB", "512GB"],
-            basePrice: 70,
-            storagePrices: {"64GB": 70, "256GB": 100, "512GB": 130},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 70,
-                                "good": 66,
-                                "fair": 59
-                },
-                "256GB": {
-                                "excellent": 100,
-                                "good": 95,
-                                "fair": 85
-                },
-                "512GB": {
-                                "excellent": 130,
-                                "good": 123,
-                                "fair": 110
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone XS Max
-        {
-            id: 'apple-iphone-xs-max',
-            brand: 'Apple',
-            model: 'iPhone XS Max',
-            image: 'images/phones/apple-iphone-xs-max.jpg',
-            storages: ["64GB", "256GB", "512GB"],
-            basePrice: 120,
-            storagePrices: {"64GB": 120, "256GB": 150, "512GB": 180},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 120,
-                                "good": 114,
-                                "fair": 102
-                },
-                "256GB": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                },
-                "512GB": {
-                                "excellent": 180,
-                                "good": 171,
-                                "fair": 153
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 11
-        {
-            id: 'apple-iphone-11',
-            brand: 'Apple',
-            model: 'iPhone 11',
-            image: 'images/phones/apple-iphone-11.jpg',
-            storages: ["64GB", "128GB", "256GB"],
-            basePrice: 120,
-            storagePrices: {"64GB": 120, "128GB": 150, "256GB": 180},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 120,
-                                "good": 114,
-                                "fair": 102
-                },
-                "128GB": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                },
-                "256GB": {
-                                "excellent": 180,
-                                "good": 171,
-                                "fair": 153
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 11 Pro
-        {
-            id: 'apple-iphone-11-pro',
-            brand: 'Apple',
-            model: 'iPhone 11 Pro',
-            image: 'images/phones/apple-iphone-11-pro.jpg',
-            storages: ["64GB", "256GB", "512GB"],
-            basePrice: 170,
-            storagePrices: {"64GB": 170, "256GB": 210, "512GB": 240},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 170,
-                                "good": 161,
-                                "fair": 144
-                },
-                "256GB": {
-                                "excellent": 210,
-                                "good": 199,
-                                "fair": 178
-                },
-                "512GB": {
-                                "excellent": 240,
-                                "good": 228,
-                                "fair": 204
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 11 Pro Max
-        {
-            id: 'apple-iphone-11-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 11 Pro Max',
-            image: 'images/phones/apple-iphone-11-pro-max.jpg',
-            storages: ["64GB", "256GB", "512GB"],
-            basePrice: 220,
-            storagePrices: {"64GB": 220, "256GB": 250, "512GB": 280},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 220,
-                                "good": 209,
-                                "fair": 187
-                },
-                "256GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                },
-                "512GB": {
-                                "excellent": 280,
-                                "good": 266,
-                                "fair": 238
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone SE (2022)
-        {
-            id: 'apple-iphone-se-2022',
-            brand: 'Apple',
-            model: 'iPhone SE (2022)',
-            image: 'images/phones/apple-iphone-se-2022.jpg',
-            storages: ["64GB", "128GB", "256GB"],
-            basePrice: 120,
-            storagePrices: {"64GB": 120, "128GB": 170, "256GB": 220},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 120,
-                                "good": 114,
-                                "fair": 102
-                },
-                "128GB": {
-                                "excellent": 170,
-                                "good": 161,
-                                "fair": 144
-                },
-                "256GB": {
-                                "excellent": 220,
-                                "good": 209,
-                                "fair": 187
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 12 Mini
-        {
-            id: 'apple-iphone-12-mini',
-            brand: 'Apple',
-            model: 'iPhone 12 Mini',
-            image: 'images/phones/apple-iphone-12-mini.jpg',
-            storages: ["64GB", "128GB", "256GB"],
-            basePrice: 120,
-            storagePrices: {"64GB": 120, "128GB": 150, "256GB": 180},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 120,
-                                "good": 114,
-                                "fair": 102
-                },
-                "128GB": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                },
-                "256GB": {
-                                "excellent": 180,
-                                "good": 171,
-                                "fair": 153
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 12
-        {
-            id: 'apple-iphone-12',
-            brand: 'Apple',
-            model: 'iPhone 12',
-            image: 'images/phones/apple-iphone-12.jpg',
-            storages: ["64GB", "128GB", "256GB"],
-            basePrice: 200,
-            storagePrices: {"64GB": 200, "128GB": 250, "256GB": 300},
-            newPhonePrices: {},
-            buyPrices: {
-                "64GB": {
-                                "excellent": 200,
-                                "good": 190,
-                                "fair": 170
-                },
-                "128GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                },
-                "256GB": {
-                                "excellent": 300,
-                                "good": 285,
-                                "fair": 255
-                }
-},
-            quantities: {
-                "64GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 12 Pro
-        {
-            id: 'apple-iphone-12-pro',
-            brand: 'Apple',
-            model: 'iPhone 12 Pro',
-            image: 'images/phones/apple-iphone-12-pro.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 300,
-            storagePrices: {"128GB": 300, "256GB": 350, "512GB": 400},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 300,
-                                "good": 285,
-                                "fair": 255
-                },
-                "256GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                },
-                "512GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 12 Pro Max
-        {
-            id: 'apple-iphone-12-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 12 Pro Max',
-            image: 'images/phones/apple-iphone-12-pro-max.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 350,
-            storagePrices: {"128GB": 350, "256GB": 400, "512GB": 450},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                },
-                "256GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                },
-                "512GB": {
-                                "excellent": 450,
-                                "good": 427,
-                                "fair": 382
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 13 Mini
-        {
-            id: 'apple-iphone-13-mini',
-            brand: 'Apple',
-            model: 'iPhone 13 Mini',
-            image: 'images/phones/apple-iphone-13-mini.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 250,
-            storagePrices: {"128GB": 250, "256GB": 300, "512GB": 350},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                },
-                "256GB": {
-                                "excellent": 300,
-                                "good": 285,
-                                "fair": 255
-                },
-                "512GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 13
-        {
-            id: 'apple-iphone-13',
-            brand: 'Apple',
-            model: 'iPhone 13',
-            image: 'images/phones/apple-iphone-13.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 300,
-            storagePrices: {"128GB": 300, "256GB": 350, "512GB": 400},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 300,
-                                "good": 285,
-                                "fair": 255
-                },
-                "256GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                },
-                "512GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 13 Pro
-        {
-            id: 'apple-iphone-13-pro',
-            brand: 'Apple',
-            model: 'iPhone 13 Pro',
-            image: 'images/phones/apple-iphone-13-pro.jpg',
-            storages: ["128GB", "256GB", "512GB", "1TB"],
-            basePrice: 380,
-            storagePrices: {"128GB": 380, "256GB": 430, "512GB": 480, "1TB": 530},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 380,
-                                "good": 361,
-                                "fair": 323
-                },
-                "256GB": {
-                                "excellent": 430,
-                                "good": 408,
-                                "fair": 365
-                },
-                "512GB": {
-                                "excellent": 480,
-                                "good": 456,
-                                "fair": 408
-                },
-                "1TB": {
-                                "excellent": 530,
-                                "good": 503,
-                                "fair": 450
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 13 Pro Max
-        {
-            id: 'apple-iphone-13-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 13 Pro Max',
-            image: 'images/phones/apple-iphone-13-pro-max.jpg',
-            storages: ["128GB", "256GB", "512GB", "1TB"],
-            basePrice: 460,
-            storagePrices: {"128GB": 460, "256GB": 510, "512GB": 560, "1TB": 610},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 460,
-                                "good": 437,
-                                "fair": 391
-                },
-                "256GB": {
-                                "excellent": 510,
-                                "good": 484,
-                                "fair": 433
-                },
-                "512GB": {
-                                "excellent": 560,
-                                "good": 532,
-                                "fair": 476
-                },
-                "1TB": {
-                                "excellent": 610,
-                                "good": 579,
-                                "fair": 518
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 14
-        {
-            id: 'apple-iphone-14',
-            brand: 'Apple',
-            model: 'iPhone 14',
-            image: 'images/phones/apple-iphone-14.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 350,
-            storagePrices: {"128GB": 350, "256GB": 400, "512GB": 450},
-            newPhonePrices: {"128GB": 350, "256GB": 400, "512GB": 450},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                },
-                "256GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                },
-                "512GB": {
-                                "excellent": 450,
-                                "good": 427,
-                                "fair": 382
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 14 Plus
-        {
-            id: 'apple-iphone-14-plus',
-            brand: 'Apple',
-            model: 'iPhone 14 Plus',
-            image: 'images/phones/apple-iphone-14-plus.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 420,
-            storagePrices: {"128GB": 420, "256GB": 470, "512GB": 520},
-            newPhonePrices: {"128GB": 420, "256GB": 470, "512GB": 520},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 420,
-                                "good": 399,
-                                "fair": 357
-                },
-                "256GB": {
-                                "excellent": 470,
-                                "good": 446,
-                                "fair": 399
-                },
-                "512GB": {
-                                "excellent": 520,
-                                "good": 494,
-                                "fair": 442
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 14 Pro
-        {
-            id: 'apple-iphone-14-pro',
-            brand: 'Apple',
-            model: 'iPhone 14 Pro',
-            image: 'images/phones/apple-iphone-14-pro.jpg',
-            storages: ["128GB", "256GB", "512GB", "1TB"],
-            basePrice: 500,
-            storagePrices: {"128GB": 500, "256GB": 550, "512GB": 600, "1TB": 650},
-            newPhonePrices: {"128GB": 500, "256GB": 550, "512GB": 600, "1TB": 650},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 500,
-                                "good": 475,
-                                "fair": 425
-                },
-                "256GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                },
-                "512GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                },
-                "1TB": {
-                                "excellent": 650,
-                                "good": 617,
-                                "fair": 552
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 14 Pro Max
-        {
-            id: 'apple-iphone-14-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 14 Pro Max',
-            image: 'images/phones/apple-iphone-14-pro-max.jpg',
-            storages: ["128GB", "256GB", "512GB", "1TB"],
-            basePrice: 600,
-            storagePrices: {"128GB": 600, "256GB": 650, "512GB": 700, "1TB": 750},
-            newPhonePrices: {"128GB": 600, "256GB": 650, "512GB": 700, "1TB": 750},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                },
-                "256GB": {
-                                "excellent": 650,
-                                "good": 617,
-                                "fair": 552
-                },
-                "512GB": {
-                                "excellent": 700,
-                                "good": 665,
-                                "fair": 595
-                },
-                "1TB": {
-                                "excellent": 750,
-                                "good": 712,
-                                "fair": 637
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 15
-        {
-            id: 'apple-iphone-15',
-            brand: 'Apple',
-            model: 'iPhone 15',
-            image: 'images/phones/apple-iphone-15.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 500,
-            storagePrices: {"128GB": 500, "256GB": 550, "512GB": 600},
-            newPhonePrices: {"128GB": 500, "256GB": 550, "512GB": 600},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 500,
-                                "good": 475,
-                                "fair": 425
-                },
-                "256GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                },
-                "512GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 15 Plus
-        {
-            id: 'apple-iphone-15-plus',
-            brand: 'Apple',
-            model: 'iPhone 15 Plus',
-            image: 'images/phones/apple-iphone-15-plus.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 550,
-            storagePrices: {"128GB": 550, "256GB": 600, "512GB": 650},
-            newPhonePrices: {"128GB": 550, "256GB": 600, "512GB": 650},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                },
-                "256GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                },
-                "512GB": {
-                                "excellent": 650,
-                                "good": 617,
-                                "fair": 552
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 15 Pro
-        {
-            id: 'apple-iphone-15-pro',
-            brand: 'Apple',
-            model: 'iPhone 15 Pro',
-            image: 'images/phones/apple-iphone-15-pro.jpg',
-            storages: ["128GB", "256GB", "512GB", "1TB"],
-            basePrice: 600,
-            storagePrices: {"128GB": 600, "256GB": 650, "512GB": 700, "1TB": 750},
-            newPhonePrices: {"128GB": 600, "256GB": 650, "512GB": 700, "1TB": 750},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                },
-                "256GB": {
-                                "excellent": 650,
-                                "good": 617,
-                                "fair": 552
-                },
-                "512GB": {
-                                "excellent": 700,
-                                "good": 665,
-                                "fair": 595
-                },
-                "1TB": {
-                                "excellent": 750,
-                                "good": 712,
-                                "fair": 637
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 15 Pro Max
-        {
-            id: 'apple-iphone-15-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 15 Pro Max',
-            image: 'images/phones/apple-iphone-15-pro-max.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 800,
-            storagePrices: {"256GB": 800, "512GB": 850, "1TB": 900},
-            newPhonePrices: {"256GB": 800, "512GB": 850, "1TB": 900},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 800,
-                                "good": 760,
-                                "fair": 680
-                },
-                "512GB": {
-                                "excellent": 850,
-                                "good": 807,
-                                "fair": 722
-                },
-                "1TB": {
-                                "excellent": 900,
-                                "good": 855,
-                                "fair": 765
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 16
-        {
-            id: 'apple-iphone-16',
-            brand: 'Apple',
-            model: 'iPhone 16',
-            image: 'images/phones/apple-iphone-16.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 670,
-            storagePrices: {"128GB": 670, "256GB": 720, "512GB": 770},
-            newPhonePrices: {"128GB": 920, "256GB": 1020, "512GB": 1070},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 670,
-                                "good": 636,
-                                "fair": 569
-                },
-                "256GB": {
-                                "excellent": 720,
-                                "good": 684,
-                                "fair": 612
-                },
-                "512GB": {
-                                "excellent": 770,
-                                "good": 731,
-                                "fair": 654
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 16 Plus
-        {
-            id: 'apple-iphone-16-plus',
-            brand: 'Apple',
-            model: 'iPhone 16 Plus',
-            image: 'images/phones/apple-iphone-16-plus.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 750,
-            storagePrices: {"128GB": 750, "256GB": 800, "512GB": 850},
-            newPhonePrices: {"128GB": 1050, "256GB": 1150, "512GB": 1200},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 750,
-                                "good": 712,
-                                "fair": 637
-                },
-                "256GB": {
-                                "excellent": 800,
-                                "good": 760,
-                                "fair": 680
-                },
-                "512GB": {
-                                "excellent": 850,
-                                "good": 807,
-                                "fair": 722
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 16 Pro
-        {
-            id: 'apple-iphone-16-pro',
-            brand: 'Apple',
-            model: 'iPhone 16 Pro',
-            image: 'images/phones/apple-iphone-16-pro.jpg',
-            storages: ["128GB", "256GB", "512GB", "1TB"],
-            basePrice: 870,
-            storagePrices: {"128GB": 870, "256GB": 920, "512GB": 970, "1TB": 1020},
-            newPhonePrices: {"128GB": 870, "256GB": 920, "512GB": 970, "1TB": 1020},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 870,
-                                "good": 826,
-                                "fair": 739
-                },
-                "256GB": {
-                                "excellent": 920,
-                                "good": 874,
-                                "fair": 782
-                },
-                "512GB": {
-                                "excellent": 970,
-                                "good": 921,
-                                "fair": 824
-                },
-                "1TB": {
-                                "excellent": 1020,
-                                "good": 969,
-                                "fair": 867
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 16 Pro Max
-        {
-            id: 'apple-iphone-16-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 16 Pro Max',
-            image: 'images/phones/apple-iphone-16-pro-max.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 1020,
-            storagePrices: {"256GB": 1020, "512GB": 1070, "1TB": 1120},
-            newPhonePrices: {"256GB": 1020, "512GB": 1070, "1TB": 1120},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 1020,
-                                "good": 969,
-                                "fair": 867
-                },
-                "512GB": {
-                                "excellent": 1070,
-                                "good": 1016,
-                                "fair": 909
-                },
-                "1TB": {
-                                "excellent": 1120,
-                                "good": 1064,
-                                "fair": 952
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 16E
-        {
-            id: 'apple-iphone-16e',
-            brand: 'Apple',
-            model: 'iPhone 16E',
-            image: 'images/phones/apple-iphone-16e.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 520,
-            storagePrices: {"128GB": 520, "256GB": 620, "512GB": 720},
-            newPhonePrices: {"128GB": 650, "256GB": 770, "512GB": 870},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 520,
-                                "good": 494,
-                                "fair": 442
-                },
-                "256GB": {
-                                "excellent": 620,
-                                "good": 589,
-                                "fair": 527
-                },
-                "512GB": {
-                                "excellent": 720,
-                                "good": 684,
-                                "fair": 612
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [
-                { name: 'Black', hex: '#000000' },
-                { name: 'White', hex: '#FFFFFF' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 17
-        {
-            id: 'apple-iphone-17',
-            brand: 'Apple',
-            model: 'iPhone 17',
-            image: 'images/phones/apple-iphone-17.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 900,
-            storagePrices: {"256GB": 900, "512GB": 1150},
-            newPhonePrices: {"256GB": 1200, "512GB": 1370},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 900,
-                                "good": 855,
-                                "fair": 765
-                },
-                "512GB": {
-                                "excellent": 1150,
-                                "good": 1092,
-                                "fair": 977
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [
-                { name: 'Black', hex: '#000000' },
-                { name: 'White', hex: '#FFFFFF' },
-                { name: 'Mist Blue', hex: '#9BB7D4' },
-                { name: 'Sage', hex: '#B2BEB5' },
-                { name: 'Lavender', hex: '#E6E6FA' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 17 Pro
-        {
-            id: 'apple-iphone-17-pro',
-            brand: 'Apple',
-            model: 'iPhone 17 Pro',
-            image: 'images/phones/apple-iphone-17-pro.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 1350,
-            storagePrices: {"256GB": 1350, "512GB": 1550, "1TB": 1750},
-            newPhonePrices: {"256GB": 1600, "512GB": 1750, "1TB": 1950},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 1350,
-                                "good": 1282,
-                                "fair": 1147
-                },
-                "512GB": {
-                                "excellent": 1550,
-                                "good": 1472,
-                                "fair": 1317
-                },
-                "1TB": {
-                                "excellent": 1750,
-                                "good": 1662,
-                                "fair": 1487
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [
-                { name: 'Cosmic Orange', hex: '#FF6B35' },
-                { name: 'Deep Blue', hex: '#003D82' },
-                { name: 'Silver', hex: '#C0C0C0' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone 17 Pro Max
-        {
-            id: 'apple-iphone-17-pro-max',
-            brand: 'Apple',
-            model: 'iPhone 17 Pro Max',
-            image: 'images/phones/apple-iphone-17-pro-max.jpg',
-            storages: ["256GB", "512GB", "1TB", "2TB"],
-            basePrice: 1520,
-            storagePrices: {"256GB": 1520, "512GB": 1750, "1TB": 1920, "2TB": 2070},
-            newPhonePrices: {"256GB": 1720, "512GB": 2000, "1TB": 2220, "2TB": 2420},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 1520,
-                                "good": 1444,
-                                "fair": 1292
-                },
-                "512GB": {
-                                "excellent": 1750,
-                                "good": 1662,
-                                "fair": 1487
-                },
-                "1TB": {
-                                "excellent": 1920,
-                                "good": 1824,
-                                "fair": 1632
-                },
-                "2TB": {
-                                "excellent": 2070,
-                                "good": 1966,
-                                "fair": 1759
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "2TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [
-                { name: 'Cosmic Orange', hex: '#FF6B35' },
-                { name: 'Deep Blue', hex: '#003D82' },
-                { name: 'Silver', hex: '#C0C0C0' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Apple iPhone Air
-        {
-            id: 'apple-iphone-air',
-            brand: 'Apple',
-            model: 'iPhone Air',
-            image: 'images/phones/apple-iphone-air.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 850,
-            storagePrices: {"256GB": 850, "512GB": 1000, "1TB": 1100},
-            newPhonePrices: {"256GB": 1000, "512GB": 1220, "1TB": 1320},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 850,
-                                "good": 807,
-                                "fair": 722
-                },
-                "512GB": {
-                                "excellent": 1000,
-                                "good": 950,
-                                "fair": 850
-                },
-                "1TB": {
-                                "excellent": 1100,
-                                "good": 1045,
-                                "fair": 935
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [
-                { name: 'Space Black', hex: '#2C2C2E' },
-                { name: 'Cloud White', hex: '#F5F5F7' },
-                { name: 'Light Gold', hex: '#F9D5BB' },
-                { name: 'Sky Blue', hex: '#87CEEB' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // ========== SAMSUNG PHONES ==========
-
-        // Samsung Galaxy Z Fold 3 5G
-        {
-            id: 'samsung-galaxy-z-fold-3-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Fold 3 5G',
-            image: 'images/phones/samsung-galaxy-z-fold-3-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 200,
-            storagePrices: {"256GB": 200, "512GB": 250},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 200,
-                                "good": 190,
-                                "fair": 170
-                },
-                "512GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Fold 4 5G
-        {
-            id: 'samsung-galaxy-z-fold-4-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Fold 4 5G',
-            image: 'images/phones/samsung-galaxy-z-fold-4-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 350,
-            storagePrices: {"256GB": 350, "512GB": 400, "1TB": 500},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                },
-                "512GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                },
-                "1TB": {
-                                "excellent": 500,
-                                "good": 475,
-                                "fair": 425
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
+const PRICE_CATALOG = [
+    {"id":"apple-iphone-xr","brand":"Apple","model":"iPhone XR","storages":["64GB","128GB","256GB"],"used":[50,80,110],"good":[47,76,104],"fair":[42,68,93],"placeholder":"data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADwAQCdASoMABAAA4BaJbACdAED/FfGJAAA/uu74d8kWGUx19JUuiXvl1pRrrb26y1BNnSr7lNIG0Jq9jfo7uiD0/ajz7X/Z0wOqHk6FqPJZ+p4fGaAAA=="},
+    {"id":"apple-iphone-xs","brand":"Apple","model":"iPhone XS","storages":["64GB","256GB","512GB"],"used":[70,100,130],"good":[66,95,123],"fair":[59,85,110],"placeholder":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoMABAAA4BaJbACdADdR55060AA/ty7/PXFc005nPJgu1xVhQWZqB58SlIejm8ZwMhYY2ie7VdvAZ68glSr3AwztaAgTbW/oasN8O1exYVOOP8yjuwccyLbcCkcAA=="},
+    {"id":"apple-iphone-xs-max","brand":"Apple","model":"iPhone XS Max","storages":["64GB","256GB","512GB"],"used":[120,150,180],"good":[114,142,171],"fair":[102,127,153],"placeholder":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAADwAQCdASoMABAAA4BaJbACdAD0kCJF3wAA/thKVab7Tr1lithHanxwB+ox1R6SQRPpZGR5cXoYsBeoTvxG1y4chHFCM8kZ4duZoIekl/KwU0FoKbQf78yZu/XDiAAA"},
+    {"id":"apple-iphone-11","brand":"Apple","model":"iPhone 11","storages":["64GB","128GB","256GB"],"used":[120,150,180],"good":[114,142,171],"fair":[102,127,153],"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAADwAQCdASoMABAAA4BaJbACdAEeksUiAaAA/ud5gOgYOKwtvWNBk7pKf2ZOatB3JCunyIc3O0uBSlqujlIVcdBRMxq6sS+Bc+HEXxHN2r3tPUEA2u4SBuI+R6twy/hVmuTnKGuQnwAAAA=="},
+    {"id":"apple-iphone-11-pro","brand":"Apple","model":"iPhone 11 Pro","storages":["64GB","256GB","512GB"],"used":[170,210,240],"good":[161,199,228],"fair":[144,178,204],"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAQAgCdASoMABAAA4BaJbACdAEfhR7TWFOAAN4vHGXjAjq0KcTIo3QVoDb8HOQdDZhvOJVY6zIfXRpaXTkwnvdqJ6kGtEqTT1GlppvKVLrCk8feiQuENngMdwDO5ugb6v+8K2Zs7oAAAA=="},
+    {"id":"apple-iphone-11-pro-max","brand":"Apple","model":"iPhone 11 Pro Max","storages":["64GB","256GB","512GB"],"used":[220,250,280],"good":[209,237,266],"fair":[187,212,238],"placeholder":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAADwAQCdASoMABAAA4BaJbACdADbg/oX2YAA/mpAhYJZoz+8aDDFnN34IwYNresIwifDKQnjjilWq/5t88BvglUfkuEwkgX8F+rb/5Bm5OSCCNYI/5rjz1piBpgLIgsAAAA="},
+    {"id":"apple-iphone-se-2022","brand":"Apple","model":"iPhone SE (2022)","storages":["64GB","128GB","256GB"],"used":[120,170,220],"good":[114,161,209],"fair":[102,144,187],"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAAAwAgCdASoMABAAA4BaJbACdH8AFcBpYxK5AAD+9AZqtf9JQ9rlcs7+DWQiojOrAArN5en9CWItEzuuT+rbVE6VJRoRnCumf2wkzY+lMPtvpxbeMSs4hD55ZLnXfRjd/bUD67Pb+sAAAA=="},
+    {"id":"apple-iphone-12-mini","brand":"Apple","model":"iPhone 12 Mini","storages":["64GB","128GB","256GB"],"used":[120,150,180],"good":[114,142,171],"fair":[102,127,153],"placeholder":"data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAQCdASoMABAAA4BaJbACdADW02EIAAD+6HyNdpzeab8wsP7HYqzH2GCeUxBKZG9QrYwb8aAQ4Ydhv8AcLFIx5EGx1YFhs3sK+Jg1RsDgmTkTMnwAAA=="},
+    {"id":"apple-iphone-12","brand":"Apple","model":"iPhone 12","storages":["64GB","128GB","256GB"],"used":[200,250,300],"good":[190,237,285],"fair":[170,212,255],"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAADwAQCdASoMABAAA4BaJbACdAELXlsCXagA/sH4j2s3qU4zpEFbGFcFqdJcFNYFQ5cYO/Tnq174KRWCdc4t+2CeS9wcV8Pv8Qqi4W1/QKu0o9nuny0JsoFNh4g7eEmtdo8Xd4N5p4Z8AA=="},
+    {"id":"apple-iphone-12-pro","brand":"Apple","model":"iPhone 12 Pro","storages":["128GB","256GB","512GB"],"used":[300,350,400],"good":[285,332,380],"fair":[255,297,340],"placeholder":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoMABAAA4BaJbAC7ADbUcmco4AAAP55MPlxu9rBsb8kwT3aqapj17q4PlULTkbq2pRUdChJyMKNK5OwGw5dK6ylqFqikkV8TCGSSWsMWuiru5AAAAA="},
+    {"id":"apple-iphone-12-pro-max","brand":"Apple","model":"iPhone 12 Pro Max","storages":["128GB","256GB","512GB"],"used":[350,400,450],"good":[332,380,427],"fair":[297,340,382],"placeholder":"data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAACwAQCdASoMABAAA4BaJbAC7ADW0YUAAP55MPlLTNsdK9/U/VOzoyPR0RmVvvlIokN/x35t1JTjwZNFxrDUK8r/cWsl+f0qqG58Yaq/C63/nwmTkTMnwAAA"},
+    {"id":"apple-iphone-13-mini","brand":"Apple","model":"iPhone 13 Mini","storages":["128GB","256GB","512GB"],"used":[250,300,350],"good":[237,285,332],"fair":[212,255,297],"placeholder":"data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAQAgCdASoMABAAA4BaJbACdAEDeZCPo2+AAP7gq+WCBkIYlX/z9g1Jmjxg3D3jg1i/btzqyAOfYmwGYBqcgqRHKygrQBF92KUv69VCgN1UYsuU20KgggAA"},
+    {"id":"apple-iphone-13","brand":"Apple","model":"iPhone 13","storages":["128GB","256GB","512GB"],"used":[300,350,400],"good":[285,332,380],"fair":[255,297,340],"placeholder":"data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADwAQCdASoMABAAA4BaJbACdLoAAm1uvEgA+70pc0L85UPzXro+fkhAYV/jGL+PrBpDO6ndM1XLwgTzDXf5uv+Oofz7xaVvwEO3Rd/cJFCGZWAWSkVD/NMCro/RCia1bKfkLnhAAAA="},
+    {"id":"apple-iphone-13-pro","brand":"Apple","model":"iPhone 13 Pro","storages":["128GB","256GB","512GB","1TB"],"used":[380,430,480,530],"good":[361,408,456,503],"fair":[323,365,408,450],"placeholder":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAADwAQCdASoMABAAA4BaJbACdADcMSscaVAA/qochaCratNlCizkfK+DFOEJ+0KM8KF69oXC0ftJJ+Zga4H0Ki8ZZPzesSV9a+axh/jIBb+KRfqK6ySqzLEXgAA="},
+    {"id":"apple-iphone-13-pro-max","brand":"Apple","model":"iPhone 13 Pro Max","storages":["128GB","256GB","512GB","1TB"],"used":[460,510,560,610],"good":[437,484,532,579],"fair":[391,433,476,518],"placeholder":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoMABAAA4BaJbACdAEYEVK/Rm8YsAD+BeKf7e35+LWmqglm3Ip/ExSG7uJdTY1tMiZXE7D62H0N5cJIXs27fhHagRhMMK5xv9fa9q6q3vaRCeNczSJwoAAA"},
+    {"id":"apple-iphone-14","brand":"Apple","model":"iPhone 14","storages":["128GB","256GB","512GB"],"used":[350,400,450],"good":[332,380,427],"fair":[297,340,382],"new":{"128GB":350,"256GB":400,"512GB":450},"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABQAgCdASoMABAAA4BaJbACdAYv1zgbD42dY5gA/u8rEVDn6jnAG9+KgFiirupOgEW2N3mdCMswNJrX5G888CDiK69Sqg7rsoj3ORJuva2pRPoOmqwJNN+VZSBgHM6NcNafWKyoIAAAAA=="},
+    {"id":"apple-iphone-14-plus","brand":"Apple","model":"iPhone 14 Plus","storages":["128GB","256GB","512GB"],"used":[420,470,520],"good":[399,446,494],"fair":[357,399,442],"new":{"128GB":420,"256GB":470,"512GB":520},"placeholder":"data:image/webp;base64,UklGRnoAAABXRUJQVlA4IG4AAAAQAgCdASoMABAAA4BaJbACdADW3wdDif/AAP7VxtZVeMdGTtV/s5q4+zUSipfVAoLw9ThEzt0MCgvIzkwAeKgXhEi/7sx+elZT7YKootaUnKlKgUWMxhhKybwfhZ0pgUFjvBhpJog+DU0PKWAAAA=="},
+    {"id":"apple-iphone-14-pro","brand":"Apple","model":"iPhone 14 Pro","storages":["128GB","256GB","512GB","1TB"],"used":[500,550,600,650],"good":[475,522,570,617],"fair":[425,467,510,552],"new":{"128GB":500,"256GB":550,"512GB":600,"1TB":650},"placeholder":"data:image/webp;base64,UklGRnYAAABXRUJQVlA4IGoAAAAwAgCdASoMABAAA4BaJbACdEf/gcX8AiWlQAD98HOtPK+jlKsYVjOkUwGQEAPPugM2CWF6OMM7zFqDIsUbCfFOaK80iGGeHtkTzRa1TsVG3gtJwwbZzoLL/8J4tvwmmOitZCaH2QNCAAAA"},
+    {"id":"apple-iphone-14-pro-max","brand":"Apple","model":"iPhone 14 Pro Max","storages":["128GB","256GB","512GB","1TB"],"used":[600,650,700,750],"good":[570,617,665,712],"fair":[510,552,595,637],"new":{"128GB":600,"256GB":650,"512GB":700,"1TB":750},"placeholder":"data:image/webp;base64,UklGRmwAAABXRUJQVlA4IGAAAAAwAgCdASoMABAAA4BaJagCdADcn9Y3amrDwAD+z4CgMAy5WOOnWzBcPdhcyRTrM/QsEs6H2QqJvECSYPoeoRUogdHox08vvmUB9NzEx8YUy/UGHWixuuS/qC2hUY6wAAA="},
+    {"id":"apple-iphone-15","brand":"Apple","model":"iPhone 15","storages":["128GB","256GB","512GB"],"used":[500,550,600],"good":[475,522,570],"fair":[425,467,510],"new":{"128GB":500,"256GB":550,"512GB":600},"placeholder":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoMABAAA4BaJaACdADcO/66kd6AAP60EON5VqNpu6fSNBFagm2FXCMPOb7NXs1G5fzGni3uAzf2CRJWfSMBD6C8I/qWKtcVVGMC1xgA"},
+    {"id":"apple-iphone-15-plus","brand":"Apple","model":"iPhone 15 Plus","storages":["128GB","256GB","512GB"],"used":[550,600,650],"good":[522,570,617],"fair":[467,510,552],"new":{"128GB":550,"256GB":600,"512GB":650},"placeholder":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADQAQCdASoMABAAA4BaJaACdADcEPZNAAD+0+uytXEZctbRLzgzbG4hpKm3/PGzPTelQy9lIxvT5PA/wC88yfIodvRvx4rbuyE6Bzo4Dw0g7zKMgAA="},
+    {"id":"apple-iphone-15-pro","brand":"Apple","model":"iPhone 15 Pro","storages":["128GB","256GB","512GB","1TB"],"used":[600,650,700,750],"good":[570,617,665,712],"fair":[510,552,595,637],"new":{"128GB":600,"256GB":650,"512GB":700,"1TB":750},"placeholder":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAwAgCdASoMABAAA4BaJZQCdAYuRK/b+WWFAAD+3eGmCGEnJWciLpAYGzU97kud0gGEys2s+j9h16RTolqEa8MR9HWms3gL704OcN6hVXvXgs8tGf4qTsXMB6VXzgAA"},
+    {"id":"apple-iphone-15-pro-max","brand":"Apple","model":"iPhone 15 Pro Max","storages":["256GB","512GB","1TB"],"used":[800,850,900],"good":[760,807,855],"fair":[680,722,765],"new":{"256GB":800,"512GB":850,"1TB":900},"placeholder":"data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAAAQAgCdASoMABAAA4BaJZQCdAEAHg8J6kwAAOI2p/BK9fWQ9/3rhA4wYHHBaJj8AcD9v5ha6sW3pNAkPIqw2v6NCPlPj9ytx5mLna3XbsrhjyDRavTQtAAA"},
+    {"id":"apple-iphone-16","brand":"Apple","model":"iPhone 16","storages":["128GB","256GB","512GB"],"used":[670,720,770],"good":[636,684,731],"fair":[569,612,654],"new":{"128GB":920,"256GB":1020,"512GB":1070},"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwAgCdASoMABAAA4BaJbACdAYv1mvxv6DZCcwAAPa5dOfc8F9QHkuG32EviF1aWu5rgaFvc0jHsNojx75dCNP+dWnLS83Z2eZEtpEZ0GpB7auVQRQH5W9P1LZ/yJnsf7egxe0zfTl4AA=="},
+    {"id":"apple-iphone-16-plus","brand":"Apple","model":"iPhone 16 Plus","storages":["128GB","256GB","512GB"],"used":[750,800,850],"good":[712,760,807],"fair":[637,680,722],"new":{"128GB":1050,"256GB":1150,"512GB":1200},"placeholder":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAAAwAgCdASoMABAAA4BaJbACdAEbODE8kzwUwAD8/30ZrzceDPBuMbupsIZyH1khisXxLcEPvwdNJQ7QZs2xFcqljDlhGSHz9prQa/ulf6zFPRmCTdcJmV/IyB8tn1J7834AAA=="},
+    {"id":"apple-iphone-16-pro","brand":"Apple","model":"iPhone 16 Pro","storages":["128GB","256GB","512GB","1TB"],"used":[870,920,970,1020],"good":[826,874,921,969],"fair":[739,782,824,867],"new":{"128GB":870,"256GB":920,"512GB":970,"1TB":1020},"placeholder":"data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAADQAQCdASoMABAAA4BaJQAAS1J2mME3CAD+lQh+XvY8GXGa7tdKIaEAmtrvHPnPlAK5logDj47V2nmetwqnTiVS+KZl/4SD1DB/omdZBVpC8zxvfdCAAA=="},
+    {"id":"apple-iphone-16-pro-max","brand":"Apple","model":"iPhone 16 Pro Max","storages":["256GB","512GB","1TB"],"used":[1020,1070,1120],"good":[969,1016,1064],"fair":[867,909,952],"new":{"256GB":1020,"512GB":1070,"1TB":1120},"placeholder":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAACwAQCdASoMABAAA4BaJQAASwgGgfMAAP7lNvGSK2Kxv3AomsjMPx+kcLNtly7GLQZ99zM3ILzw0VvKT8n2ecTT+qTuM2IqIrCCHcMYwyKkAQAA"},
+    {"id":"apple-iphone-16e","brand":"Apple","model":"iPhone 16E","storages":["128GB","256GB","512GB"],"used":[520,620,720],"good":[494,589,684],"fair":[442,527,612],"new":{"128GB":650,"256GB":770,"512GB":870},"colors":[{"name":"Black","hex":"#000000"},{"name":"White","hex":"#FFFFFF"}],"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABwAgCdASoMABAAA4BaJbACdAYv1mvxv6DZCcwAAPa5dOfc8F9QHkuG32EviF1aWu5rgaFvc0jHsNojx75dCNP+dWnLS83Z2eZEtpEZ0GpB7auVQRQH5W9P1LZ/yJnsf7egxe0zfTl4AA=="},
+    {"id":"apple-iphone-17","brand":"Apple","model":"iPhone 17","storages":["256GB","512GB"],"used":[900,1150],"good":[855,1092],"fair":[765,977],"new":{"256GB":1200,"512GB":1370},"colors":[{"name":"Black","hex":"#000000"},{"name":"White","hex":"#FFFFFF"},{"name":"Mist Blue","hex":"#9BB7D4"},{"name":"Sage","hex":"#B2BEB5"},{"name":"Lavender","hex":"#E6E6FA"}],"placeholder":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAADwAQCdASoMABAAA4BaJQBdgCB/4FqRTsAA/pvaH5+V0bKbUq/o/G4zvy8LsPumYOohXCPIs8rpvJ6IwW/kCi937krpVfTmJi+QujNutwuDekrSAAA="},
+    {"id":"apple-iphone-17-pro","brand":"Apple","model":"iPhone 17 Pro","storages":["256GB","512GB","1TB"],"used":[1350,1550,1750],"good":[1282,1472,1662],"fair":[1147,1317,1487],"new":{"256GB":1600,"512GB":1750,"1TB":1950},"colors":[{"name":"Cosmic Orange","hex":"#FF6B35"},{"name":"Deep Blue","hex":"#003D82"},{"name":"Silver","hex":"#C0C0C0"}],"placeholder":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAQAgCdASoMABAAA4BaJYwCdAEQFJxy8SEAAP7RdsLhOZyshO37X/T8z9Hd3a8wjayZKkj5g3btGy4qO2M7DFyS32y1Vp8tc03uzruyJ0gAAA=="},
+    {"id":"apple-iphone-17-pro-max","brand":"Apple","model":"iPhone 17 Pro Max","storages":["256GB","512GB","1TB","2TB"],"used":[1520,1750,1920,2070],"good":[1444,1662,1824,1966],"fair":[1292,1487,1632,1759],"new":{"256GB":1720,"512GB":2000,"1TB":2220,"2TB":2420},"colors":[{"name":"Cosmic Orange","hex":"#FF6B35"},{"name":"Deep Blue","hex":"#003D82"},{"name":"Silver","hex":"#C0C0C0"}],"placeholder":"data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADwAQCdASoMABAAA4BaJbACdAEU8pMmMwAA4DQ3sJMSt2U/b81oCTGeHsjbVJFWvsSGiagHzz2aIfNvhakWIilwOOPqyh8I7NwUDrYTTiNHANV7i9PLbhhzrf8neIay6+14VMjAAAA="},
+    {"id":"apple-iphone-air","brand":"Apple","model":"iPhone Air","storages":["256GB","512GB","1TB"],"used":[850,1000,1100],"good":[807,950,1045],"fair":[722,850,935],"new":{"256GB":1000,"512GB":1220,"1TB":1320},"colors":[{"name":"Space Black","hex":"#2C2C2E"},{"name":"Cloud White","hex":"#F5F5F7"},{"name":"Light Gold","hex":"#F9D5BB"},{"name":"Sky Blue","hex":"#87CEEB"}],"placeholder":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAAAQAgCdASoMABAAA4BaJaACdADcO/66kd6AAP60EON5VqNpu6fSNBFagm2FXCMPOb7NXs1G5fzGni3uAzf2CRJWfSMBD6C8I/qWKtcVVGMC1xgA"},
+    {"id":"samsung-galaxy-z-fold-3-5g","brand":"Samsung","model":"Galaxy Z Fold 3 5G","storages":["256GB","512GB"],"used":[200,250],"good":[190,237],"fair":[170,212],"placeholder":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQAgCdASoMABAAA4BaJZwAD49tZEb2PMoAAP7rpkwF5GSJjyznbny7On15S/Z0O3QHAkse2TiOZgN8OXQpyb0t9oeq6NHcsWQ67X0DxThOSF7Ge7RIGRqgkIAATAAA"},
+    {"id":"samsung-galaxy-z-fold-4-5g","brand":"Samsung","model":"Galaxy Z Fold 4 5G","storages":["256GB","512GB","1TB"],"used":[350,400,500],"good":[332,380,475],"fair":[297,340,425],"placeholder":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADwAQCdASoMABAAA4BaJQBOgBud7KBJ9IQAy0ME0V9F/Jv0z+cYuLfXXxtPNOrHU90B9EPvFbaQ1Y+RZUCcCVvJVZva9Wd5zsYU9QkMntzaU6S9joAIE/j2O39opFACp2wAAA=="},
+    {"id":"samsung-galaxy-z-fold-5-5g","brand":"Samsung","model":"Galaxy Z Fold 5 5G","storages":["256GB","512GB","1TB"],"used":[550,600,650],"good":[522,570,617],"fair":[467,510,552],"placeholder":"data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoMABAAA4BaJYwCdAEDfbAsiDGAAP7vqiolklPPQ5giwVcl5E1/FqE6bgitw1e8ysje1vKckk1bKqx2M19stxtnsHVrWJAA"},
+    {"id":"samsung-galaxy-z-fold-6-5g","brand":"Samsung","model":"Galaxy Z Fold 6 5G","storages":["256GB","512GB","1TB"],"used":[770,870,970],"good":[731,826,921],"fair":[654,739,824],"placeholder":"data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoMABAAA4BaJZwAAl2Y+FmxAAD+t2ZwWdeAVAl8Ewf5FDU1VsR8POLHoeeOC6zB5jj3cLIdwZ67J+WEPq5VYx4rLz++1UHXAAA="},
+    {"id":"samsung-galaxy-z-fold-7-5g","brand":"Samsung","model":"Galaxy Z Fold 7 5G","storages":["256GB","512GB","1TB"],"used":[1470,1520,1620],"good":[1396,1444,1539],"fair":[1249,1292,1377],"new":{"256GB":1630,"512GB":1780,"1TB":1860},"placeholder":"data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADQAQCdASoMABAAA4BaJZwAAl2Y+FmxAAD+t2ZwWdeAVAl8Ewf5FDU1VsR8POLHoeeOC6zB5jj3cLIdwZ67J+WEPq5VYx4rLz++1UHXAAA="},
+    {"id":"samsung-galaxy-z-flip-4-5g","brand":"Samsung","model":"Galaxy Z Flip 4 5G","storages":["128GB","256GB","512GB"],"used":[100,150,200],"good":[95,142,190],"fair":[85,127,170],"placeholder":"data:image/webp;base64,UklGRngAAABXRUJQVlA4IGwAAAAwAgCdASoMABAAA4BaJZQAD5Gu1C3y8C8zuAD+4fW86AZZMNITnISfbU/NlW534eg9yELKiPSMEFPcbtHjr/mkWl/MaAbi+3Cz5kTPs01yUg7w7dKn9MzAr7bXyYYzMrWdD5mBjP0u3aRwgAA="},
+    {"id":"samsung-galaxy-z-flip-5-5g","brand":"Samsung","model":"Galaxy Z Flip 5 5G","storages":["256GB","512GB"],"used":[250,300],"good":[237,285],"fair":[212,255],"placeholder":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAADwAQCdASoMABAAA4BaJZQAAxf0TaewGQAA/tIJezBobivShXPt9PCBgu2rlAif6NtVGeU2ykInfCLzKgWbAYHkII+JbYgaVeEk+fYhnVq94vM/eCpM5WoqVzzAoCAA"},
+    {"id":"samsung-galaxy-z-flip-6-5g","brand":"Samsung","model":"Galaxy Z Flip 6 5G","storages":["256GB","512GB"],"used":[400,450],"good":[380,427],"fair":[340,382],"placeholder":"data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADQAQCdASoMABAAA4BaJbACdADzfiNzAAD++LnDbwqa/lAD3TlnPi8+iAzCdzvSHzmz0hFnAPSkbVGTDxPmENrtVE6P2LqZUTIKNo1pnSb+Z9NDwgMeRN069VHIIZQXv74ydzAAAAA="},
+    {"id":"samsung-galaxy-z-flip-7-5g","brand":"Samsung","model":"Galaxy Z Flip 7 5G","storages":["256GB","512GB"],"used":[670,770],"good":[636,731],"fair":[569,654],"new":{"256GB":900,"512GB":950},"placeholder":"data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADQAQCdASoMABAAA4BaJbACdADzfiNzAAD++LnDbwqa/lAD3TlnPi8+iAzCdzvSHzmz0hFnAPSkbVGTDxPmENrtVE6P2LqZUTIKNo1pnSb+Z9NDwgMeRN069VHIIZQXv74ydzAAAAA="},
+    {"id":"samsung-galaxy-z-flip-7-fe-5g","brand":"Samsung","model":"Galaxy Z Flip 7 FE 5G","storages":["128GB","256GB"],"used":[470,570],"good":[446,541],"fair":[399,484],"new":{"128GB":620,"256GB":770},"placeholder":"data:image/webp;base64,UklGRnIAAABXRUJQVlA4IGYAAADQAQCdASoMABAAA4BaJbACdADzfiNzAAD++LnDbwqa/lAD3TlnPi8+iAzCdzvSHzmz0hFnAPSkbVGTDxPmENrtVE6P2LqZUTIKNo1pnSb+Z9NDwgMeRN069VHIIZQXv74ydzAAAAA="},
+    {"id":"samsung-galaxy-s21-5g","brand":"Samsung","model":"Galaxy S21 5G","storages":["Base"],"used":[120],"good":[114],"fair":[102],"placeholder":"data:image/webp;base64,UklGRl4AAABXRUJQVlA4IFIAAADwAQCdASoQAA4AA4BaJaACdAEUINb8cwAA/u4OCnkwZ57ATX2t1JFDMLQ5miEPeMWxOG0fYLNcLalEtHOvYEOOrVWHizk4lorvbpdcRLV6AAAA"},
+    {"id":"samsung-galaxy-s21-plus-5g","brand":"Samsung","model":"Galaxy S21+ 5G","storages":["Base"],"used":[150],"good":[142],"fair":[127],"placeholder":"data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAAAwAgCdASoQAA4AA4BaJQBdgCF5+KH3d/taAAD+62oiCOA6Q1Fe3bC+v2kZBhuuq4wO736YjlGyuIKoOcJIU2z7EItS3YVpIyW74IAfwAA="},
+    {"id":"samsung-galaxy-s21-ultra-5g","brand":"Samsung","model":"Galaxy S21 Ultra 5G","storages":["256GB","512GB"],"used":[200,250],"good":[190,237],"fair":[170,212],"placeholder":"data:image/webp;base64,UklGRnQAAABXRUJQVlA4IGgAAABQAgCdASoMABAAA4BaJagCdH8AGOqzbWC1QwAA/rAMMWiOIYvTqKrE7us1+MvMkRnaQMMFnoRdX7184XPbTPHJ2Kf080Jsc11vEdkss9nU/JlemlVq65CGfA2rjW82jTtY5OKm+YAAAA=="},
+    {"id":"samsung-galaxy-s21-fe-5g","brand":"Samsung","model":"Galaxy S21 FE 5G","storages":["256GB"],"used":[100],"good":[95],"fair":[85],"placeholder":"data:image/webp;base64,UklGRloAAABXRUJQVlA4IE4AAADwAQCdASoMABAAA4BaJbACdADdoXsEJAAA/pgg7D45421AahHYYwOgA7h9+3z9BnPhYWtv4LzoZN63iFKUWxNzjeAHFujqOpdtOKIAAAA="},
+    {"id":"samsung-galaxy-s22-5g","brand":"Samsung","model":"Galaxy S22 5G","storages":["128GB","256GB"],"used":[150,200],"good":[142,190],"fair":[127,170],"placeholder":"data:image/webp;base64,UklGRlgAAABXRUJQVlA4IEwAAAAQAgCdASoMABAAA4BaJbACw7EUi8KfIjS4AP7uZ/Ov7U0xAsnjPZUoitS/djYehFk9rzkg9wWX6bK15LR0jqGJ2JJkOP64A9jWOcAA"},
+    {"id":"samsung-galaxy-s22-plus-5g","brand":"Samsung","model":"Galaxy S22+ 5G","storages":["128GB","256GB"],"used":[200,250],"good":[190,237],"fair":[170,212],"placeholder":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAACwAQCdASoMABAAA4BaJZgAAlltatOgAP6CnIkruY96JgKrUSxjjnxVmn0DEgbvWqJ+EnpHQXkzTbG9doQuEFHK78Ms6z4XC+54yKhSG2gAAA=="},
+    {"id":"samsung-galaxy-s22-ultra-5g","brand":"Samsung","model":"Galaxy S22 Ultra 5G","storages":["256GB","512GB"],"used":[350,400],"good":[332,380],"fair":[297,340],"placeholder":"data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAAAQAgCdASoMABAAA4BaJZAC7AED4/4aC+AAAOJ+9DukHrfcO17hQ+isuTlqSjeUQmXYJFXy/H0Yy7OeevQU1RwYrJtouVnpjw67oH2RViwKhuQEfnmAAA=="},
+    {"id":"samsung-galaxy-s23-5g","brand":"Samsung","model":"Galaxy S23 5G","storages":["128GB","256GB"],"used":[300,350],"good":[285,332],"fair":[255,297],"placeholder":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoMABAAA4BaJQBOgCBU2+y9LgYAAP7opOKeXjWDW4Pe0OlBPwqhjhR6DVkg1WXRnzt8A3kPa8ckoe/QGdA06sorUepv1kKFWvVCZOr8/0/IhTyYAAA="},
+    {"id":"samsung-galaxy-s23-plus-5g","brand":"Samsung","model":"Galaxy S23+ 5G","storages":["256GB","512GB"],"used":[400,450],"good":[380,427],"fair":[340,382],"placeholder":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADQAQCdASoMABAAA4BaJaACdADZW1AtAAD+7mdbjt1Swu98+cBn6Y9CfgdlJav51rsILRUTQQoQevyeXfRggQFyW/Dg8krRIxqNLUjTDDLMRXxH1ScGFiraUFoIKJnu2CAAAA=="},
+    {"id":"samsung-galaxy-s23-ultra-5g","brand":"Samsung","model":"Galaxy S23 Ultra 5G","storages":["256GB","512GB","1TB"],"used":[500,550,600],"good":[475,522,570],"fair":[425,467,510],"placeholder":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAwAgCdASoMABAAA4BaJYgCw7D5/c/pNvwmgADifjSi8ObHdCMoLamiQYLhpqmnWtrqyBgRqkFaefNlTTn9k5r4l17+IKV12pMvBEzA+yAAAA=="},
+    {"id":"samsung-galaxy-s23-fe-5g","brand":"Samsung","model":"Galaxy S23 FE 5G","storages":["256GB"],"used":[220],"good":[209],"fair":[187],"placeholder":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAwAgCdASoMABAAA4BaJZACw7DdHid+NQniAAD9OzRu82fclG0xzi+UIBHTygjLSriALqmXXh9+MQeIQt9FKkNLp4zrhW/pGqrlYwaikW1sXTUYAAA="},
+    {"id":"samsung-galaxy-s24-5g","brand":"Samsung","model":"Galaxy S24 5G","storages":["256GB","512GB"],"used":[500,550],"good":[475,522],"fair":[425,467],"placeholder":"data:image/webp;base64,UklGRkoAAABXRUJQVlA4ID4AAADwAQCdASoMABAAA4BaJZQAAlywr4bjzAAA/h3kRuFL8su7orhJ+uoVZQjThSQICiuFKjfxh1IcPTs64IgAAA=="},
+    {"id":"samsung-galaxy-s24-plus-5g","brand":"Samsung","model":"Galaxy S24+ 5G","storages":["256GB","512GB"],"used":[570,620],"good":[541,589],"fair":[484,527],"placeholder":"data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoMABAAA4BaJQAAWJD+gqGvsADNmNMFd+Sev1hSWKoHP4Axb9j9wo2cbykm4LnSP3AcRMCEYxlASsu1/TqHArgAAAA="},
+    {"id":"samsung-galaxy-s24-ultra-5g","brand":"Samsung","model":"Galaxy S24 Ultra 5G","storages":["256GB","512GB","1TB"],"used":[700,750,850],"good":[665,712,807],"fair":[595,637,722],"placeholder":"data:image/webp;base64,UklGRmAAAABXRUJQVlA4IFQAAAAQAgCdASoMABAAA4BaJZACdAEX6uyIsAgAAP7IolqFgryqmvsOMup4VIdNf+xDCDKwahxe+ORBxok43R3hv6elsv/e8ysl8ZVE9aEzcYTVeuP5wAA="},
+    {"id":"samsung-galaxy-s24-fe-5g","brand":"Samsung","model":"Galaxy S24 FE 5G","storages":["256GB","512GB"],"used":[370,420],"good":[351,399],"fair":[314,357],"placeholder":"data:image/webp;base64,UklGRmIAAABXRUJQVlA4IFYAAABQAgCdASoQAA4AA4BaJbACdAEVz2wVXsVWFgAA/t/TB4uGjsEysdXIaodYnxAwP3EHgufDQWo3BRGcv2BepvM8UVxS7T8rUykJM0LwgXhIHos3ugAAAA=="},
+    {"id":"samsung-galaxy-s25-5g","brand":"Samsung","model":"Galaxy S25 5G","storages":["128GB","256GB","512GB"],"used":[550,600,700],"good":[522,570,665],"fair":[467,510,595],"new":{"128GB":800,"256GB":850,"512GB":950},"colors":[{"name":"Navy","hex":"#000080"},{"name":"Icyblue","hex":"#B0E0E6"},{"name":"Mint","hex":"#98FB98"},{"name":"Silver Shadow","hex":"#C0C0C0"},{"name":"Blueblack","hex":"#1C2841"},{"name":"Coralred","hex":"#FF6F61"},{"name":"Pinkgold","hex":"#E6C2B8"}],"placeholder":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoMABAAA4BaJQBOgCBU2+y9LgYAAP7opOKeXjWDW4Pe0OlBPwqhjhR6DVkg1WXRnzt8A3kPa8ckoe/QGdA06sorUepv1kKFWvVCZOr8/0/IhTyYAAA="},
+    {"id":"samsung-galaxy-s25-plus-5g","brand":"Samsung","model":"Galaxy S25+ 5G","storages":["256GB","512GB"],"used":[750,850],"good":[712,807],"fair":[637,722],"new":{"256GB":920,"512GB":1120},"colors":[{"name":"Navy","hex":"#000080"},{"name":"Icyblue","hex":"#B0E0E6"},{"name":"Mint","hex":"#98FB98"},{"name":"Silver Shadow","hex":"#C0C0C0"},{"name":"Blueblack","hex":"#1C2841"},{"name":"Coralred","hex":"#FF6F61"},{"name":"Pinkgold","hex":"#E6C2B8"}],"placeholder":"data:image/webp;base64,UklGRm4AAABXRUJQVlA4IGIAAADQAQCdASoMABAAA4BaJaACdADZW1AtAAD+7mdbjt1Swu98+cBn6Y9CfgdlJav51rsILRUTQQoQevyeXfRggQFyW/Dg8krRIxqNLUjTDDLMRXxH1ScGFiraUFoIKJnu2CAAAA=="},
+    {"id":"samsung-galaxy-s25-ultra-5g","brand":"Samsung","model":"Galaxy S25 Ultra 5G","storages":["256GB","512GB","1TB"],"used":[850,1050,1100],"good":[807,997,1045],"fair":[722,892,935],"new":{"256GB":1020,"512GB":1200,"1TB":1350},"colors":[{"name":"Titanium Silverblue","hex":"#8B9DC3"},{"name":"Titanium Gray","hex":"#8E8E93"},{"name":"Titanium Black","hex":"#1C1C1C"},{"name":"Titanium Whitesilver","hex":"#E8E8E8"},{"name":"Titanium Jetblack","hex":"#000000"},{"name":"Titanium Jadegreen","hex":"#00A878"},{"name":"Titanium Pinkgold","hex":"#E6C2B8"}],"placeholder":"data:image/webp;base64,UklGRlwAAABXRUJQVlA4IFAAAAAwAgCdASoMABAAA4BaJYgCw7D5/c/pNvwmgADifjSi8ObHdCMoLamiQYLhpqmnWtrqyBgRqkFaefNlTTn9k5r4l17+IKV12pMvBEzA+yAAAA=="},
+    {"id":"samsung-galaxy-s25-edge-5g","brand":"Samsung","model":"Galaxy S25 Edge 5G","storages":["256GB","512GB"],"used":[570,670],"good":[541,636],"fair":[484,569],"new":{"256GB":770,"512GB":870},"colors":[{"name":"Navy","hex":"#000080"},{"name":"Icyblue","hex":"#B0E0E6"},{"name":"Mint","hex":"#98FB98"},{"name":"Silver Shadow","hex":"#C0C0C0"},{"name":"Blueblack","hex":"#1C2841"},{"name":"Coralred","hex":"#FF6F61"},{"name":"Pinkgold","hex":"#E6C2B8"}],"placeholder":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoMABAAA4BaJQBOgCBU2+y9LgYAAP7opOKeXjWDW4Pe0OlBPwqhjhR6DVkg1WXRnzt8A3kPa8ckoe/QGdA06sorUepv1kKFWvVCZOr8/0/IhTyYAAA="},
+    {"id":"samsung-galaxy-s25-fe-5g","brand":"Samsung","model":"Galaxy S25 FE 5G","storages":["128GB","256GB","512GB"],"used":[370,470,520],"good":[351,446,494],"fair":[314,399,442],"new":{"128GB":520,"256GB":620,"512GB":670},"colors":[{"name":"Navy","hex":"#000080"},{"name":"Icyblue","hex":"#B0E0E6"},{"name":"Mint","hex":"#98FB98"},{"name":"Silver Shadow","hex":"#C0C0C0"},{"name":"Blueblack","hex":"#1C2841"},{"name":"Coralred","hex":"#FF6F61"},{"name":"Pinkgold","hex":"#E6C2B8"}],"placeholder":"data:image/webp;base64,UklGRmYAAABXRUJQVlA4IFoAAAAQAgCdASoMABAAA4BaJQBOgCBU2+y9LgYAAP7opOKeXjWDW4Pe0OlBPwqhjhR6DVkg1WXRnzt8A3kPa8ckoe/QGdA06sorUepv1kKFWvVCZOr8/0/IhTyYAAA="},
+    {"id":"samsung-galaxy-a36-5g","brand":"Samsung","model":"Galaxy A36 5G","storages":["8/256GB"],"used":[170],"good":[161],"fair":[144],"new":{"8/256GB":340},"placeholder":"data:image/webp;base64,UklGRlQAAABXRUJQVlA4IEgAAADQAQCdASoMABAAA4BaJbACdADdm1/EAAD+bJbUBRVsL31/4EUErcGlNC6FJPCt1Aq2HLvoDOE5onaWAAOdQczZsJf+1rtXgAA="},
+    {"id":"samsung-galaxy-a55-5g","brand":"Samsung","model":"Galaxy A55 5G","storages":["8/128GB","8/256GB"],"used":[170,220],"good":[161,209],"fair":[144,187],"placeholder":"data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoMABAAA4BaJbACdADp1EN78YAA/uik4psum0tBz/6m67SDTHWWNXfVkFJsCBhq9UEnFVowCV8TWVo9KUninQxZG4u9GS6dTV22xyFlLpRdbgAA"},
+    {"id":"samsung-galaxy-a56-5g","brand":"Samsung","model":"Galaxy A56 5G","storages":["12/256GB","8/256GB"],"used":[270,360],"good":[256,342],"fair":[229,306],"new":{"8/256GB":380,"12/256GB":420},"placeholder":"data:image/webp;base64,UklGRmQAAABXRUJQVlA4IFgAAADwAQCdASoMABAAA4BaJbACdADp1EN78YAA/uik4psum0tBz/6m67SDTHWWNXfVkFJsCBhq9UEnFVowCV8TWVo9KUninQxZG4u9GS6dTV22xyFlLpRdbgAA"},
+    {"id":"samsung-galaxy-a73-5g","brand":"Samsung","model":"Galaxy A73 5G","storages":["8/128GB","8/256GB"],"used":[100,150],"good":[95,142],"fair":[85,127],"placeholder":"data:image/webp;base64,UklGRmoAAABXRUJQVlA4IF4AAAAQAgCdASoMABAAA4BaJbACdAEU+cQt4czAAP7og0s0UnxmcSh6/3GjNKLMi/buz2FAbuFZJImb1MkC9lljt+ylJJzYb0nbZriIZhNwMFRBP5jrtEYqB2eA16+nMAAA"},
+    {"id":"samsung-galaxy-buds-3","brand":"Samsung","model":"Galaxy Buds 3","storages":["Base"],"used":[50],"good":[47],"fair":[42],"new":{"Base":50},"placeholder":"data:image/webp;base64,UklGRlIAAABXRUJQVlA4IEYAAACwAQCdASoQAAkAA4BaJaQAAb/KkUHAAP71IwtvLJAczTGIm8zaxb0/frJt2WZHrYXUvBtPniH3PA9ucwkVX3OTEe4EAAAA"},
+    {"id":"samsung-galaxy-buds-3-pro","brand":"Samsung","model":"Galaxy Buds 3 Pro","storages":["Base"],"used":[130],"good":[123],"fair":[110],"new":{"Base":130},"placeholder":"data:image/webp;base64,UklGRkgAAABXRUJQVlA4IDwAAADQAQCdASoQAAcAA4BaJaQAAuRnSXbwQAD+lQ/xS9CZ2Ifi6BfB825x8YPqLGi/MMU5BuS6fjYkQHJAAAA="}
+];
+
+function expandCatalogPhone(record) {
+    const zip = values => Object.fromEntries(record.storages.map((storage, i) => [storage, values(i)]));
 
-        // Samsung Galaxy Z Fold 5 5G
-        {
-            id: 'samsung-galaxy-z-fold-5-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Fold 5 5G',
-            image: 'images/phones/samsung-galaxy-z-fold-5-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 550,
-            storagePrices: {"256GB": 550, "512GB": 600, "1TB": 650},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                },
-                "512GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                },
-                "1TB": {
-                                "excellent": 650,
-                                "good": 617,
-                                "fair": 552
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Fold 6 5G
-        {
-            id: 'samsung-galaxy-z-fold-6-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Fold 6 5G',
-            image: 'images/phones/samsung-galaxy-z-fold-6-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 770,
-            storagePrices: {"256GB": 770, "512GB": 870, "1TB": 970},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 770,
-                                "good": 731,
-                                "fair": 654
-                },
-                "512GB": {
-                                "excellent": 870,
-                                "good": 826,
-                                "fair": 739
-                },
-                "1TB": {
-                                "excellent": 970,
-                                "good": 921,
-                                "fair": 824
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Fold 7 5G
-        {
-            id: 'samsung-galaxy-z-fold-7-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Fold 7 5G',
-            image: 'images/phones/samsung-galaxy-z-fold-7-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 1470,
-            storagePrices: {"256GB": 1470, "512GB": 1520, "1TB": 1620},
-            newPhonePrices: {"256GB": 1630, "512GB": 1780, "1TB": 1860},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 1470,
-                                "good": 1396,
-                                "fair": 1249
-                },
-                "512GB": {
-                                "excellent": 1520,
-                                "good": 1444,
-                                "fair": 1292
-                },
-                "1TB": {
-                                "excellent": 1620,
-                                "good": 1539,
-                                "fair": 1377
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Flip 4 5G
-        {
-            id: 'samsung-galaxy-z-flip-4-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Flip 4 5G',
-            image: 'images/phones/samsung-galaxy-z-flip-4-5g.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 100,
-            storagePrices: {"128GB": 100, "256GB": 150, "512GB": 200},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 100,
-                                "good": 95,
-                                "fair": 85
-                },
-                "256GB": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                },
-                "512GB": {
-                                "excellent": 200,
-                                "good": 190,
-                                "fair": 170
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Flip 5 5G
-        {
-            id: 'samsung-galaxy-z-flip-5-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Flip 5 5G',
-            image: 'images/phones/samsung-galaxy-z-flip-5-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 250,
-            storagePrices: {"256GB": 250, "512GB": 300},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                },
-                "512GB": {
-                                "excellent": 300,
-                                "good": 285,
-                                "fair": 255
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Flip 6 5G
-        {
-            id: 'samsung-galaxy-z-flip-6-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Flip 6 5G',
-            image: 'images/phones/samsung-galaxy-z-flip-6-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 400,
-            storagePrices: {"256GB": 400, "512GB": 450},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                },
-                "512GB": {
-                                "excellent": 450,
-                                "good": 427,
-                                "fair": 382
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Flip 7 5G
-        {
-            id: 'samsung-galaxy-z-flip-7-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Flip 7 5G',
-            image: 'images/phones/samsung-galaxy-z-flip-7-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 670,
-            storagePrices: {"256GB": 670, "512GB": 770},
-            newPhonePrices: {"256GB": 900, "512GB": 950},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 670,
-                                "good": 636,
-                                "fair": 569
-                },
-                "512GB": {
-                                "excellent": 770,
-                                "good": 731,
-                                "fair": 654
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Z Flip 7 FE 5G
-        {
-            id: 'samsung-galaxy-z-flip-7-fe-5g',
-            brand: 'Samsung',
-            model: 'Galaxy Z Flip 7 FE 5G',
-            image: 'images/phones/samsung-galaxy-z-flip-7-fe-5g.jpg',
-            storages: ["128GB", "256GB"],
-            basePrice: 470,
-            storagePrices: {"128GB": 470, "256GB": 570},
-            newPhonePrices: {"128GB": 620, "256GB": 770},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 470,
-                                "good": 446,
-                                "fair": 399
-                },
-                "256GB": {
-                                "excellent": 570,
-                                "good": 541,
-                                "fair": 484
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S21 5G
-        {
-            id: 'samsung-galaxy-s21-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S21 5G',
-            image: 'images/phones/samsung-galaxy-s21-5g.jpg',
-            storages: ["Base"],
-            basePrice: 120,
-            storagePrices: {"Base": 120},
-            newPhonePrices: {},
-            buyPrices: {
-                "Base": {
-                                "excellent": 120,
-                                "good": 114,
-                                "fair": 102
-                }
-},
-            quantities: {
-                "Base": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S21+ 5G
-        {
-            id: 'samsung-galaxy-s21-plus-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S21+ 5G',
-            image: 'images/phones/samsung-galaxy-s21-plus-5g.jpg',
-            storages: ["Base"],
-            basePrice: 150,
-            storagePrices: {"Base": 150},
-            newPhonePrices: {},
-            buyPrices: {
-                "Base": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                }
-},
-            quantities: {
-                "Base": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S21 Ultra 5G
-        {
-            id: 'samsung-galaxy-s21-ultra-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S21 Ultra 5G',
-            image: 'images/phones/samsung-galaxy-s21-ultra-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 200,
-            storagePrices: {"256GB": 200, "512GB": 250},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 200,
-                                "good": 190,
-                                "fair": 170
-                },
-                "512GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S21 FE 5G
-        {
-            id: 'samsung-galaxy-s21-fe-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S21 FE 5G',
-            image: 'images/phones/samsung-galaxy-s21-fe-5g.jpg',
-            storages: ["256GB"],
-            basePrice: 100,
-            storagePrices: {"256GB": 100},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 100,
-                                "good": 95,
-                                "fair": 85
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S22 5G
-        {
-            id: 'samsung-galaxy-s22-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S22 5G',
-            image: 'images/phones/samsung-galaxy-s22-5g.jpg',
-            storages: ["128GB", "256GB"],
-            basePrice: 150,
-            storagePrices: {"128GB": 150, "256GB": 200},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                },
-                "256GB": {
-                                "excellent": 200,
-                                "good": 190,
-                                "fair": 170
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S22+ 5G
-        {
-            id: 'samsung-galaxy-s22-plus-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S22+ 5G',
-            image: 'images/phones/samsung-galaxy-s22-plus-5g.jpg',
-            storages: ["128GB", "256GB"],
-            basePrice: 200,
-            storagePrices: {"128GB": 200, "256GB": 250},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 200,
-                                "good": 190,
-                                "fair": 170
-                },
-                "256GB": {
-                                "excellent": 250,
-                                "good": 237,
-                                "fair": 212
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S22 Ultra 5G
-        {
-            id: 'samsung-galaxy-s22-ultra-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S22 Ultra 5G',
-            image: 'images/phones/samsung-galaxy-s22-ultra-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 350,
-            storagePrices: {"256GB": 350, "512GB": 400},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                },
-                "512GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S23 5G
-        {
-            id: 'samsung-galaxy-s23-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S23 5G',
-            image: 'images/phones/samsung-galaxy-s23-5g.jpg',
-            storages: ["128GB", "256GB"],
-            basePrice: 300,
-            storagePrices: {"128GB": 300, "256GB": 350},
-            newPhonePrices: {},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 300,
-                                "good": 285,
-                                "fair": 255
-                },
-                "256GB": {
-                                "excellent": 350,
-                                "good": 332,
-                                "fair": 297
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S23+ 5G
-        {
-            id: 'samsung-galaxy-s23-plus-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S23+ 5G',
-            image: 'images/phones/samsung-galaxy-s23-plus-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 400,
-            storagePrices: {"256GB": 400, "512GB": 450},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 400,
-                                "good": 380,
-                                "fair": 340
-                },
-                "512GB": {
-                                "excellent": 450,
-                                "good": 427,
-                                "fair": 382
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S23 Ultra 5G
-        {
-            id: 'samsung-galaxy-s23-ultra-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S23 Ultra 5G',
-            image: 'images/phones/samsung-galaxy-s23-ultra-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 500,
-            storagePrices: {"256GB": 500, "512GB": 550, "1TB": 600},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 500,
-                                "good": 475,
-                                "fair": 425
-                },
-                "512GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                },
-                "1TB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S23 FE 5G
-        {
-            id: 'samsung-galaxy-s23-fe-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S23 FE 5G',
-            image: 'images/phones/samsung-galaxy-s23-fe-5g.jpg',
-            storages: ["256GB"],
-            basePrice: 220,
-            storagePrices: {"256GB": 220},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 220,
-                                "good": 209,
-                                "fair": 187
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S24 5G
-        {
-            id: 'samsung-galaxy-s24-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S24 5G',
-            image: 'images/phones/samsung-galaxy-s24-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 500,
-            storagePrices: {"256GB": 500, "512GB": 550},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 500,
-                                "good": 475,
-                                "fair": 425
-                },
-                "512GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S24+ 5G
-        {
-            id: 'samsung-galaxy-s24-plus-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S24+ 5G',
-            image: 'images/phones/samsung-galaxy-s24-plus-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 570,
-            storagePrices: {"256GB": 570, "512GB": 620},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 570,
-                                "good": 541,
-                                "fair": 484
-                },
-                "512GB": {
-                                "excellent": 620,
-                                "good": 589,
-                                "fair": 527
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S24 Ultra 5G
-        {
-            id: 'samsung-galaxy-s24-ultra-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S24 Ultra 5G',
-            image: 'images/phones/samsung-galaxy-s24-ultra-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 700,
-            storagePrices: {"256GB": 700, "512GB": 750, "1TB": 850},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 700,
-                                "good": 665,
-                                "fair": 595
-                },
-                "512GB": {
-                                "excellent": 750,
-                                "good": 712,
-                                "fair": 637
-                },
-                "1TB": {
-                                "excellent": 850,
-                                "good": 807,
-                                "fair": 722
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S24 FE 5G
-        {
-            id: 'samsung-galaxy-s24-fe-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S24 FE 5G',
-            image: 'images/phones/samsung-galaxy-s24-fe-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 370,
-            storagePrices: {"256GB": 370, "512GB": 420},
-            newPhonePrices: {},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 370,
-                                "good": 351,
-                                "fair": 314
-                },
-                "512GB": {
-                                "excellent": 420,
-                                "good": 399,
-                                "fair": 357
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S25 5G
-        {
-            id: 'samsung-galaxy-s25-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S25 5G',
-            image: 'images/phones/samsung-galaxy-s25-5g.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 550,
-            storagePrices: {"128GB": 550, "256GB": 600, "512GB": 700},
-            newPhonePrices: {"128GB": 800, "256GB": 850, "512GB": 950},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 550,
-                                "good": 522,
-                                "fair": 467
-                },
-                "256GB": {
-                                "excellent": 600,
-                                "good": 570,
-                                "fair": 510
-                },
-                "512GB": {
-                                "excellent": 700,
-                                "good": 665,
-                                "fair": 595
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [
-                { name: 'Navy', hex: '#000080' },
-                { name: 'Icyblue', hex: '#B0E0E6' },
-                { name: 'Mint', hex: '#98FB98' },
-                { name: 'Silver Shadow', hex: '#C0C0C0' },
-                { name: 'Blueblack', hex: '#1C2841' },
-                { name: 'Coralred', hex: '#FF6F61' },
-                { name: 'Pinkgold', hex: '#E6C2B8' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S25+ 5G
-        {
-            id: 'samsung-galaxy-s25-plus-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S25+ 5G',
-            image: 'images/phones/samsung-galaxy-s25-plus-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 750,
-            storagePrices: {"256GB": 750, "512GB": 850},
-            newPhonePrices: {"256GB": 920, "512GB": 1120},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 750,
-                                "good": 712,
-                                "fair": 637
-                },
-                "512GB": {
-                                "excellent": 850,
-                                "good": 807,
-                                "fair": 722
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            // Colors verified from Samsung.com (January 2026) - NO SPACES in color names
-            colors: [
-                { name: 'Navy', hex: '#000080' },
-                { name: 'Icyblue', hex: '#B0E0E6' },
-                { name: 'Mint', hex: '#98FB98' },
-                { name: 'Silver Shadow', hex: '#C0C0C0' },
-                { name: 'Blueblack', hex: '#1C2841' },
-                { name: 'Coralred', hex: '#FF6F61' },
-                { name: 'Pinkgold', hex: '#E6C2B8' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S25 Ultra 5G
-        {
-            id: 'samsung-galaxy-s25-ultra-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S25 Ultra 5G',
-            image: 'images/phones/samsung-galaxy-s25-ultra-5g.jpg',
-            storages: ["256GB", "512GB", "1TB"],
-            basePrice: 850,
-            storagePrices: {"256GB": 850, "512GB": 1050, "1TB": 1100},
-            newPhonePrices: {"256GB": 1020, "512GB": 1200, "1TB": 1350},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 850,
-                                "good": 807,
-                                "fair": 722
-                },
-                "512GB": {
-                                "excellent": 1050,
-                                "good": 997,
-                                "fair": 892
-                },
-                "1TB": {
-                                "excellent": 1100,
-                                "good": 1045,
-                                "fair": 935
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "1TB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            // Colors verified from Samsung.com (January 2026) - NO SPACES in color names
-            colors: [
-                { name: 'Titanium Silverblue', hex: '#8B9DC3' },
-                { name: 'Titanium Gray', hex: '#8E8E93' },
-                { name: 'Titanium Black', hex: '#1C1C1C' },
-                { name: 'Titanium Whitesilver', hex: '#E8E8E8' },
-                { name: 'Titanium Jetblack', hex: '#000000' },
-                { name: 'Titanium Jadegreen', hex: '#00A878' },
-                { name: 'Titanium Pinkgold', hex: '#E6C2B8' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S25 Edge 5G
-        {
-            id: 'samsung-galaxy-s25-edge-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S25 Edge 5G',
-            image: 'images/phones/samsung-galaxy-s25-edge-5g.jpg',
-            storages: ["256GB", "512GB"],
-            basePrice: 570,
-            storagePrices: {"256GB": 570, "512GB": 670},
-            newPhonePrices: {"256GB": 770, "512GB": 870},
-            buyPrices: {
-                "256GB": {
-                                "excellent": 570,
-                                "good": 541,
-                                "fair": 484
-                },
-                "512GB": {
-                                "excellent": 670,
-                                "good": 636,
-                                "fair": 569
-                }
-},
-            quantities: {
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            // Colors verified from Samsung.com (January 2026) - Same as S25/S25+ base models
-            colors: [
-                { name: 'Navy', hex: '#000080' },
-                { name: 'Icyblue', hex: '#B0E0E6' },
-                { name: 'Mint', hex: '#98FB98' },
-                { name: 'Silver Shadow', hex: '#C0C0C0' },
-                { name: 'Blueblack', hex: '#1C2841' },
-                { name: 'Coralred', hex: '#FF6F61' },
-                { name: 'Pinkgold', hex: '#E6C2B8' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy S25 FE 5G
-        {
-            id: 'samsung-galaxy-s25-fe-5g',
-            brand: 'Samsung',
-            model: 'Galaxy S25 FE 5G',
-            image: 'images/phones/samsung-galaxy-s25-fe-5g.jpg',
-            storages: ["128GB", "256GB", "512GB"],
-            basePrice: 370,
-            storagePrices: {"128GB": 370, "256GB": 470, "512GB": 520},
-            newPhonePrices: {"128GB": 520, "256GB": 620, "512GB": 670},
-            buyPrices: {
-                "128GB": {
-                                "excellent": 370,
-                                "good": 351,
-                                "fair": 314
-                },
-                "256GB": {
-                                "excellent": 470,
-                                "good": 446,
-                                "fair": 399
-                },
-                "512GB": {
-                                "excellent": 520,
-                                "good": 494,
-                                "fair": 442
-                }
-},
-            quantities: {
-                "128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "512GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            // Colors verified from Samsung.com (January 2026) - Same as S25/S25+ base models
-            colors: [
-                { name: 'Navy', hex: '#000080' },
-                { name: 'Icyblue', hex: '#B0E0E6' },
-                { name: 'Mint', hex: '#98FB98' },
-                { name: 'Silver Shadow', hex: '#C0C0C0' },
-                { name: 'Blueblack', hex: '#1C2841' },
-                { name: 'Coralred', hex: '#FF6F61' },
-                { name: 'Pinkgold', hex: '#E6C2B8' }
-            ],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy A36 5G
-        {
-            id: 'samsung-galaxy-a36-5g',
-            brand: 'Samsung',
-            model: 'Galaxy A36 5G',
-            image: 'images/phones/samsung-galaxy-a36-5g.jpg',
-            storages: ["8/256GB"],
-            basePrice: 170,
-            storagePrices: {"8/256GB": 170},
-            newPhonePrices: {"8/256GB": 340},
-            buyPrices: {
-                "8/256GB": {
-                                "excellent": 170,
-                                "good": 161,
-                                "fair": 144
-                }
-},
-            quantities: {
-                "8/256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy A55 5G
-        {
-            id: 'samsung-galaxy-a55-5g',
-            brand: 'Samsung',
-            model: 'Galaxy A55 5G',
-            image: 'images/phones/samsung-galaxy-a55-5g.jpg',
-            storages: ["8/128GB", "8/256GB"],
-            basePrice: 170,
-            storagePrices: {"8/128GB": 170, "8/256GB": 220},
-            newPhonePrices: {},
-            buyPrices: {
-                "8/128GB": {
-                                "excellent": 170,
-                                "good": 161,
-                                "fair": 144
-                },
-                "8/256GB": {
-                                "excellent": 220,
-                                "good": 209,
-                                "fair": 187
-                }
-},
-            quantities: {
-                "8/128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "8/256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy A56 5G
-        {
-            id: 'samsung-galaxy-a56-5g',
-            brand: 'Samsung',
-            model: 'Galaxy A56 5G',
-            image: 'images/phones/samsung-galaxy-a56-5g.jpg',
-            storages: ["12/256GB", "8/256GB"],
-            basePrice: 270,
-            storagePrices: {"12/256GB": 270, "8/256GB": 360},
-            newPhonePrices: {"8/256GB": 380, "12/256GB": 420},
-            buyPrices: {
-                "12/256GB": {
-                                "excellent": 270,
-                                "good": 256,
-                                "fair": 229
-                },
-                "8/256GB": {
-                                "excellent": 360,
-                                "good": 342,
-                                "fair": 306
-                }
-},
-            quantities: {
-                "12/256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "8/256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy A73 5G
-        {
-            id: 'samsung-galaxy-a73-5g',
-            brand: 'Samsung',
-            model: 'Galaxy A73 5G',
-            image: 'images/phones/samsung-galaxy-a73-5g.jpg',
-            storages: ["8/128GB", "8/256GB"],
-            basePrice: 100,
-            storagePrices: {"8/128GB": 100, "8/256GB": 150},
-            newPhonePrices: {},
-            buyPrices: {
-                "8/128GB": {
-                                "excellent": 100,
-                                "good": 95,
-                                "fair": 85
-                },
-                "8/256GB": {
-                                "excellent": 150,
-                                "good": 142,
-                                "fair": 127
-                }
-},
-            quantities: {
-                "8/128GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                },
-                "8/256GB": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
-
-        // Samsung Galaxy Buds 3
-        {
-            id: 'samsung-galaxy-buds-3',
-            brand: 'Samsung',
-            model: 'Galaxy Buds 3',
-            image: 'images/phones/samsung-galaxy-buds-3.jpg',
-            storages: ["Base"],
-            basePrice: 50,
-            storagePrices: {"Base": 50},
-            newPhonePrices: {"Base": 50},
-            buyPrices: {
-                "Base": {
-                                "excellent": 50,
-                                "good": 47,
-                                "fair": 42
-                }
-},
-            quantities: {
-                "Base": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        },
+    return {
+        id: record.id,
+        brand: record.brand,
+        model: record.model,
+        image: `images/phones/${record.id}.jpg`,
+        storages: record.storages.slice(),
+        basePrice: record.used[0],
+        storagePrices: zip(i => record.used[i]),
+        newPhonePrices: Object.assign({}, record.new),
+        buyPrices: zip(i => ({ excellent: record.used[i], good: record.good[i], fair: record.fair[i] })),
+        quantities: zip(() => ({ excellent: 0, good: 0, fair: 0 })),
+        colors: (record.colors || []).map(color => Object.assign({}, color)),
+        placeholder: record.placeholder || '',
+        display: true,
+        available: true
+    };
+}
 
-        // Samsung Galaxy Buds 3 Pro
-        {
-            id: 'samsung-galaxy-buds-3-pro',
-            brand: 'Samsung',
-            model: 'Galaxy Buds 3 Pro',
-            image: 'images/phones/samsung-galaxy-buds-3-pro.jpg',
-            storages: ["Base"],
-            basePrice: 130,
-            storagePrices: {"Base": 130},
-            newPhonePrices: {"Base": 130},
-            buyPrices: {
-                "Base": {
-                                "excellent": 130,
-                                "good": 123,
-                                "fair": 110
-                }
-},
-            quantities: {
-                "Base": {
-                                "excellent": 0,
-                                "good": 0,
-                                "fair": 0
-                }
-},
-            colors: [],
-            display: true,
-            available: true
-        }
-    ];
+function importExactPrices() {
+    const phones = PRICE_CATALOG.map(expandCatalogPhone);
 
     // Save to localStorage
     localStorage.setItem('ktmobile_phones', JSON.stringify(phones));
@@ -0,0 +1,131 @@
+/**
+ * MODEL SEARCH
+ * ============
+ * Instant model search over the prebuilt index from
+ * `python -m tools.searchindex` (data/search-index.json): model names,
+ * aliases such as "S24U", storages and colours.
+ *
+ * Each query word is looked up as an exact term, a prefix (binary search
+ * over the sorted terms) or a substring (trigram postings), instead of
+ * scanning every phone. Results are ranked by match quality, then catalog
+ * order, so a query always returns the same list.
+ *
+ * `ready` resolves once the index has loaded (or failed to); until then
+ * search() returns null and callers use their own matching.
+ */
+
+(function() {
+    const INDEX_URL = 'data/search-index.json';
+    const GRAM = 3;
+    const EXACT = 3, PREFIX = 2, INFIX = 1;
+
+    let index = null;
+
+    /**
+     * 'Galaxy S24+ 5G' -> ['galaxy', 's24', 'plus', '5g'] (same as normalize() in tools/searchindex.py)
+     */
+    function normalize(text) {
+        return String(text).toLowerCase().replace(/\+/g, ' plus ').split(/[^a-z0-9]+/).filter(Boolean);
+    }
+
+    /**
+     * First term index >= word
+     */
+    function lowerBound(word) {
+        let lo = 0, hi = index.terms.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (index.terms[mid] < word) lo = mid + 1;
+            else hi = mid;
+        }
+        return lo;
+    }
+
+    /**
+     * Map of term index -> match quality for one query word
+     */
+    function matchTerms(word) {
+        const matches = new Map();
+        for (let i = lowerBound(word); i < index.terms.length && index.terms[i].startsWith(word); i++) {
+            matches.set(i, index.terms[i] === word ? EXACT : PREFIX);
+        }
+        if (word.length < GRAM) return matches;
+
+        // Substring matches: terms that share every trigram of the word, then verified
+        let candidates = null;
+        for (let i = 0; i + GRAM <= word.length; i++) {
+            const terms = index.grams[word.slice(i, i + GRAM)];
+            if (!terms) return matches;
+            const shared = new Set(terms);
+            candidates = candidates ? candidates.filter(t => shared.has(t)) : terms;
+        }
+        candidates.forEach(t => {
+            if (!matches.has(t) && index.terms[t].includes(word)) matches.set(t, INFIX);
+        });
+        return matches;
+    }
+
+    /**
+     * Models matching every word of the query, best first.
+     * @param {string} query - Free text, e.g. "s24u 256"
+     * @param {Object} options - brand: only this brand; limit: maximum results
+     * @returns {Array|null} - [{brand, model, score}], or null before the index has loaded
+     */
+    function search(query, { brand = null, limit = Infinity } = {}) {
+        if (!index) return null;
+        const words = normalize(query);
+        if (words.length === 0) return [];
+
+        let scores = null;
+        for (const word of words) {
+            const wordScores = new Map();
+            matchTerms(word).forEach((quality, term) => {
+                index.postings[term].forEach(model => {
+                    wordScores.set(model, Math.max(wordScores.get(model) || 0, quality));
+                });
+            });
+            if (scores) {
+                const combined = new Map();
+                scores.forEach((score, model) => {
+                    if (wordScores.has(model)) combined.set(model, score + wordScores.get(model));
+                });
+                scores = combined;
+            } else {
+                scores = wordScores;
+            }
+            if (scores.size === 0) return [];
+        }
+
+        return [...scores.entries()]
+            .filter(([model]) => !brand || index.models[model][0] === brand)
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([model, score]) => ({ brand: index.models[model][0], model: index.models[model][1], score }));
+    }
+
+    /**
+     * Catalog model name for a name or alias typed by a customer or in a link
+     * ("S24 Ultra", "Galaxy S24U"), or null if nothing in the brand matches.
+     */
+    function lookup(brand, name) {
+        const joined = normalize(name).join('');
+        const exact = search(joined, { brand });
+        if (exact && exact.length && exact[0].score === EXACT) return exact[0].model;
+        const results = search(name, { brand, limit: 1 });
+        return results && results.length ? results[0].model : null;
+    }
+
+    const ready = fetch(INDEX_URL, { cache: 'no-cache' })
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .then(data => {
+            index = data;
+        })
+        .catch(err => {
+            console.warn('⚠️ Search index not available, using substring search:', err.message);
+        });
+
+    window.modelSearch = { search, lookup, normalize, ready, loaded: () => index !== null };
+})();
@@ -0,0 +1,75 @@
+/**
+ * MODEL GRID SPRITES
+ * ==================
+ * Paints model card thumbnails from the per-brand sprite sheets built by
+ * `python -m tools.sprites` (data/sprites.json), so a brand grid costs one
+ * cached sheet request instead of one image request per model.
+ *
+ * Retina screens get the 2x sheet, browsers without WebP the JPEG one.
+ * Images that aren't in a sheet (or a page rendered before the map has
+ * loaded) keep their normal <img>.
+ */
+
+(function() {
+    const MAP_URL = 'data/sprites.json';
+    const PHONE_PREFIX = 'images/phones/';
+
+    let map = null;
+    let format = 'jpeg';
+
+    function supportsWebp() {
+        try {
+            const canvas = document.createElement('canvas');
+            canvas.width = canvas.height = 1;
+            return canvas.toDataURL('image/webp').startsWith('data:image/webp');
+        } catch (e) {
+            return false;
+        }
+    }
+
+    /**
+     * Sprite map entry [brand, x, y] for an image src, e.g. "images/phones/x.jpg?t=1"
+     */
+    function lookup(src) {
+        if (!map || !src || src.startsWith('data:')) return null;
+        const path = src.split('?')[0];
+        const index = path.indexOf(PHONE_PREFIX);
+        if (index === -1) return null;
+        return map.images[path.slice(index + PHONE_PREFIX.length)] || null;
+    }
+
+    /**
+     * Markup for a sprite thumbnail, or '' if src isn't in a sheet.
+     * @param {string} src - The image the card would otherwise load
+     * @param {string} alt - Accessible label (the model name)
+     * @param {string} style - Extra inline CSS for the box (margins etc.)
+     */
+    function html(src, alt, style = '') {
+        const entry = lookup(src);
+        if (!entry) return '';
+
+        const [brand, x, y] = entry;
+        const sheet = map.sheets[brand];
+        const density = (window.devicePixelRatio || 1) > 1 ? '2x' : '1x';
+        const [width, height] = map.cell;
+        return `<span class="model-sprite" role="img" aria-label="${alt.replace(/"/g, '&quot;')}" style="` +
+            `display: inline-block; width: ${width}px; height: ${height}px; ` +
+            `background: url('${sheet.files[format][density]}') -${x}px -${y}px / ${sheet.size[0]}px ${sheet.size[1]}px no-repeat; ` +
+            `${style}"></span>`;
+    }
+
+    const ready = fetch(MAP_URL, { cache: 'no-cache' })
+        .then(response => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json();
+        })
+        .then(data => {
+            if (supportsWebp()) format = 'webp';
+            map = data;
+        })
+        .catch(err => {
+            console.warn('⚠️ Sprite map not available, using individual images:', err.message);
+        });
+
+    window.modelSprites = { html, lookup, ready };
+})();
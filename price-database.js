@@ -63,6 +63,7 @@ class PriceDatabase {
     /**
      * Auto-import prices from import-exact-prices.js if database is empty
      * This ensures mobile users get correct prices on first visit
+     * (that file is generated from the Excel price lists by `python -m tools.prices`)
      */
     autoImportPricesIfEmpty() {
         // Check if old localStorage has data
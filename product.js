@@ -48,10 +48,19 @@ const conditionDescriptions = {
  * @param {HTMLImageElement} imgElement - The image element
  * @param {string} imageSrc - The image source URL
  * @param {boolean} addCacheBusting - Whether to add cache-busting timestamp
+ * @param {string} placeholder - Optional preview data URI shown while the image loads
  */
-function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true) {
+function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true, placeholder = '') {
     if (!imgElement || !imageSrc) return;
 
+    // placeholderStyle() comes from quote.js, loaded before this file
+    imgElement.style.background = '';
+    const previewCss = placeholderStyle(placeholder);
+    if (previewCss) {
+        imgElement.style.cssText += previewCss;
+        imgElement.addEventListener('load', () => { imgElement.style.background = ''; }, { once: true });
+    }
+
     let finalSrc = imageSrc;
 
     // Don't add cache-busting to data URLs (they can't have query parameters)
@@ -60,6 +69,11 @@ function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true) {
     }
 
     imgElement.src = finalSrc;
+
+    // Serve a right-sized variant when tools/responsive.py has built one
+    if (window.responsiveImages) {
+        window.responsiveImages.apply(imgElement);
+    }
 }
 
 // Initialize product page
@@ -110,6 +124,7 @@ function loadProductData(brand, model) {
         // Use admin phone data
         product = {
             image: adminPhone.image,
+            placeholder: adminPhone.placeholder || '',
             colors: adminPhone.colors || [],
             storage: {},
             basePrice: adminPhone.basePrice || 0
@@ -131,7 +146,7 @@ function loadProductData(brand, model) {
     
     // Set product image
     const mainImage = document.getElementById('mainProductImage');
-    safeSetImageSrc(mainImage, product.image, true);
+    safeSetImageSrc(mainImage, product.image, true, product.placeholder);
     mainImage.alt = model;
     
     // Generate thumbnails
@@ -853,7 +868,8 @@ function loadRelatedProducts(brand, model) {
         const price = basePrice + (product.storage[firstStorage] || 0);
         
         card.innerHTML = `
-            <img src="${product.image}" alt="${relatedModel}" class="related-product-image">
+            <img src="${product.image}" alt="${relatedModel}" class="related-product-image"
+                 style="${placeholderStyle(product.placeholder)}" onload="this.style.background='';">
             <div class="related-product-info">
                 <div class="related-product-title">${relatedModel}</div>
                 <div class="related-product-price">From S$${price.toLocaleString()}</div>
@@ -118,15 +118,34 @@ window.verifyPriceIntegrity = function() {
 // HELPER FUNCTIONS FOR IMAGE AND COLOR DATA MANAGEMENT
 // ============================================================================
 
+/**
+ * Inline CSS that paints an image's low-quality placeholder (tools/placeholders.py)
+ * behind it until the real image has loaded
+ * @param {string} placeholder - Preview data URI from the catalog, may be empty
+ * @returns {string} - CSS declarations, or '' without a placeholder
+ */
+function placeholderStyle(placeholder) {
+    if (!placeholder || !placeholder.startsWith('data:image/')) return '';
+    return `background: url('${placeholder}') center / contain no-repeat;`;
+}
+
 /**
  * Safely sets image src with data URL protection
  * @param {HTMLImageElement} imgElement - The image element
  * @param {string} imageSrc - The image source URL
  * @param {boolean} addCacheBusting - Whether to add cache-busting timestamp
+ * @param {string} placeholder - Optional preview data URI shown while the image loads
  */
-function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true) {
+function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true, placeholder = '') {
     if (!imgElement || !imageSrc) return;
 
+    imgElement.style.background = '';
+    const previewCss = placeholderStyle(placeholder);
+    if (previewCss) {
+        imgElement.style.cssText += previewCss;
+        imgElement.addEventListener('load', () => { imgElement.style.background = ''; }, { once: true });
+    }
+
     let finalSrc = imageSrc;
 
     // Don't add cache-busting to data URLs (they can't have query parameters)
@@ -135,6 +154,11 @@ function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true) {
     }
 
     imgElement.src = finalSrc;
+
+    // Serve a right-sized variant when tools/responsive.py has built one
+    if (window.responsiveImages) {
+        window.responsiveImages.apply(imgElement);
+    }
 }
 
 /**
@@ -430,105 +454,7 @@ function loadAdminDataForCustomerPages() {
             console.log('✅ Created adminManager with localStorage data');
         }
 
-        let updatedCount = 0;
-        let createdCount = 0;
-
-        // Update phoneDatabase with admin data
-        adminPhones.forEach(phone => {
-            const brand = phone.brand;
-            const model = phone.model;
-
-            // Skip if brand doesn't exist in phoneDatabase
-            if (!phoneDatabase[brand]) {
-                console.warn(`⚠️  Skip: Brand "${brand}" not in phoneDatabase`);
-                return;
-            }
-
-            // Create model entry if it doesn't exist
-            const isNew = !phoneDatabase[brand][model];
-            if (isNew) {
-                phoneDatabase[brand][model] = {
-                    basePrice: 0,
-                    image: '',
-                    storage: {},
-                    colors: []
-                };
-                createdCount++;
-            } else {
-                updatedCount++;
-            }
-
-            // Update with admin data
-            const dbModel = phoneDatabase[brand][model];
-
-            // Update image - ALWAYS use admin image if available
-            // CRITICAL FIX: Force cache busting to ensure browser reloads new images
-            if (phone.image) {
-                // Don't add cache-busting to data URLs (they can't have query parameters)
-                if (phone.image.startsWith('data:')) {
-                    dbModel.image = phone.image;
-                    console.log(`   📷 Updated image for ${brand} ${model}: [data URL]`);
-                } else {
-                    // Strip old timestamp if present and add fresh one
-                    let cleanImagePath = phone.image.split('?')[0];
-                    dbModel.image = `${cleanImagePath}?t=${Date.now()}`;
-                    console.log(`   📷 Updated image for ${brand} ${model}: ${dbModel.image}`);
-                }
-            }
-
-            // Update basePrice
-            if (phone.basePrice !== undefined) {
-                dbModel.basePrice = phone.basePrice;
-            }
-
-            // Update storage options - Convert absolute prices to modifiers
-            if (phone.storages && phone.storages.length > 0) {
-                const newStorage = {};
-                const basePrice = phone.basePrice || 0;
-
-                phone.storages.forEach(storage => {
-                    if (phone.storagePrices && phone.storagePrices[storage] !== undefined) {
-                        // Calculate modifier from absolute USED price
-                        newStorage[storage] = phone.storagePrices[storage] - basePrice;
-                    } else {
-                        newStorage[storage] = 0;
-                    }
-                });
-
-                dbModel.storage = newStorage;
-            }
-
-            // Update colors - Handle both string and object formats
-            if (phone.colors && phone.colors.length > 0) {
-                dbModel.colors = phone.colors.map(color => {
-                    // If already an object with name and hex, use it directly
-                    if (typeof color === 'object' && color.name && color.hex) {
-                        return {
-                            name: color.name,
-                            hex: color.hex
-                        };
-                    }
-                    // If it's a string, convert to object
-                    const colorName = typeof color === 'string' ? color : (color.name || 'Black');
-                    return {
-                        name: colorName,
-                        hex: getColorHex(colorName, brand) || '#CCCCCC'
-                    };
-                });
-            }
-
-            // Log details for iPhone 17 Pro Max specifically
-            if (model === 'iPhone 17 Pro Max') {
-                console.log('');
-                console.log('📱 iPhone 17 Pro Max Data:');
-                console.log('   Storages:', phone.storages ? phone.storages.join(', ') : 'none');
-                console.log('   Colors:', phone.colors ? phone.colors.join(', ') : 'none');
-                console.log('   Storage Prices:', phone.storagePrices);
-                console.log('   NEW Prices:', phone.newPhonePrices);
-                console.log('   Updated phoneDatabase.storage:', dbModel.storage);
-                console.log('   Updated phoneDatabase.colors:', dbModel.colors.map(c => c.name).join(', '));
-            }
-        });
+        const { updatedCount, createdCount } = syncAdminPhonesToDatabase(adminPhones);
 
         console.log('');
         console.log('✅ SYNC COMPLETE:');
@@ -568,6 +494,165 @@ function loadAdminDataForCustomerPages() {
     }
 }
 
+/**
+ * Copy admin phones (prices, storages, colours, images) into phoneDatabase
+ * Returns the number of updated and newly created models
+ */
+function syncAdminPhonesToDatabase(adminPhones) {
+    let updatedCount = 0;
+    let createdCount = 0;
+
+    // Update phoneDatabase with admin data
+    adminPhones.forEach(phone => {
+        const brand = phone.brand;
+        const model = phone.model;
+
+        // Skip if brand doesn't exist in phoneDatabase
+        if (!phoneDatabase[brand]) {
+            console.warn(`⚠️  Skip: Brand "${brand}" not in phoneDatabase`);
+            return;
+        }
+
+        // Create model entry if it doesn't exist
+        const isNew = !phoneDatabase[brand][model];
+        if (isNew) {
+            phoneDatabase[brand][model] = {
+                basePrice: 0,
+                image: '',
+                storage: {},
+                colors: []
+            };
+            createdCount++;
+        } else {
+            updatedCount++;
+        }
+
+        // Update with admin data
+        const dbModel = phoneDatabase[brand][model];
+
+        // Update image - ALWAYS use admin image if available
+        // CRITICAL FIX: Force cache busting to ensure browser reloads new images
+        if (phone.image) {
+            // Don't add cache-busting to data URLs (they can't have query parameters)
+            if (phone.image.startsWith('data:')) {
+                dbModel.image = phone.image;
+                console.log(`   📷 Updated image for ${brand} ${model}: [data URL]`);
+            } else {
+                // Strip old timestamp if present and add fresh one
+                let cleanImagePath = phone.image.split('?')[0];
+                dbModel.image = `${cleanImagePath}?t=${Date.now()}`;
+                console.log(`   📷 Updated image for ${brand} ${model}: ${dbModel.image}`);
+            }
+            dbModel.placeholder = phone.placeholder || '';
+        }
+
+        // Update basePrice
+        if (phone.basePrice !== undefined) {
+            dbModel.basePrice = phone.basePrice;
+        }
+
+        // Update storage options - Convert absolute prices to modifiers
+        if (phone.storages && phone.storages.length > 0) {
+            const newStorage = {};
+            const basePrice = phone.basePrice || 0;
+
+            phone.storages.forEach(storage => {
+                if (phone.storagePrices && phone.storagePrices[storage] !== undefined) {
+                    // Calculate modifier from absolute USED price
+                    newStorage[storage] = phone.storagePrices[storage] - basePrice;
+                } else {
+                    newStorage[storage] = 0;
+                }
+            });
+
+            dbModel.storage = newStorage;
+        }
+
+        // Update colors - Handle both string and object formats
+        if (phone.colors && phone.colors.length > 0) {
+            dbModel.colors = phone.colors.map(color => {
+                // If already an object with name and hex, use it directly
+                if (typeof color === 'object' && color.name && color.hex) {
+                    return {
+                        name: color.name,
+                        hex: color.hex
+                    };
+                }
+                // If it's a string, convert to object
+                const colorName = typeof color === 'string' ? color : (color.name || 'Black');
+                return {
+                    name: colorName,
+                    hex: getColorHex(colorName, brand) || '#CCCCCC'
+                };
+            });
+        }
+
+        // Log details for iPhone 17 Pro Max specifically
+        if (model === 'iPhone 17 Pro Max') {
+            console.log('');
+            console.log('📱 iPhone 17 Pro Max Data:');
+            console.log('   Storages:', phone.storages ? phone.storages.join(', ') : 'none');
+            console.log('   Colors:', phone.colors ? phone.colors.join(', ') : 'none');
+            console.log('   Storage Prices:', phone.storagePrices);
+            console.log('   NEW Prices:', phone.newPhonePrices);
+            console.log('   Updated phoneDatabase.storage:', dbModel.storage);
+            console.log('   Updated phoneDatabase.colors:', dbModel.colors.map(c => c.name).join(', '));
+        }
+    });
+
+    return { updatedCount, createdCount };
+}
+
+// Catalog bundle requests made on this page: brand -> promise
+const brandBundleRequests = new Map();
+
+// True while the customer is still choosing a model of this brand in step 1
+function isModelGridActive(brand) {
+    const step = document.getElementById('step-1');
+    const modelSelector = document.getElementById('model-selector');
+    return quoteState.brand === brand && !!step && step.classList.contains('active')
+        && !!modelSelector && modelSelector.style.display !== 'none';
+}
+
+/**
+ * Fetch one brand's catalog bundle (built by python -m tools.bundles) when the
+ * customer opens a brand this device has no admin data for. Only that brand
+ * is downloaded. The phones are added to adminManager.phones, which on
+ * customer pages keeps them in memory next to the stored ones (see admin.js),
+ * so a partial catalog is never saved. The model grid is shown again if the
+ * customer is still on it.
+ * Returns a promise that resolves (never rejects) once the bundle is merged
+ * or has failed, or null if there is nothing to fetch.
+ */
+function loadBrandBundle(brand) {
+    if (brandBundleRequests.has(brand)) return brandBundleRequests.get(brand);
+    const knownPhones = (typeof adminManager !== 'undefined' && adminManager && adminManager.phones) || [];
+    if (!window.catalogBundles || knownPhones.some(p => p.brand === brand)) {
+        return null;
+    }
+
+    const request = window.catalogBundles.loadBrand(brand)
+        .then(brandPhones => {
+            if (brandPhones.length === 0) return;
+            if (typeof adminManager === 'undefined' || !adminManager) {
+                window.adminManager = { phones: [] };
+            }
+            adminManager.phones = adminManager.phones.concat(brandPhones);
+            const { createdCount } = syncAdminPhonesToDatabase(brandPhones);
+            brandBundleRequests.delete(brand); // adminManager.phones has the brand now
+            console.log(`✅ Loaded ${brandPhones.length} ${brand} phones from catalog bundle (${createdCount} new models)`);
+            if (isModelGridActive(brand)) {
+                showModels(brand);
+            }
+        })
+        .catch(error => {
+            brandBundleRequests.delete(brand);
+            console.warn(`⚠️ Could not load catalog bundle for ${brand}:`, error.message);
+        });
+    brandBundleRequests.set(brand, request);
+    return request;
+}
+
 // Helper function to get color hex values
 // Brand parameter added for consistency with admin.js
 function getColorHex(colorName, brand) {
@@ -1812,6 +1897,95 @@ function getModifierValue(conditionType, grade) {
     return value;
 }
 
+// ============================================================================
+// PRECOMPUTED QUOTE TABLE
+// ============================================================================
+// data/quote-table.json (built by `python -m tools.quotetable`) holds the
+// price of every model × storage × country × body × screen × battery
+// combination, so a quote is one array lookup instead of a chain of
+// modifier lookups. It is only used while the admin's prices and
+// modifiers still match the ones it was built from; otherwise the quote is
+// calculated as before. The table is only fetched when the quote step
+// first asks for a price, so other pages that include quote.js skip it.
+// ============================================================================
+
+let quoteTable = null;
+let quoteTableRequest = null;
+let quoteTableCurrent = false; // admin modifiers still match the table's
+
+// Start fetching the table once; the live estimate is refreshed when it arrives
+function loadQuoteTable() {
+    if (quoteTableRequest) return quoteTableRequest;
+    quoteTableRequest = fetch('data/quote-table.json')
+        .then(response => response.ok ? response.json() : null)
+        .then(table => {
+            quoteTable = table;
+            if (table) {
+                refreshQuoteTableMatch();
+                console.log(`✅ Quote table loaded: ${table.usedShape[0]} storage options`);
+                updateLivePriceEstimate();
+            }
+        })
+        .catch(() => console.log('ℹ️ Quote table not available, calculating quotes directly'));
+    return quoteTableRequest;
+}
+
+// True if the admin modifiers match the ones the table was built with
+function quoteTableMatchesModifiers(modifiers) {
+    return Object.entries(quoteTable.modifiers).every(([group, values]) =>
+        Object.entries(values).every(([key, value]) =>
+            Math.abs(modifiers[group]?.[key] || 0) === Math.abs(value)));
+}
+
+// Compare once per change instead of parsing the modifiers on every lookup
+function refreshQuoteTableMatch() {
+    quoteTableCurrent = !!quoteTable && quoteTableMatchesModifiers(loadConditionModifiers());
+}
+
+// Other tabs (admin panel) and the cloud sync (firebase-sync.js) change the modifiers
+window.addEventListener('storage', event => {
+    if (event.key === 'ktmobile_condition_modifiers' || event.key === null) refreshQuoteTableMatch();
+});
+window.addEventListener('conditionmodifierschange', refreshQuoteTableMatch);
+
+/**
+ * Price for the current selection before receipt, issues and accessories,
+ * or null if the table can't answer it (yet: the first call starts loading it)
+ * @param {Object} adminPhone - Phone entry from adminManager.phones
+ * @param {Object} state - quoteState
+ */
+function lookupQuoteTable(adminPhone, state) {
+    if (!quoteTable) {
+        loadQuoteTable();
+        return null;
+    }
+    if (!adminPhone) return null;
+
+    const row = quoteTable.skus[adminPhone.id]?.[state.storage];
+    const dims = quoteTable.dims;
+    const country = dims.country[state.country];
+    if (row === undefined || country === undefined) return null;
+    if (!quoteTableCurrent) return null;
+
+    if (state.deviceType === 'used') {
+        const body = dims.body[state.bodyCondition];
+        const screen = dims.screen[state.screenCondition];
+        const battery = dims.battery[state.batteryHealth];
+        if (body === undefined || screen === undefined || battery === undefined) return null;
+        if (quoteTable.base.used[row] !== adminPhone.storagePrices?.[state.storage]) return null;
+
+        const [, c, b, s, t] = quoteTable.usedShape;
+        return quoteTable.used[(((row * c + country) * b + body) * s + screen) * t + battery];
+    }
+
+    const deviceType = dims.deviceType[state.deviceType];
+    if (deviceType === undefined) return null;
+    if (quoteTable.base.new[row] !== adminPhone.newPhonePrices?.[state.storage]) return null;
+
+    const [, d, c] = quoteTable.newShape;
+    return quoteTable.new[(row * d + deviceType) * c + country];
+}
+
 // Update condition buttons to show values from localStorage (admin-set modifiers)
 function updateConditionButtonsFromStorage() {
     console.log('🔄 Updating condition buttons with admin-set modifier values...');
@@ -1968,7 +2142,7 @@ let quoteState = {
 };
 
 // Initialize - Only run quote-specific code on the quote page
-document.addEventListener('DOMContentLoaded', function() {
+document.addEventListener('DOMContentLoaded', async function() {
     // Check if we're on the quote page by looking for key elements
     const quoteWizard = document.querySelector('.quote-wizard');
     const brandSelectorExists = document.querySelector('[data-brand]');
@@ -2076,6 +2250,13 @@ document.addEventListener('DOMContentLoaded', function() {
         }, 200);
     }
     
+    // Direct links are matched through the model search index (model-search.js)
+    // and the brand's catalog bundle, which may list models the built-in
+    // database lacks. Neither promise rejects, so links still open without them.
+    if (brandParam && modelParam) {
+        await Promise.all([window.modelSearch && window.modelSearch.ready, loadBrandBundle(brandParam)]);
+    }
+
     if (brandParam && modelParam) {
         // Both brand and model provided - skip directly to Step 2
         console.log('================================================================================');
@@ -2119,6 +2300,16 @@ document.addEventListener('DOMContentLoaded', function() {
                 console.log('✅ Strategy 1 - Exact match found:', exactMatch);
             }
 
+            // Strategy 1b: Search index - aliases such as "S24 Ultra" or "Galaxy S24U"
+            if (!foundModel && window.modelSearch) {
+                const indexMatch = window.modelSearch.lookup(brandParam, normalizedModel);
+                if (indexMatch && availableModels.includes(indexMatch)) {
+                    foundModel = indexMatch;
+                    matchStrategy = 'Search index (name or alias)';
+                    console.log('✅ Strategy 1b - Search index match found:', indexMatch);
+                }
+            }
+
             // Strategy 2: Partial match - database model contains search term
             if (!foundModel) {
                 const partialMatch = availableModels.find(m =>
@@ -2365,6 +2556,11 @@ function showModels(brand) {
         return;
     }
 
+    // No admin data for this brand yet: show the built-in models now, the catalog once it arrives
+    if (loadBrandBundle(brand)) {
+        console.log(`📦 Fetching catalog bundle for ${brand}`);
+    }
+
     // Get models from database
     let modelsToDisplay = Object.keys(phoneDatabase[brand]);
     console.log('Models found in database:', modelsToDisplay.length, modelsToDisplay);
@@ -2422,10 +2618,12 @@ function showModels(brand) {
         
         // Get image from admin if available, otherwise use database image
         let imageUrl = model.image || 'images/phones/iphone-16-pro-max.jpg';
+        let placeholder = model.placeholder || '';
         if (typeof adminManager !== 'undefined' && adminManager && adminManager.phones) {
             const adminPhone = adminManager.phones.find(p => p.brand === brand && p.model === modelName);
             if (adminPhone && adminPhone.image) {
                 imageUrl = adminPhone.image;
+                placeholder = adminPhone.placeholder || '';
             }
         }
 
@@ -2485,10 +2683,16 @@ function showModels(brand) {
             }
         };
         
+        // Paint the thumbnail from the brand's sprite sheet when it has one (tools/sprites.py)
+        const spriteHtml = window.modelSprites
+            ? window.modelSprites.html(imageUrl, modelName, 'margin-bottom: 0.8rem; pointer-events: none;')
+            : '';
+
         card.innerHTML = `
-            <img src="${imageUrl}" alt="${modelName}"
-                 style="width: 70px; height: 90px; object-fit: contain; margin-bottom: 0.8rem; pointer-events: none;"
-                 onerror="this.onerror=null; this.src='images/phones/iphone-16-pro-max.jpg';">
+            ${spriteHtml || `<img src="${imageUrl}" alt="${modelName}"
+                 style="width: 70px; height: 90px; object-fit: contain; margin-bottom: 0.8rem; pointer-events: none; ${placeholderStyle(placeholder)}"
+                 onload="this.style.background='';"
+                 onerror="this.onerror=null; this.src='images/phones/iphone-16-pro-max.jpg';">`}
             <h4 style="color: #2c2c2c; font-size: 0.9rem; margin-bottom: 0.3rem; pointer-events: none;">${modelName}</h4>
             <p style="color: ${hasPriceData ? '#C9A84C' : '#dc3545'}; font-size: 0.85rem; font-weight: 600; pointer-events: none;">
                 From $${basePrice}
@@ -2497,6 +2701,9 @@ function showModels(brand) {
         `;
         
         modelGrid.appendChild(card);
+        if (!spriteHtml && window.responsiveImages) {
+            window.responsiveImages.apply(card.querySelector('img'), '70px');
+        }
         console.log(`Added model card ${index + 1}/${modelsToDisplay.length}:`, modelName);
     });
 
@@ -3064,6 +3271,23 @@ function updateLivePriceEstimate() {
         adminPhone = adminManager.phones.find(p => p.brand === quoteState.brand && p.model === quoteState.model);
     }
 
+    // Precomputed table covers base price, country and condition deductions in one lookup
+    const tablePrice = lookupQuoteTable(adminPhone, quoteState);
+    if (tablePrice !== null) {
+        price = tablePrice;
+        if (quoteState.deviceType !== 'used' && quoteState.hasReceipt) {
+            price += getModifierValue('receipt', quoteState.hasReceipt);
+        }
+        quoteState.issues.forEach(issue => {
+            price -= issue.deduction;
+        });
+        quoteState.accessories.forEach(acc => {
+            price += acc.bonus;
+        });
+        showPriceEstimate(estimatePriceEl, Math.max(0, price));
+        return;
+    }
+
     // Calculate price based on device type
     if (quoteState.deviceType === 'new-sealed') {
         // Use EXACT NEW SEALED price from admin data
@@ -3195,7 +3419,11 @@ function updateLivePriceEstimate() {
     // REMOVED: Math.max(50, price) - Prices should match backend exactly
     price = Math.max(0, price); // Only prevent negative prices
 
-    // Animate price update
+    showPriceEstimate(estimatePriceEl, price);
+}
+
+// Animate price update
+function showPriceEstimate(estimatePriceEl, price) {
     estimatePriceEl.textContent = '$' + price.toLocaleString();
     estimatePriceEl.style.transform = 'scale(1.1)';
     setTimeout(() => {
@@ -3402,7 +3630,7 @@ function displayQuoteResult() {
     else if (quoteState.deviceType === 'new-activated') deviceTypeDisplay = 'New Activated';
     
     document.getElementById('quote-device-name').textContent = quoteState.model;
-    safeSetImageSrc(document.getElementById('quote-device-image'), model.image, true);
+    safeSetImageSrc(document.getElementById('quote-device-image'), model.image, true, model.placeholder);
     
     // Show device type, storage, color, and condition (only for used)
     let specsText = `${deviceTypeDisplay} - ${quoteState.storage} - ${quoteState.color}`;
@@ -0,0 +1,120 @@
+/**
+ * RESPONSIVE PHONE IMAGES
+ * =======================
+ * Adds a srcset to images/phones/* images using the widths built by
+ * `python -m tools.responsive` (data/responsive-images.json), so a small
+ * model card downloads a 160px AVIF/WebP instead of the full vendor image.
+ *
+ * Images set before the manifest has loaded are upgraded once it arrives.
+ * If the manifest is missing the images simply keep their original src.
+ */
+
+(function() {
+    const MANIFEST_URL = 'data/responsive-images.json';
+    const PHONE_PREFIX = 'images/phones/';
+    const DEFAULT_SIZES = '(max-width: 480px) 100vw, 400px';
+
+    let manifest = null;
+    let format = 'jpeg';
+    let unavailable = false;
+    const pending = new Set();
+
+    function supportsWebp() {
+        try {
+            const canvas = document.createElement('canvas');
+            canvas.width = canvas.height = 1;
+            return canvas.toDataURL('image/webp').startsWith('data:image/webp');
+        } catch (e) {
+            return false;
+        }
+    }
+
+    function supportsAvif() {
+        return new Promise(resolve => {
+            const img = new Image();
+            img.onload = () => resolve(img.width > 0);
+            img.onerror = () => resolve(false);
+            img.src = 'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAADrbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAAB5pbG9jAAAAAEQAAAEAAQAAAAEAAAETAAAAIQAAAChpaW5mAAAAAAABAAAAGmluZmUCAAAAAAEAAGF2MDFDb2xvcgAAAABqaXBycAAAAEtpcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAABdpcG1hAAAAAAAAAAEAAQQBAoMEAAAAKW1kYXQSAAoIGAAGiAhoNCAyExlHh4Yhh5555oAAAJBAyRxgimo=';
+        });
+    }
+
+    /**
+     * Manifest key for an image src, e.g. "images/phones/x.jpg?t=1" -> "x.jpg"
+     */
+    function lookup(src) {
+        if (!manifest || !src || src.startsWith('data:')) return null;
+        const path = src.split('?')[0];
+        const index = path.indexOf(PHONE_PREFIX);
+        if (index === -1) return null;
+        const name = path.slice(index + PHONE_PREFIX.length);
+        return manifest.images[name] ? name : null;
+    }
+
+    function srcsetFor(src) {
+        const name = lookup(src);
+        if (!name) return '';
+
+        const entry = manifest.images[name];
+        const stem = name.replace(/\.[^.]+$/, '');
+        const ext = manifest.extensions[format];
+        // Variant names carry the source hash, so a replaced image gets new URLs
+        const hash = entry.sha256.slice(0, manifest.hashLength);
+        return entry.widths.map(width => {
+            const url = manifest.path
+                .replace('{name}', stem)
+                .replace('{width}', width)
+                .replace('{hash}', hash)
+                .replace('{ext}', ext);
+            return `${url} ${width}w`;
+        }).join(', ');
+    }
+
+    /**
+     * Give an <img> a srcset for its current src.
+     * @param {HTMLImageElement} img - The image element
+     * @param {string} sizes - Optional sizes attribute (rendered CSS width)
+     */
+    function apply(img, sizes) {
+        if (!img) return;
+        if (sizes) img.dataset.sizes = sizes;
+
+        if (!manifest) {
+            if (!unavailable) pending.add(img);
+            return;
+        }
+
+        const srcset = srcsetFor(img.getAttribute('src'));
+        if (!srcset) {
+            img.removeAttribute('srcset');
+            return;
+        }
+
+        img.sizes = img.dataset.sizes || DEFAULT_SIZES;
+        img.srcset = srcset;
+
+        // If a variant is missing, fall back to the plain src (and its onerror)
+        img.addEventListener('error', () => img.removeAttribute('srcset'), { once: true });
+    }
+
+    const ready = Promise.all([supportsAvif(), fetch(MANIFEST_URL)])
+        .then(([avif, response]) => {
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return response.json().then(data => {
+                if (avif && data.formats.includes('avif')) {
+                    format = 'avif';
+                } else if (supportsWebp() && data.formats.includes('webp')) {
+                    format = 'webp';
+                }
+                manifest = data;
+                pending.forEach(img => apply(img));
+                pending.clear();
+            });
+        })
+        .catch(err => {
+            console.warn('⚠️ Responsive image manifest not available, using original images:', err.message);
+            unavailable = true;
+            pending.clear();
+        });
+
+    window.responsiveImages = { apply, srcsetFor, ready };
+})();
@@ -154,6 +154,11 @@ function safeSetImageSrc(imgElement, imageSrc, addCacheBusting = true) {
     }
 
     imgElement.src = finalSrc;
+
+    // Serve a right-sized variant when tools/responsive.py has built one
+    if (window.responsiveImages) {
+        window.responsiveImages.apply(imgElement);
+    }
 }
 
 // ============================================================================
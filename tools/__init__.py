@@ -0,0 +1,5 @@
+"""
+Python tooling for the iBox Mobile site (image fetching and builds).
+
+Run the tools from the repository root, e.g. ``python -m tools.fetch``.
+"""
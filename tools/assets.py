@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Static Asset Build
+
+Prepares the deploy artifact (_site/, assembled by the deploy workflow)
+for long-lived browser caching. It rewrites files in place, so run it on
+that copy, never on the working tree:
+
+1. Every root-level .js and .css file is minified (rjsmin / rcssmin) and
+   written next to the original as <name>.<hash>.<ext>. The hash is the
+   first 12 hex digits of the minified file's SHA-256.
+2. References in HTML (src= / href=, any ?v= query dropped) and in other
+   assets (the firebase-config.js module import) are rewritten to the
+   fingerprinted names. Assets are fingerprinted leaves first, so a
+   changed import also renames its importer.
+3. Text files (HTML, JS, CSS, JSON, SVG) of at least 1 KB get .gz and .br
+   siblings, compressed in a process pool. Compressed output is cached in
+   .cache/compressed by content hash, so unchanged files are copied from
+   the previous deploy instead of recompressed (brotli at quality 11 is
+   slow). Cache entries no file used this run are deleted.
+4. _headers gives fingerprinted assets, data/bundles chunks and
+   images/sprites sheets a one-year immutable Cache-Control, and HTML,
+   data/bundles/index.json, data/sprites.json and data/search-index.json
+   no-cache.
+
+The original files keep their names too, for bookmarks and scripts that
+still load them directly.
+
+GitHub Pages compresses responses itself and ignores _headers. The
+siblings and headers take effect on hosts that serve them (Netlify,
+Cloudflare Pages, nginx gzip_static / brotli_static).
+
+Requirements:
+    pip install rjsmin rcssmin brotli
+
+Run:
+    python -m tools.assets _site
+    python -m tools.assets _site --jobs 4
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import brotli
+import rcssmin
+import rjsmin
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPRESS_CACHE_DIR = ROOT / '.cache' / 'compressed'
+HASH_LENGTH = 12
+ASSET_SUFFIXES = ('.js', '.css')
+COMPRESS_SUFFIXES = {'.html', '.js', '.css', '.json', '.svg'}
+COMPRESS_MIN_SIZE = 1024
+BUNDLE_DIR = Path('data') / 'bundles'
+SPRITE_DIR = Path('images') / 'sprites'
+FINGERPRINTED = re.compile(rf'\.[0-9a-f]{{{HASH_LENGTH}}}\.(js|css)$')
+
+IMMUTABLE = 'public, max-age=31536000, immutable'
+REVALIDATE = 'no-cache'
+
+
+class AssetError(Exception):
+    """The site can't be fingerprinted (e.g. assets import each other in a cycle)."""
+
+
+def fingerprint_name(name, sha):
+    """'quote.js', 'ab12...' -> 'quote.ab12....js'"""
+    stem, suffix = name.rsplit('.', 1)
+    return f"{stem}.{sha[:HASH_LENGTH]}.{suffix}"
+
+
+def reference_pattern(names):
+    """Quoted or url()-wrapped references to any of names, with an optional ./ and ?query."""
+    alternatives = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+    return re.compile(rf'(?<=["\'(])(\./)?({alternatives})(?:\?[^"\'()\s]*)?(?=["\')])')
+
+
+def rewrite(text, pattern, mapping):
+    return pattern.sub(lambda m: (m.group(1) or '') + mapping.get(m.group(2), m.group(2)), text)
+
+
+def minify(name, text):
+    return rjsmin.jsmin(text) if name.endswith('.js') else rcssmin.cssmin(text)
+
+
+def dependency_order(texts, pattern):
+    """Asset names ordered so every asset comes after the assets it references."""
+    deps = {name: {m.group(2) for m in pattern.finditer(text)} - {name}
+            for name, text in texts.items()}
+    ordered, done, visiting = [], set(), set()
+
+    def visit(name):
+        if name in done:
+            return
+        if name in visiting:
+            raise AssetError(f"reference cycle through {name}")
+        visiting.add(name)
+        for dep in sorted(deps[name]):
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+        ordered.append(name)
+
+    for name in sorted(texts):
+        visit(name)
+    return ordered
+
+
+def fingerprint(site):
+    """Write minified, fingerprinted copies. Returns {name: (fingerprinted name, raw bytes, min bytes)}."""
+    site = Path(site)
+    texts = {p.name: p.read_text(encoding='utf-8') for p in sorted(site.iterdir())
+             if p.is_file() and p.suffix in ASSET_SUFFIXES and not FINGERPRINTED.search(p.name)}
+    pattern = reference_pattern(texts)
+    mapping, results = {}, {}
+    for name in dependency_order(texts, pattern):
+        data = minify(name, rewrite(texts[name], pattern, mapping)).encode('utf-8')
+        mapping[name] = fingerprint_name(name, hashlib.sha256(data).hexdigest())
+        (site / mapping[name]).write_bytes(data)
+        results[name] = (mapping[name], len(texts[name].encode('utf-8')), len(data))
+    return results, pattern, mapping
+
+
+def rewrite_html(site, pattern, mapping):
+    """Point every HTML page at the fingerprinted assets. Returns the pages changed."""
+    changed = []
+    for page in sorted(Path(site).rglob('*.html')):
+        text = page.read_text(encoding='utf-8')
+        updated = rewrite(text, pattern, mapping)
+        if updated != text:
+            page.write_text(updated, encoding='utf-8')
+            changed.append(page)
+    return changed
+
+
+COMPRESSORS = {
+    '.gz': lambda data: gzip.compress(data, 9, mtime=0),
+    '.br': lambda data: brotli.compress(data, quality=11),
+}
+
+
+def compress(path, cache_dir):
+    """
+    Worker: write .gz and .br siblings where they are smaller.
+    Returns (path, sha, size, gz size, br size, cache hits).
+    """
+    path, cache_dir = Path(path), Path(cache_dir)
+    data = path.read_bytes()
+    sha = hashlib.sha256(data).hexdigest()
+    sizes, hits = [], 0
+    for suffix, compressor in COMPRESSORS.items():
+        cached = cache_dir / f"{sha}{suffix}"
+        if cached.exists():
+            packed = cached.read_bytes()
+            hits += 1
+        else:
+            packed = compressor(data)
+            tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(packed)
+            os.replace(tmp, cached)
+        if len(packed) < len(data):
+            path.with_name(path.name + suffix).write_bytes(packed)
+            sizes.append(len(packed))
+        else:
+            sizes.append(None)
+    return str(path), sha, len(data), *sizes, hits
+
+
+def compress_site(site, jobs=None, cache_dir=COMPRESS_CACHE_DIR):
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    paths = [p for p in sorted(Path(site).rglob('*'))
+             if p.is_file() and p.suffix in COMPRESS_SUFFIXES and p.stat().st_size >= COMPRESS_MIN_SIZE]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(compress, paths, [cache_dir] * len(paths), chunksize=8))
+
+    used = {f"{r[1]}{suffix}" for r in results for suffix in COMPRESSORS}
+    for entry in cache_dir.iterdir():
+        if entry.name not in used:
+            entry.unlink()
+    return results
+
+
+def bundle_chunks(site):
+    """Chunk files listed in data/bundles/index.json (see tools/bundles.py)."""
+    index_path = Path(site) / BUNDLE_DIR / 'index.json'
+    if not index_path.exists():
+        return []
+    with open(index_path, encoding='utf-8') as f:
+        return [entry['file'] for entry in json.load(f)['brands'].values()]
+
+
+def render_headers(site, fingerprinted):
+    """Netlify / Cloudflare Pages _headers file."""
+    site = Path(site)
+    rules = [(f"/{name}", IMMUTABLE) for name in sorted(fingerprinted)]
+    rules += [(f"/{BUNDLE_DIR.as_posix()}/{name}", IMMUTABLE) for name in bundle_chunks(site)]
+    if (site / BUNDLE_DIR / 'index.json').exists():
+        rules.append((f"/{BUNDLE_DIR.as_posix()}/index.json", REVALIDATE))
+    sprites = site / SPRITE_DIR
+    if sprites.exists():
+        rules += [(f"/{SPRITE_DIR.as_posix()}/{path.name}", IMMUTABLE) for path in sorted(sprites.iterdir())]
+    for name in ('sprites.json', 'search-index.json'):
+        if (site / 'data' / name).exists():
+            rules.append((f"/data/{name}", REVALIDATE))
+    for page in sorted(site.rglob('*.html')):
+        rules.append(('/' + page.relative_to(site).as_posix(), REVALIDATE))
+    if (site / 'index.html').exists():
+        rules.append(('/', REVALIDATE))
+    return ''.join(f"{path}\n  Cache-Control: {value}\n" for path, value in rules)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.assets',
+                                     description='Minify, fingerprint and precompress the deploy artifact.')
+    parser.add_argument('site', type=Path, help='deploy artifact directory (e.g. _site)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='compression processes (default: CPU count)')
+    parser.add_argument('--cache', type=Path, default=COMPRESS_CACHE_DIR,
+                        help='compressed output cache (default: .cache/compressed)')
+    args = parser.parse_args(argv)
+
+    if args.site.resolve() == ROOT:
+        print("[FAIL] Refusing to rewrite the working tree; pass the deploy artifact directory")
+        return 1
+
+    print("=" * 80)
+    print("BUILDING STATIC ASSETS")
+    print("=" * 80)
+    try:
+        results, pattern, mapping = fingerprint(args.site)
+    except AssetError as e:
+        print(f"[FAIL] {e}")
+        return 1
+    for name, (hashed, raw, minified) in results.items():
+        print(f"  [OK] {name} -> {hashed} ({raw / 1024:.1f} KB -> {minified / 1024:.1f} KB)")
+
+    pages = rewrite_html(args.site, pattern, mapping)
+    headers = render_headers(args.site, mapping.values())
+    (args.site / '_headers').write_text(headers, encoding='utf-8')
+    compressed = compress_site(args.site, args.jobs, args.cache)
+
+    raw = sum(r[1] for r in results.values())
+    minified = sum(r[2] for r in results.values())
+    brotli_sizes = {Path(path).name: br for path, _, _, _, br, _ in compressed if br}
+    brotli_assets = sum(brotli_sizes.get(hashed, size) for hashed, _, size in results.values())
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Assets fingerprinted: {len(results)} ({raw / 1024:.1f} KB -> {minified / 1024:.1f} KB minified, "
+          f"{brotli_assets / 1024:.1f} KB brotli)")
+    print(f"HTML pages rewritten: {len(pages)}")
+    print(f"Precompressed files: {len(compressed)} "
+          f"({sum(c[2] for c in compressed) / 1024:.1f} KB -> "
+          f"{sum(c[4] or c[2] for c in compressed) / 1024:.1f} KB brotli, "
+          f"{sum(c[5] for c in compressed)} of {len(compressed) * len(COMPRESSORS)} from cache)")
+    print(f"Cache rules: {headers.count('Cache-Control')} in {args.site / '_headers'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
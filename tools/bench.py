@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Image Fetch Benchmark
+
+Measures the download pipeline in tools/fetch.py offline. It starts the
+fixture server (tools/fixtureserver.py) and then fetches every image
+through a fresh Fetcher once per worker count. Each worker count runs in
+its own child process, so peak RSS is measured per run.
+
+Each run has two passes:
+
+    cold   empty output directory, every image is downloaded
+    warm   same manifest again, every image is revalidated (304)
+
+Reported per pass: images/sec, p50/p99 per-file latency, MB/s and
+failures; per run: peak RSS of the child process. Every job also gets a
+second (mirror) URL on the fixture server, so injected faults exercise
+the fallback path.
+
+--save writes the results as a baseline, and --compare fails (exit 1) when
+a later run is slower than that baseline by more than --tolerance.
+
+Requirements:
+    pip install requests
+
+Run:
+    python -m tools.bench
+    python -m tools.bench --workers 1 4 16 32 --latency 0.05 --jitter 0.03
+    python -m tools.bench --error-rate 0.05 --stall-rate 0.02 --stall-seconds 3
+    python -m tools.bench --save .cache/bench-baseline.json
+    python -m tools.bench --compare .cache/bench-baseline.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from tools.fixtureserver import CONTENT_TYPES, FixtureServer, add_fault_arguments, faults_from_args
+from tools.manifest import write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_WORKERS = (1, 4, 16)
+DEFAULT_TOLERANCE = 0.2
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of values (0 <= q <= 1); 0.0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def summarize(results, wall):
+    latencies = [r.elapsed for r in results if r.ok]
+    transferred = sum(r.size for r in results)
+    return {
+        'files': len(results),
+        'failed': sum(1 for r in results if not r.ok),
+        'wall': round(wall, 3),
+        'imagesPerSec': round(len(results) / wall, 2) if wall else 0.0,
+        'p50': round(percentile(latencies, 0.5), 4),
+        'p99': round(percentile(latencies, 0.99), 4),
+        'mbPerSec': round(transferred / (1024 * 1024) / wall, 2) if wall else 0.0,
+        'bytes': transferred,
+    }
+
+
+def run_child(spec):
+    """Child process: fetch every fixture twice (cold, then warm) and measure."""
+    from tools.fetch import FetchJob, Fetcher
+    from tools.manifest import Manifest
+
+    base = spec['baseUrl']
+    jobs = [FetchJob(name, [f"{base}/{name}", f"{base}/{name}?mirror=1"], True)
+            for name in spec['files']]
+    timeout = (spec['timeout'], spec['timeout'])
+    passes = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        manifest = Manifest(Path(tmp) / 'manifest.json')
+        for label in ('cold', 'warm'):
+            with Fetcher(Path(tmp) / 'images', spec['workers'], spec['perHost'], spec['rate'],
+                         manifest, timeout=timeout) as fetcher:
+                started = time.perf_counter()
+                results = fetcher.run(jobs)
+                passes[label] = summarize(results, time.perf_counter() - started)
+    return {'workers': spec['workers'], 'passes': passes, 'peakRssMb': peak_rss_mb()}
+
+
+def run_benchmark(images, faults, worker_counts, timeout, per_host=None, rate=0.0):
+    """Start the fixture server and run one child process per worker count."""
+    results = []
+    with FixtureServer(images, faults) as server:
+        files = sorted(server.fixtures)
+        for workers in worker_counts:
+            spec = {'baseUrl': server.base_url, 'files': files, 'workers': workers,
+                    'perHost': per_host or workers, 'rate': rate, 'timeout': timeout}
+            proc = subprocess.run([sys.executable, '-m', 'tools.bench', '--child', json.dumps(spec)],
+                                  cwd=ROOT, capture_output=True, text=True)
+            if proc.returncode != 0:
+                raise RuntimeError(f"benchmark child failed (workers={workers}):\n{proc.stderr}")
+            run = json.loads(proc.stdout.strip().splitlines()[-1])
+            results.append(run)
+            cold = run['passes']['cold']
+            print(f"  [OK] workers={workers}: {cold['imagesPerSec']} images/s cold, "
+                  f"{run['passes']['warm']['imagesPerSec']} images/s warm")
+        requests_served = server.requests
+    return {'files': len(files), 'faults': vars(faults), 'requests': requests_served, 'runs': results}
+
+
+def compare(report, baseline, tolerance):
+    """Regressions against a saved baseline, as human-readable lines."""
+    previous = {run['workers']: run for run in baseline['runs']}
+    regressions = []
+    for run in report['runs']:
+        old = previous.get(run['workers'])
+        if not old:
+            continue
+        for label, new_pass in run['passes'].items():
+            old_pass = old['passes'][label]
+            if new_pass['imagesPerSec'] < old_pass['imagesPerSec'] * (1 - tolerance):
+                regressions.append(f"workers={run['workers']} {label}: {new_pass['imagesPerSec']} images/s "
+                                   f"(baseline {old_pass['imagesPerSec']})")
+            if old_pass['p99'] and new_pass['p99'] > old_pass['p99'] * (1 + tolerance):
+                regressions.append(f"workers={run['workers']} {label}: p99 {new_pass['p99'] * 1000:.0f} ms "
+                                   f"(baseline {old_pass['p99'] * 1000:.0f} ms)")
+    return regressions
+
+
+def print_report(report):
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Images: {report['files']}, requests served: {report['requests']}\n")
+    print(f"{'workers':>7} {'pass':>5} {'img/s':>8} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'MB/s':>7} {'failed':>6} {'RSS MB':>7}")
+    for run in report['runs']:
+        rss = f"{run['peakRssMb']:.1f}" if run['peakRssMb'] is not None else 'n/a'
+        for label, p in run['passes'].items():
+            print(f"{run['workers']:>7} {label:>5} {p['imagesPerSec']:>8.1f} {p['p50'] * 1000:>8.1f} "
+                  f"{p['p99'] * 1000:>8.1f} {p['mbPerSec']:>7.2f} {p['failed']:>6} {rss:>7}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.bench',
+                                     description='Benchmark the image fetch pipeline against a local fixture server.')
+    parser.add_argument('--workers', type=int, nargs='+', default=list(DEFAULT_WORKERS),
+                        help=f"worker counts to compare (default: {' '.join(map(str, DEFAULT_WORKERS))})")
+    parser.add_argument('--per-host', type=int, default=None,
+                        help='concurrent requests per host (default: same as workers)')
+    parser.add_argument('--rate', type=float, default=0.0,
+                        help='request starts per second per host, 0 = unlimited (default: 0)')
+    parser.add_argument('--timeout', type=float, default=2.0,
+                        help='connect/read timeout of the fetcher in seconds (default: 2)')
+    parser.add_argument('--save', type=Path, help='write the results as a baseline')
+    parser.add_argument('--compare', type=Path, help='baseline to check for regressions')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'allowed slowdown against the baseline (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_child(json.loads(args.child))))
+        return 0
+
+    if not args.images.is_dir():
+        print(f"[FAIL] Fixture directory not found: {args.images}")
+        return 1
+
+    faults = faults_from_args(args)
+    print("=" * 80)
+    print("IMAGE FETCH BENCHMARK")
+    print("=" * 80)
+    print(f"Fixtures: {args.images} ({', '.join(sorted(set(CONTENT_TYPES.values())))})")
+    print(f"Faults: latency {faults.latency}s +/- {faults.jitter}s, errors {faults.error_rate:.0%}, "
+          f"html {faults.html_rate:.0%}, slow {faults.slow_rate:.0%}, stalls {faults.stall_rate:.0%}\n")
+
+    report = run_benchmark(args.images, faults, args.workers, args.timeout, args.per_host, args.rate)
+    print_report(report)
+
+    if args.save:
+        write_json_atomic(args.save, report)
+        print(f"\nBaseline saved to: {args.save}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        if regressions:
+            print(f"\n[FAIL] Slower than {args.compare} by more than {args.tolerance:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"\n[OK] Within {args.tolerance:.0%} of {args.compare}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
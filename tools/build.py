@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental Site Build
+
+Runs the generated-data steps of the deploy build, skipping every step
+whose inputs are unchanged since its last run (see tools/buildgraph.py):
+
+    placeholders  images/phones                         -> data/image-placeholders.json
+    prices        Excel price lists, phone-colors.json  -> import-exact-prices.js
+    quotetable    Excel price lists, admin-data.json    -> data/quote-table.json
+    bundles       Excel price lists, phone-colors.json  -> data/bundles/
+    responsive    images/phones                         -> images/responsive/
+    sprites       catalog image list, images/phones     -> images/sprites/
+    searchindex   Excel price lists, phone-colors.json  -> data/search-index.json
+
+A step's own tool modules count as inputs, so editing a tool reruns its
+step. The price steps take a few milliseconds each and run inside this
+process, without paying for a new interpreter and imports. In-process
+steps run in list order, so placeholders are fresh before the catalog
+steps embed them. The responsive step runs as a separate process
+alongside them; --jobs sets its worker pool, which only re-encodes
+images whose hash changed. The sprite sheets depend on which models the
+catalog lists, not on their prices, so the sprites step is keyed on the
+catalog's image list instead of the workbook files. A price edit in a
+workbook therefore rebuilds in well under a second and leaves the
+images alone.
+
+The responsive step exits 1 when some images can't be decoded. Those
+images keep serving their original file, so the step is recorded as a
+warning rather than rerun on every build.
+
+Requirements:
+    pip install openpyxl numpy pillow
+
+Run:
+    python -m tools.build
+    python -m tools.build --jobs 4
+    python -m tools.build --only prices bundles --verbose
+    python -m tools.build --force    # ignore the graph, rerun every step
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from tools.buildgraph import GRAPH_PATH, BuildGraph
+from tools.bundles import INDEX_NAME, OUTPUT_DIR as BUNDLES_DIR
+from tools.prices import COLORS_PATH, EXCEL_DIR, PLACEHOLDERS_PATH, WORKBOOK_GLOB, WorkbookError, \
+    OUTPUT_PATH as PRICES_PATH
+from tools.quotetable import ADMIN_DATA_PATH, OUTPUT_PATH as QUOTE_TABLE_PATH
+from tools.responsive import IMAGE_SUFFIXES, IMAGES_DIR, MANIFEST_PATH as RESPONSIVE_MANIFEST, \
+    OUTPUT_DIR as RESPONSIVE_DIR
+from tools.searchindex import OUTPUT_PATH as SEARCH_INDEX_PATH
+from tools.sprites import MAP_PATH as SPRITE_MAP, OUTPUT_DIR as SPRITES_DIR, catalog_images
+
+ROOT = Path(__file__).resolve().parent.parent
+TOOLS_DIR = ROOT / 'tools'
+
+
+@dataclass
+class Step:
+    name: str
+    command: list                # python -m arguments
+    inputs: Callable[[], list]   # files read by the step
+    outputs: Callable[[], list]  # files written by the step
+    parallel: bool = False       # pass --jobs through
+    isolated: bool = False       # run as a separate process
+    allow_failure: bool = False  # record exit code 1 as a warning
+    params: Callable[[], dict] = dict  # extra values the outputs depend on
+
+
+def tool_sources(*modules):
+    return [TOOLS_DIR / f"{module}.py" for module in modules]
+
+
+def workbooks():
+    return sorted(EXCEL_DIR.glob(WORKBOOK_GLOB))
+
+
+def sprite_params():
+    """The catalog's image names per brand: all the sprites step takes from the workbooks."""
+    try:
+        return {'images': catalog_images()}
+    except WorkbookError:
+        return {}  # the step itself reports the missing workbooks
+
+
+def files_in(directory, suffixes=None):
+    directory = Path(directory)
+    if not directory.exists():
+        return []
+    return sorted(p for p in directory.iterdir()
+                  if p.is_file() and not p.name.startswith('.')
+                  and (suffixes is None or p.suffix.lower() in suffixes))
+
+
+STEPS = [
+    Step('placeholders', ['tools.placeholders'],
+         lambda: [*files_in(IMAGES_DIR, IMAGE_SUFFIXES), *tool_sources('placeholders', 'prices', 'manifest')],
+         lambda: [PLACEHOLDERS_PATH],
+         parallel=True),
+    Step('prices', ['tools.prices'],
+         lambda: [*workbooks(), COLORS_PATH, PLACEHOLDERS_PATH, *tool_sources('prices', 'manifest')],
+         lambda: [PRICES_PATH]),
+    Step('quotetable', ['tools.quotetable'],
+         lambda: [*workbooks(), ADMIN_DATA_PATH, *tool_sources('quotetable', 'prices', 'manifest')],
+         lambda: [QUOTE_TABLE_PATH]),
+    Step('bundles', ['tools.bundles'],
+         lambda: [*workbooks(), COLORS_PATH, PLACEHOLDERS_PATH, *tool_sources('bundles', 'prices', 'manifest')],
+         lambda: [BUNDLES_DIR / INDEX_NAME, *[p for p in files_in(BUNDLES_DIR) if p.name != INDEX_NAME]]),
+    Step('responsive', ['tools.responsive'],
+         lambda: [*files_in(IMAGES_DIR, IMAGE_SUFFIXES), *tool_sources('responsive', 'imagestore', 'manifest')],
+         lambda: [RESPONSIVE_MANIFEST, *files_in(RESPONSIVE_DIR)],
+         parallel=True, isolated=True, allow_failure=True),
+    Step('sprites', ['tools.sprites'],
+         lambda: [*files_in(IMAGES_DIR, IMAGE_SUFFIXES), *tool_sources('sprites', 'bundles', 'prices')],
+         lambda: [SPRITE_MAP, *files_in(SPRITES_DIR)],
+         params=sprite_params),
+    Step('searchindex', ['tools.searchindex'],
+         lambda: [*workbooks(), COLORS_PATH, *tool_sources('searchindex', 'prices', 'manifest')],
+         lambda: [SEARCH_INDEX_PATH]),
+]
+
+
+def run_step(step, graph, jobs, force=False):
+    """Returns (status, seconds, changed inputs, captured output)."""
+    inputs = step.inputs()
+    params = {'command': step.command, **step.params()}
+    if not force and graph.is_fresh(step.name, inputs, step.outputs(), params):
+        return 'SAME', 0.0, [], ''
+
+    changed = graph.changed_inputs(step.name, inputs)
+    before = graph.snapshot(inputs)
+    started = time.perf_counter()
+    code, output = execute(step, jobs)
+    elapsed = time.perf_counter() - started
+
+    if code == 0 or (step.allow_failure and code == 1):
+        graph.record(step.name, before, step.outputs(), params)
+        status = 'OK' if code == 0 else 'WARN'
+    else:
+        graph.forget(step.name)
+        status = 'FAIL'
+    return status, elapsed, changed, output
+
+
+def execute(step, jobs):
+    """Run the step's tool; returns (exit code, captured output)."""
+    module, *args = step.command
+    if step.parallel:
+        args += ['--jobs', str(jobs)]
+    if step.isolated:
+        proc = subprocess.run([sys.executable, '-m', module, *args], cwd=ROOT, capture_output=True, text=True)
+        return proc.returncode, proc.stdout + proc.stderr
+
+    # Only called from the main thread: redirect_stdout is process-wide
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        try:
+            code = importlib.import_module(module).main(args)
+        except Exception:
+            output.write(traceback.format_exc())
+            code = 1
+    return code, output.getvalue()
+
+
+def run_build(steps, graph, jobs, force=False, verbose=False):
+    """Run the steps (isolated ones alongside the rest) and return {name: status}."""
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        isolated = {step.name: pool.submit(run_step, step, graph, jobs, force)
+                    for step in steps if step.isolated}
+        results = {step.name: run_step(step, graph, jobs, force) for step in steps if not step.isolated}
+        results.update({name: future.result() for name, future in isolated.items()})
+
+    statuses = {}
+    for step in steps:
+        status, elapsed, changed, output = results[step.name]
+        statuses[step.name] = status
+        if status == 'SAME':
+            print(f"  [SAME] {step.name}")
+            continue
+        reason = 'forced' if force else f"{len(changed)} input(s) changed"
+        if changed and len(changed) <= 3:
+            reason += ': ' + ', '.join(changed)
+        print(f"  [{status}] {step.name} ({elapsed:.2f}s, {reason})")
+        if verbose or status != 'OK':
+            for line in output.rstrip().splitlines():
+                print(f"      {line}")
+    graph.save()
+    return statuses
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.build',
+                                     description='Rebuild generated data and images whose inputs changed.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='image workers (default: CPU count)')
+    parser.add_argument('--only', nargs='+', choices=[step.name for step in STEPS], metavar='STEP',
+                        help=f"steps to consider ({', '.join(step.name for step in STEPS)})")
+    parser.add_argument('--force', action='store_true', help='rerun steps even if up to date')
+    parser.add_argument('--graph', type=Path, default=GRAPH_PATH,
+                        help='build graph (default: .cache/build-graph.json)')
+    parser.add_argument('--verbose', action='store_true', help="print each step's output")
+    args = parser.parse_args(argv)
+
+    steps = [step for step in STEPS if not args.only or step.name in args.only]
+    print("=" * 80)
+    print("INCREMENTAL BUILD")
+    print("=" * 80)
+    started = time.perf_counter()
+    statuses = run_build(steps, BuildGraph(args.graph), max(1, args.jobs), args.force, args.verbose)
+
+    counts = {status: sum(1 for s in statuses.values() if s == status) for status in ('OK', 'WARN', 'SAME', 'FAIL')}
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Rebuilt: {counts['OK'] + counts['WARN']} ({counts['WARN']} with warnings)")
+    print(f"Up to date: {counts['SAME']}")
+    print(f"Failed: {counts['FAIL']}")
+    print(f"Time: {time.perf_counter() - started:.2f}s")
+    return 1 if counts['FAIL'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Incremental Build Graph
+
+Persistent record of the last successful run of every build step in
+tools/build.py: the SHA-256 of each input and output file, plus the
+step's parameters. A step is up to date when its inputs hash the same
+and its outputs are still on disk as it left them.
+
+File hashes are cached by (size, mtime), so checking an unchanged tree
+reads no file contents. Both records are stored in
+.cache/build-graph.json and are safe to delete; the next build simply
+reruns every step.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+from tools.manifest import sha256_file, write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+GRAPH_PATH = ROOT / '.cache' / 'build-graph.json'
+GRAPH_VERSION = 1
+
+
+class BuildGraph:
+    """Thread-safe step -> {inputs, outputs, params} map backed by a JSON file."""
+
+    def __init__(self, path=GRAPH_PATH, root=ROOT):
+        self.path = Path(path)
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self.steps = {}
+        self.hashes = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == GRAPH_VERSION:
+                self.steps = data.get('steps', {})
+                self.hashes = data.get('hashes', {})
+
+    def _key(self, path):
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return str(path.resolve())
+
+    def sha(self, path):
+        """Content hash of path (None if missing), reusing the cached hash while size and mtime match."""
+        key = self._key(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            cached = self.hashes.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        sha = sha256_file(path)
+        with self._lock:
+            self.hashes[key] = [stat.st_size, stat.st_mtime_ns, sha]
+        return sha
+
+    def snapshot(self, paths):
+        return {self._key(path): self.sha(path) for path in sorted(set(map(Path, paths)))}
+
+    def is_fresh(self, step, inputs, outputs, params=None):
+        """True if step last ran with these inputs and params and its outputs are untouched."""
+        with self._lock:
+            record = self.steps.get(step)
+        if not record or record['params'] != (params or {}):
+            return False
+        if record['inputs'] != self.snapshot(inputs):
+            return False
+        current = self.snapshot(outputs)
+        return all(sha is not None for sha in current.values()) and record['outputs'] == current
+
+    def changed_inputs(self, step, inputs):
+        """Input files whose hash differs from the last run (all of them for a new step)."""
+        with self._lock:
+            record = self.steps.get(step)
+        previous = record['inputs'] if record else {}
+        return [key for key, sha in self.snapshot(inputs).items() if previous.get(key) != sha]
+
+    def record(self, step, inputs, outputs, params=None):
+        """inputs is the snapshot taken before the step ran; outputs are hashed now."""
+        entry = {'inputs': inputs, 'outputs': self.snapshot(outputs), 'params': params or {}}
+        with self._lock:
+            self.steps[step] = entry
+
+    def forget(self, step):
+        with self._lock:
+            self.steps.pop(step, None)
+
+    def save(self):
+        with self._lock:
+            # Drop hashes of files no step refers to any more
+            live = {key for entry in self.steps.values()
+                    for key in (*entry['inputs'], *entry['outputs'])}
+            data = {
+                'version': GRAPH_VERSION,
+                'steps': self.steps,
+                'hashes': {key: value for key, value in self.hashes.items() if key in live},
+            }
+        write_json_atomic(self.path, data)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Per-Brand Catalog Bundles
+
+Splits the Excel price catalog (see tools/prices.py) into one JSON chunk
+per brand, so a page only downloads the brand a customer clicks:
+
+    data/bundles/index.json              brand -> chunk file, hash, models
+    data/bundles/<brand>.<hash>.json     {"brand": ..., "phones": [...]}
+
+Chunk names carry the first 12 hex digits of the chunk's SHA-256. An
+unchanged brand keeps its file name across deploys, so browsers can cache
+it indefinitely; a changed brand gets a new name. Only index.json has to
+be revalidated (catalog-bundles.js fetches it with cache: 'no-cache').
+Phones are stored expanded, exactly as importExactPrices() writes them.
+Chunks no longer listed in the index are deleted.
+
+Requirements:
+    pip install openpyxl
+
+Run:
+    python -m tools.bundles
+"""
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from tools.manifest import write_text_atomic
+from tools.prices import (COLORS_PATH, EXCEL_DIR, PLACEHOLDERS_PATH, WORKBOOK_GLOB, WorkbookError,
+                          compact, derive_buy_prices, expand, load_colors, load_placeholders,
+                          read_workbooks)
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = ROOT / 'data' / 'bundles'
+INDEX_NAME = 'index.json'
+HASH_LENGTH = 12
+
+
+def brand_slug(brand):
+    """'Google Pixel' -> 'google-pixel'"""
+    return re.sub(r'[^a-z0-9]+', '-', brand.lower()).strip('-')
+
+
+def dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def build_bundles(excel_dir=EXCEL_DIR, colors_path=COLORS_PATH, placeholders_path=PLACEHOLDERS_PATH):
+    """Returns (index, {chunk file name: text})."""
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, _, sources = read_workbooks(paths)
+    derive_buy_prices(phones)
+
+    by_brand = {}
+    for record in compact(phones, load_colors(colors_path), load_placeholders(placeholders_path)):
+        by_brand.setdefault(record['brand'], []).append(expand(record))
+
+    index = {'version': 1, 'sources': sources, 'brands': {}}
+    chunks = {}
+    for brand, brand_phones in by_brand.items():
+        text = dumps({'brand': brand, 'phones': brand_phones})
+        sha = hashlib.sha256(text.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+        name = f"{brand_slug(brand)}.{sha}.json"
+        chunks[name] = text
+        index['brands'][brand] = {'file': name, 'sha': sha, 'models': len(brand_phones)}
+    return index, chunks
+
+
+def write_bundles(index, chunks, output_dir=OUTPUT_DIR):
+    """Write new chunks, then the index, then drop stale chunks. Returns (written, kept, removed)."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written, kept = [], []
+    for name, text in chunks.items():
+        path = output_dir / name
+        if path.exists():
+            # The name is the content hash, so an existing file is already correct
+            kept.append(name)
+        else:
+            write_text_atomic(path, text)
+            written.append(name)
+    # Index last: pages never see a chunk name that isn't on disk yet
+    write_text_atomic(output_dir / INDEX_NAME, dumps(index))
+
+    removed = []
+    for path in sorted(output_dir.glob('*.json')):
+        if path.name != INDEX_NAME and path.name not in chunks:
+            path.unlink()
+            removed.append(path.name)
+    return written, kept, removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.bundles',
+                                     description='Split the price catalog into content-hashed per-brand bundles.')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR,
+                        help='bundle directory (default: data/bundles)')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING CATALOG BUNDLES")
+    print("=" * 80)
+    try:
+        index, chunks = build_bundles(args.excel)
+    except WorkbookError as e:
+        print(f"[FAIL] {e}")
+        return 1
+
+    written, kept, removed = write_bundles(index, chunks, args.output)
+    for name in written:
+        print(f"  [OK] {name} ({len(chunks[name].encode('utf-8')) / 1024:.1f} KB)")
+    for name in kept:
+        print(f"  [SAME] {name}")
+    for name in removed:
+        print(f"  [SKIP] removed stale {name}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    for brand, entry in index['brands'].items():
+        print(f"{brand}: {entry['models']} models -> {entry['file']}")
+    print(f"Written: {len(written)}, unchanged: {len(kept)}, removed: {len(removed)}")
+    print(f"\n[OK] Index: {args.output / INDEX_NAME}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
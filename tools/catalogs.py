@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""
+Image Source Catalog
+
+Loads data/image-sources.json, the single list of where every image in
+images/phones comes from:
+
+    images        - filename -> ordered candidate URLs (newest fix first)
+    catalogs      - the old per-script groupings (download-*.py, fix-*.py):
+                    files to fetch, whether to overwrite existing files
+                    (fix-* scripts) and placeholders for unreleased models
+    refreshOrder  - catalog order for a full refresh
+
+Edit the JSON to add or reorder sources; the fetch engine re-ranks the
+candidates at run time from their recorded success rate and latency
+(see tools/sourcestats.py).
+"""
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES_PATH = ROOT / 'data' / 'image-sources.json'
+
+
+class CatalogError(Exception):
+    """data/image-sources.json is inconsistent."""
+
+
+def load_catalog(path=SOURCES_PATH):
+    with open(path, encoding='utf-8') as f:
+        catalog = json.load(f)
+
+    images = catalog['images']
+    for name, group in catalog['catalogs'].items():
+        missing = [filename for filename in group['files'] if not images.get(filename)]
+        if missing:
+            raise CatalogError(f"catalog {name!r} lists files without sources: {', '.join(missing)}")
+    unknown = [name for name in catalog['refreshOrder'] if name not in catalog['catalogs']]
+    if unknown:
+        raise CatalogError(f"refreshOrder names unknown catalogs: {', '.join(unknown)}")
+    return catalog
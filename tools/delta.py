@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+Catalog Delta Sync
+
+Structured deltas between two versions of a JSON catalog: an admin panel
+export (data/admin-data.json) or a dump of the cloud settings/priceDatabase
+document. A single price edit becomes a few bytes instead of a new copy
+of every phone.
+
+A delta document is RFC 6902 JSON Patch plus the hashes it applies to:
+
+    {
+      "format": "ibox-delta",
+      "version": 1,
+      "base": "<sha>",        document the ops apply to
+      "target": "<sha>",      document they produce
+      "created": "<ISO time>",
+      "ops": [{"op": "replace", "path": "/data/phones/3/basePrice", "value": 640}, ...]
+    }
+
+Hashes are the first 12 hex digits of the SHA-256 of the canonical JSON
+(sorted keys, no whitespace). apply refuses a delta whose base doesn't
+match, and checks the target after applying, so a delta can never be
+applied to the wrong document or applied twice.
+
+Ops are add, remove and replace. Lists of objects that all carry a
+unique "id" (phones, appointments) are diffed by id: removed ids are
+removed, changed fields are replaced in place, new ids are inserted at
+their position. A reordered list is replaced whole.
+
+A delta log is an NDJSON file of deltas, each based on the previous one's
+target. compact applies the log to its snapshot and empties it; --squash
+folds the log into a single delta and leaves the snapshot alone.
+
+Run:
+    python -m tools.delta diff OLD.json NEW.json -o change.delta.json
+    python -m tools.delta apply data/admin-data.json change.delta.json
+    python -m tools.delta append data/admin-data.deltas.ndjson OLD.json NEW.json
+    python -m tools.delta compact data/admin-data.json data/admin-data.deltas.ndjson
+    python -m tools.delta compact data/admin-data.json data/admin-data.deltas.ndjson --squash
+"""
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tools.manifest import write_json_atomic, write_text_atomic
+
+DELTA_FORMAT = 'ibox-delta'
+DELTA_VERSION = 1
+HASH_LENGTH = 12
+KEY_FIELD = 'id'
+
+
+class PatchError(Exception):
+    """A delta doesn't apply to the document it was given."""
+
+
+def canonical(doc):
+    return json.dumps(doc, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+
+def doc_hash(doc):
+    return hashlib.sha256(canonical(doc).encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+
+def pointer(path):
+    """['data', 'a/b', 3] -> '/data/a~1b/3'"""
+    return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1') for part in path)
+
+
+def split_pointer(path):
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise PatchError(f"bad path {path!r}")
+    return [part.replace('~1', '/').replace('~0', '~') for part in path[1:].split('/')]
+
+
+def same(a, b):
+    """
+    Equal scalars of the same JSON type (1, 1.0 and True all compare equal
+    in Python). Containers are never the same here; diff walks into them.
+    """
+    return type(a) is type(b) and not isinstance(a, (dict, list)) and a == b
+
+
+def keyed(items):
+    """Objects with a unique id each, or None."""
+    if not all(isinstance(item, dict) and KEY_FIELD in item for item in items):
+        return None
+    keys = [item[KEY_FIELD] for item in items]
+    return keys if len(set(map(canonical, keys))) == len(keys) else None
+
+
+def diff(old, new, path=(), ops=None):
+    """JSON Patch ops turning old into new."""
+    ops = [] if ops is None else ops
+    if same(old, new):
+        return ops
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': pointer([*path, key])})
+        for key, value in new.items():
+            if key in old:
+                diff(old[key], value, (*path, key), ops)
+            else:
+                ops.append({'op': 'add', 'path': pointer([*path, key]), 'value': value})
+    elif isinstance(old, list) and isinstance(new, list):
+        diff_list(old, new, path, ops)
+    else:
+        ops.append({'op': 'replace', 'path': pointer(path), 'value': new})
+    return ops
+
+
+def diff_list(old, new, path, ops):
+    old_keys, new_keys = keyed(old), keyed(new)
+    if old and new and old_keys is not None and new_keys is not None:
+        old_ids = [canonical(key) for key in old_keys]
+        new_ids = [canonical(key) for key in new_keys]
+        kept = set(old_ids) & set(new_ids)
+        if [i for i in old_ids if i in kept] != [i for i in new_ids if i in kept]:
+            ops.append({'op': 'replace', 'path': pointer(path), 'value': new})
+            return
+        # Removals from the end first, so earlier indexes stay valid
+        for index in reversed(range(len(old))):
+            if old_ids[index] not in kept:
+                ops.append({'op': 'remove', 'path': pointer([*path, index])})
+        old_by_id, new_by_id = dict(zip(old_ids, old)), dict(zip(new_ids, new))
+        for index, item_id in enumerate(i for i in old_ids if i in kept):
+            diff(old_by_id[item_id], new_by_id[item_id], (*path, index), ops)
+        # Inserting in ascending order lands every new item at its final index
+        for index, item_id in enumerate(new_ids):
+            if item_id not in kept:
+                ops.append({'op': 'add', 'path': pointer([*path, index]), 'value': new[index]})
+        return
+
+    for index in range(min(len(old), len(new))):
+        diff(old[index], new[index], (*path, index), ops)
+    for index in reversed(range(len(new), len(old))):
+        ops.append({'op': 'remove', 'path': pointer([*path, index])})
+    for index in range(len(old), len(new)):
+        ops.append({'op': 'add', 'path': pointer([*path, index]), 'value': new[index]})
+
+
+def make_delta(old, new):
+    return {
+        'format': DELTA_FORMAT,
+        'version': DELTA_VERSION,
+        'base': doc_hash(old),
+        'target': doc_hash(new),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'ops': diff(old, new),
+    }
+
+
+def resolve(doc, parts, op):
+    """Container holding the last part of the path."""
+    parent = doc
+    for part in parts[:-1]:
+        try:
+            parent = parent[int(part)] if isinstance(parent, list) else parent[part]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise PatchError(f"{op['op']} {op['path']}: no such path")
+    return parent
+
+
+def list_index(container, part, op, allow_end=False):
+    if allow_end and part == '-':
+        return len(container)
+    if not part.isdigit():
+        raise PatchError(f"{op['op']} {op['path']}: bad list index")
+    index = int(part)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise PatchError(f"{op['op']} {op['path']}: index out of range")
+    return index
+
+
+def apply_ops(doc, ops):
+    """New document with the ops applied; doc is left untouched."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        if op.get('op') in ('add', 'replace') and 'value' not in op:
+            raise PatchError(f"{op['op']} {op.get('path')}: no value")
+        parts = split_pointer(op.get('path', ''))
+        if not parts:
+            if op['op'] == 'remove':
+                raise PatchError('cannot remove the whole document')
+            doc = copy.deepcopy(op['value'])
+            continue
+        parent = resolve(doc, parts, op)
+        key = parts[-1]
+        if op['op'] == 'add':
+            if isinstance(parent, list):
+                parent.insert(list_index(parent, key, op, allow_end=True), copy.deepcopy(op['value']))
+            else:
+                parent[key] = copy.deepcopy(op['value'])
+        elif op['op'] in ('remove', 'replace'):
+            if isinstance(parent, list):
+                key = list_index(parent, key, op)
+            elif not isinstance(parent, dict) or key not in parent:
+                raise PatchError(f"{op['op']} {op['path']}: no such path")
+            if op['op'] == 'remove':
+                del parent[key]
+            else:
+                parent[key] = copy.deepcopy(op['value'])
+        else:
+            raise PatchError(f"unsupported op {op['op']!r}")
+    return doc
+
+
+def apply_delta(doc, delta):
+    if delta.get('format') != DELTA_FORMAT or delta.get('version') != DELTA_VERSION:
+        raise PatchError(f"not an {DELTA_FORMAT} v{DELTA_VERSION} document")
+    if doc_hash(doc) != delta['base']:
+        raise PatchError(f"delta is based on {delta['base']}, document is {doc_hash(doc)}")
+    result = apply_ops(doc, delta['ops'])
+    if doc_hash(result) != delta['target']:
+        raise PatchError(f"result is {doc_hash(result)}, delta expected {delta['target']}")
+    return result
+
+
+def load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_log(path):
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def write_log(path, deltas):
+    write_text_atomic(path, ''.join(canonical(delta) + '\n' for delta in deltas))
+
+
+def replay(snapshot, deltas):
+    doc = snapshot
+    for number, delta in enumerate(deltas, start=1):
+        try:
+            doc = apply_delta(doc, delta)
+        except PatchError as e:
+            raise PatchError(f"log entry {number}: {e}")
+    return doc
+
+
+def size(doc):
+    return len(canonical(doc).encode('utf-8'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.delta',
+                                     description='Diff, apply and compact JSON catalog deltas.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    diff_cmd = sub.add_parser('diff', help='write the delta from OLD to NEW')
+    diff_cmd.add_argument('old', type=Path)
+    diff_cmd.add_argument('new', type=Path)
+    diff_cmd.add_argument('-o', '--output', type=Path, help='delta file (default: stdout)')
+    apply_cmd = sub.add_parser('apply', help='apply deltas to a document in order')
+    apply_cmd.add_argument('document', type=Path)
+    apply_cmd.add_argument('deltas', type=Path, nargs='+')
+    apply_cmd.add_argument('-o', '--output', type=Path, help='result file (default: overwrite DOCUMENT)')
+    append_cmd = sub.add_parser('append', help='append the delta from OLD to NEW to a log')
+    append_cmd.add_argument('log', type=Path)
+    append_cmd.add_argument('old', type=Path)
+    append_cmd.add_argument('new', type=Path)
+    compact_cmd = sub.add_parser('compact', help="fold a log into its snapshot")
+    compact_cmd.add_argument('snapshot', type=Path)
+    compact_cmd.add_argument('log', type=Path)
+    compact_cmd.add_argument('--squash', action='store_true',
+                             help='merge the log into one delta instead of touching the snapshot')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'diff':
+            old, new = load_json(args.old), load_json(args.new)
+            delta = make_delta(old, new)
+            if args.output:
+                write_json_atomic(args.output, delta)
+                print(f"[OK] {len(delta['ops'])} op(s), {size(delta)} bytes "
+                      f"(full document: {size(new)} bytes) -> {args.output}")
+            else:
+                print(json.dumps(delta, indent=2, ensure_ascii=False))
+
+        elif args.command == 'apply':
+            doc = load_json(args.document)
+            for path in args.deltas:
+                delta = load_json(path)
+                doc = apply_delta(doc, delta)
+                print(f"  [OK] {path.name}: {len(delta['ops'])} op(s)")
+            output = args.output or args.document
+            write_json_atomic(output, doc)
+            print(f"[OK] Written: {output} ({doc_hash(doc)})")
+
+        elif args.command == 'append':
+            old, new = load_json(args.old), load_json(args.new)
+            deltas = read_log(args.log)
+            if deltas and deltas[-1]['target'] != doc_hash(old):
+                raise PatchError(f"log ends at {deltas[-1]['target']}, {args.old.name} is {doc_hash(old)}")
+            delta = make_delta(old, new)
+            if not delta['ops']:
+                print(f"[SAME] {args.new.name} matches {args.old.name}")
+                return 0
+            write_log(args.log, [*deltas, delta])
+            print(f"[OK] Appended {len(delta['ops'])} op(s), {size(delta)} bytes -> {args.log} "
+                  f"({len(deltas) + 1} entries)")
+
+        elif args.command == 'compact':
+            snapshot = load_json(args.snapshot)
+            deltas = read_log(args.log)
+            if not deltas:
+                print(f"[SAME] {args.log} is empty")
+                return 0
+            result = replay(snapshot, deltas)
+            before = sum(size(delta) for delta in deltas)
+            if args.squash:
+                squashed = make_delta(snapshot, result)
+                write_log(args.log, [squashed])
+                print(f"[OK] Squashed {len(deltas)} entries into 1: {before} -> {size(squashed)} bytes")
+            else:
+                write_json_atomic(args.snapshot, result)
+                write_log(args.log, [])
+                print(f"[OK] Folded {len(deltas)} entries ({before} bytes) into {args.snapshot} "
+                      f"({doc_hash(result)})")
+    except (OSError, ValueError, PatchError) as e:
+        print(f"[FAIL] {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,712 @@
+# -*- coding: utf-8 -*-
+"""
+Concurrent Image Fetch Engine
+
+Runs the image catalogs in data/image-sources.json (see tools/catalogs.py)
+through a bounded worker pool.
+Every host gets its own concurrency limit and request rate (replacing the
+old global time.sleep(0.5)), and all workers share one keep-alive
+connection pool, so a dead host only ties up its own slots.
+
+Every written file is recorded in data/image-manifest.json (see
+tools/manifest.py). Reruns revalidate those files with conditional GETs
+and leave them untouched on 304 Not Modified.
+
+Responses are validated while streaming: Content-Type and Content-Length
+are checked before the body is read, the first bytes must carry a
+JPEG/PNG/WebP signature, and a per-file byte cap applies. A bad response
+is aborted immediately, so HTML error pages and landing pages never land
+in images/phones.
+
+Bodies stream into a hidden .<name>.part file next to the target, which
+only replaces the live image (os.replace) once its length and hash check
+out. If the connection drops mid-body and the server supports ranges, the
+part file is kept and the transfer resumes with a Range/If-Range request,
+in the same run or the next one, instead of starting over.
+
+Downloads and placeholders go through the content-addressed store in
+tools/imagestore.py, so identical images share one blob via hardlinks.
+
+Each file's candidate URLs are tried best-first: every attempt's outcome
+and latency is kept in .cache/source-stats.json, and sources that keep
+failing or are slow drop behind healthy ones (tools/sourcestats.py).
+
+Within a run, 429 / 5xx responses and connection resets are retried with
+jittered exponential backoff (honouring Retry-After), and every host has
+a circuit breaker: after a few consecutive failures its remaining URLs
+are skipped for a cooldown, so files go straight to their alternate
+sources instead of each waiting out a timeout (tools/hosthealth.py).
+
+Every request is also timed (DNS, connect, TLS, time to first byte,
+total) with its status, bytes and retries. The run ends with a per-host
+latency table, .cache/fetch-report.json (per-host histograms) and one
+line per request appended to .cache/fetch-metrics.ndjson; --prometheus
+also writes the histograms in Prometheus text format
+(tools/fetchmetrics.py).
+
+Requirements:
+    pip install requests
+
+Run:
+    python -m tools.fetch                        # every catalog
+    python -m tools.fetch incorrect-images       # one or more catalogs
+    python -m tools.fetch --workers 32 --per-host 6
+    python -m tools.fetch --force                # ignore the manifest, re-download
+    python -m tools.fetch --flagged              # only files tools.phash flagged
+    python -m tools.fetch --list
+    python -m tools.fetch --prometheus /var/lib/node_exporter/fetch.prom
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tools.catalogs import SOURCES_PATH, load_catalog
+from tools.fetchmetrics import LOG_PATH, REPORT_PATH, FetchMetrics, TimedAdapter, print_hosts
+from tools.hosthealth import CircuitOpen, HostBreaker, is_host_failure, retry_after, retry_delay
+from tools.imagestore import IMAGES_DIR, ImageStore, write_aliases
+from tools.manifest import MANIFEST_PATH, Manifest, sha256_file, write_json_atomic
+from tools.sourcestats import SourceStats
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = ROOT / 'images' / 'phones'
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Fail fast on hosts that do not answer, but give slow CDNs time to stream
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 30
+CHUNK_SIZE = 64 * 1024  # small enough that a broken transfer keeps most of its bytes
+WRITE_BUFFER = 1024 * 1024
+
+# Extra attempts on the same URL when a transfer broke off but can resume
+RESUME_ATTEMPTS = 2
+
+# Largest image we accept; product shots are well under 200 KB
+MAX_IMAGE_BYTES = 1024 * 1024
+
+# Some CDNs serve images without a precise type; the signature check decides
+GENERIC_CONTENT_TYPES = {'application/octet-stream', 'binary/octet-stream'}
+
+DEFAULT_WORKERS = 16
+DEFAULT_PER_HOST = 4
+DEFAULT_RATE = 8.0  # request starts per second, per host
+
+
+@dataclass
+class FetchJob:
+    filename: str
+    urls: list
+    overwrite: bool = False
+
+
+@dataclass
+class FetchResult:
+    filename: str
+    status: str  # 'downloaded', 'unchanged', 'skipped' or 'failed'
+    url: str = None
+    size: int = 0  # bytes transferred
+    elapsed: float = 0.0
+    errors: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return self.status != 'failed'
+
+
+class InvalidResponse(Exception):
+    """The response is not an acceptable image; the download was aborted."""
+
+
+class Interrupted(Exception):
+    """The body broke off; the partial file was kept for a Range resume."""
+
+    def __init__(self, received, cause):
+        super().__init__(f"interrupted after {received / 1024:.0f} KB: {cause}")
+        self.received = received
+
+
+def host_of(url):
+    return urlsplit(url).hostname or ''
+
+
+def sniff_image(head):
+    """Image format from the leading bytes, or None if it isn't JPEG/PNG/WebP."""
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def part_paths(filepath):
+    """Hidden partial-download file and its resume metadata."""
+    filepath = Path(filepath)
+    part = filepath.with_name(f".{filepath.name}.part")
+    return part, part.with_name(part.name + '.json')
+
+
+def discard_part(filepath):
+    for path in part_paths(filepath):
+        if path.exists():
+            path.unlink()
+
+
+def content_range(response):
+    """(start, total) from a 206 Content-Range header; total may be None."""
+    match = re.match(r'bytes (\d+)-\d+/(\d+|\*)', response.headers.get('Content-Range', ''))
+    if not match:
+        return None, None
+    total = match.group(2)
+    return int(match.group(1)), int(total) if total.isdigit() else None
+
+
+def check_headers(response, max_bytes):
+    """Reject a response from its headers alone, before any body is read."""
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if content_type and not content_type.startswith('image/') and content_type not in GENERIC_CONTENT_TYPES:
+        raise InvalidResponse(f"Content-Type is {content_type}, not an image")
+
+    length = response.headers.get('Content-Length')
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise InvalidResponse(f"Content-Length {int(length) / 1024:.0f} KB exceeds {max_bytes / 1024:.0f} KB cap")
+
+
+class HostLimiter:
+    """Caps concurrent requests per host and spaces out their start times."""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, rate=DEFAULT_RATE):
+        self.per_host = max(1, per_host)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._slots = {}
+        self._next_start = {}
+
+    def _slot(self, host):
+        with self._lock:
+            if host not in self._slots:
+                self._slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[host]
+
+    def _wait_turn(self, host):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def defer(self, host, seconds):
+        """Hold back the host's next request start, e.g. for a Retry-After."""
+        with self._lock:
+            self._next_start[host] = max(self._next_start.get(host, 0.0), time.monotonic() + seconds)
+
+    @contextmanager
+    def limit(self, host):
+        slot = self._slot(host)
+        with slot:
+            self._wait_turn(host)
+            yield
+
+
+def make_session(pool_size, timed=False):
+    """
+    One session for all workers so connections are reused per host. A
+    timed session records connection setup into the request's metric.
+    """
+    session = requests.Session()
+    session.headers['User-Agent'] = USER_AGENT
+    adapter_cls = TimedAdapter if timed else HTTPAdapter
+    adapter = adapter_cls(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class Fetcher:
+    """Downloads FetchJobs into output_dir using a shared worker pool."""
+
+    def __init__(self, output_dir=OUTPUT_DIR, workers=DEFAULT_WORKERS,
+                 per_host=DEFAULT_PER_HOST, rate=DEFAULT_RATE, manifest=None,
+                 revalidate=True, store=None, max_bytes=MAX_IMAGE_BYTES, stats=None,
+                 timeout=(CONNECT_TIMEOUT, READ_TIMEOUT), metrics=None, breaker=None):
+        self.output_dir = Path(output_dir)
+        self.workers = max(1, workers)
+        self.max_bytes = max_bytes
+        self.manifest = manifest
+        self.store = store
+        self.stats = stats
+        self.metrics = metrics
+        self.breaker = breaker or HostBreaker()
+        self.timeout = timeout
+        self.revalidate = revalidate
+        self.limiter = HostLimiter(per_host, rate)
+        self.session = make_session(self.workers, timed=metrics is not None)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _previous_sha256(self, filename, filepath):
+        entry = self.manifest.get(filename) if self.manifest else None
+        if entry and filepath.exists() and filepath.stat().st_size == entry['size']:
+            return entry['sha256']
+        return sha256_file(filepath) if filepath.exists() else None
+
+    def _resume_state(self, url, filepath):
+        """(bytes on disk, If-Range validator) of a resumable part for url, or None."""
+        part, meta_path = part_paths(filepath)
+        if not (part.exists() and meta_path.exists()):
+            return None
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        validator = meta.get('etag') or meta.get('lastModified')
+        offset = part.stat().st_size
+        if meta.get('url') != url or not validator or not offset:
+            return None
+        if meta.get('total') and offset >= meta['total']:
+            return None
+        return offset, validator
+
+    def _download(self, filename, url, filepath, metric=None):
+        """
+        Stream url into a part file and move it over filepath on success.
+        A transfer that breaks off on a range-capable server keeps its part
+        file (raising Interrupted) so the next attempt resumes it.
+        Fills in metric (a RequestMetric), if given.
+        Returns (status, bytes transferred).
+        """
+        part, meta_path = part_paths(filepath)
+        resume = self._resume_state(url, filepath)
+        if resume:
+            headers = {'Range': f'bytes={resume[0]}-', 'If-Range': resume[1]}
+        elif self.manifest and self.revalidate:
+            headers = self.manifest.validators(filename, url, filepath)
+        else:
+            headers = {}
+
+        keep_part = False
+        try:
+            with self.limiter.limit(host_of(url)):
+                if self.breaker.rejects_waiting(host_of(url)):
+                    raise CircuitOpen(f"circuit open for {host_of(url)}")
+                if metric:
+                    metric.sent()
+                with self.session.get(url, headers=headers, stream=True,
+                                      timeout=self.timeout) as r:
+                    if metric:
+                        metric.status = r.status_code
+                        metric.ttfb = r.elapsed.total_seconds()
+                    if r.status_code == 304 and headers and not resume:
+                        if metric:
+                            metric.outcome = 'unchanged'
+                        return 'unchanged', 0
+                    r.raise_for_status()
+                    check_headers(r, self.max_bytes)
+
+                    offset, total = 0, None
+                    if r.status_code == 206 and resume:
+                        offset, total = content_range(r)
+                        if offset != resume[0]:
+                            raise InvalidResponse(f"Content-Range starts at {offset}, expected {resume[0]}")
+                    elif r.headers.get('Content-Length', '').isdigit() and not r.headers.get('Content-Encoding'):
+                        total = int(r.headers['Content-Length'])
+                    if total and total > self.max_bytes:
+                        raise InvalidResponse(f"image is {total / 1024:.0f} KB, over the {self.max_bytes / 1024:.0f} KB cap")
+
+                    etag = r.headers.get('ETag')
+                    last_modified = r.headers.get('Last-Modified')
+                    resumable = (r.status_code == 206 or r.headers.get('Accept-Ranges') == 'bytes') \
+                        and bool(etag or last_modified)
+                    if resumable and not offset:
+                        write_json_atomic(meta_path, {'url': url, 'etag': etag,
+                                                      'lastModified': last_modified, 'total': total})
+                    try:
+                        digest, size = self._stream_body(r, part, offset)
+                    except requests.RequestException as e:
+                        keep_part = resumable and part.exists()
+                        if keep_part:
+                            received = part.stat().st_size - offset
+                            if metric:
+                                metric.outcome, metric.bytes = 'interrupted', received
+                            raise Interrupted(received, e) from e
+                        raise
+
+            if total is not None and size != total:
+                raise InvalidResponse(f"got {size} bytes, expected {total}")
+            sha256 = digest.hexdigest()
+            if offset and self.manifest:
+                # A resumed file of a version we already know must hash the same
+                known = self.manifest.get(filename)
+                if known and known['url'] == url and etag and known.get('etag') == etag \
+                        and known['sha256'] != sha256:
+                    raise InvalidResponse("resumed file does not match the recorded SHA-256")
+
+            if sha256 == self._previous_sha256(filename, filepath):
+                status = 'unchanged'
+            else:
+                os.replace(part, filepath)
+                if self.store:
+                    self.store.put(filepath, sha256)
+                status = 'downloaded'
+            if self.manifest:
+                self.manifest.record(filename, url, etag, last_modified, size, sha256)
+            if metric:
+                metric.outcome, metric.bytes = status, size - offset
+            return status, size - offset
+        finally:
+            if not keep_part:
+                discard_part(filepath)
+
+    def _stream_body(self, response, part, offset=0):
+        """
+        Write the body to part (appending after offset bytes already on
+        disk), sniffing the signature from the first bytes and enforcing
+        the byte cap. Raises InvalidResponse as soon as either check fails;
+        leaving the response context then drops the connection.
+        Returns (sha256 of the whole file, file size).
+        """
+        digest = hashlib.sha256()
+        head = b''
+        if offset:
+            with open(part, 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    if len(head) < 12:
+                        head += chunk[:12 - len(head)]
+                    digest.update(chunk)
+        size = offset
+        with open(part, 'ab' if offset else 'wb', buffering=WRITE_BUFFER) as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if len(head) < 12:
+                    head += chunk[:12 - len(head)]
+                    if len(head) >= 12 and not sniff_image(head):
+                        raise InvalidResponse(f"body is not a JPEG/PNG/WebP image (starts {head!r})")
+                size += len(chunk)
+                if size > self.max_bytes:
+                    raise InvalidResponse(f"body exceeds {self.max_bytes / 1024:.0f} KB cap")
+                f.write(chunk)
+                digest.update(chunk)
+        if not sniff_image(head):
+            raise InvalidResponse(f"body is not a JPEG/PNG/WebP image ({size} bytes)")
+        return digest, size
+
+    def _cached_url(self, job, filepath):
+        """The job URL the manifest says the current file came from, if any."""
+        entry = self.manifest.get(job.filename) if self.manifest else None
+        if entry and entry['url'] in job.urls and filepath.exists():
+            return entry['url']
+        return None
+
+    def _attempt(self, filename, url, filepath, errors):
+        """
+        Download one URL, resuming interrupted transfers and retrying
+        transient errors with backoff while its host's circuit allows.
+        Returns (status, bytes transferred), (None, 0) on failure, or
+        ('rejected', 0) if the circuit was open before the first request.
+        """
+        host = host_of(url)
+        resumes = retries = 0
+        for number in itertools.count():
+            if not self.breaker.allow(host):
+                errors.append(f"{url}: circuit open for {host}")
+                return ('rejected', 0) if number == 0 else (None, 0)
+            measure = self.metrics.measure(filename, url, number) if self.metrics else nullcontext()
+            try:
+                with measure as metric:
+                    result = self._download(filename, url, filepath, metric)
+                self.breaker.record(host, True)
+                return result
+            except CircuitOpen as e:
+                errors.append(f"{url}: {e}")
+                return ('rejected', 0) if number == 0 else (None, 0)
+            except Interrupted as e:
+                errors.append(f"{url}: {e}")
+                self.breaker.record(host, True)
+                if resumes == RESUME_ATTEMPTS:
+                    # Keep the part file; the next run resumes it
+                    return None, 0
+                resumes += 1
+            except (requests.RequestException, OSError, InvalidResponse) as e:
+                errors.append(f"{url}: {e}")
+                self.breaker.record(host, not is_host_failure(e))
+                delay = retry_delay(e, retries)
+                if delay is None:
+                    return None, 0
+                if retry_after(e) is not None:
+                    self.limiter.defer(host, delay)
+                retries += 1
+                time.sleep(delay)
+
+    def fetch(self, job):
+        """Try the URLs of a job, best-ranked first, until one downloads."""
+        filepath = self.output_dir / job.filename
+        urls = self.stats.rank(job.urls) if self.stats else job.urls
+        cached_url = self._cached_url(job, filepath)
+        if cached_url:
+            # Revalidate the source the file came from before trying others
+            urls = [cached_url] + [u for u in urls if u != cached_url]
+        elif filepath.exists() and not job.overwrite:
+            return FetchResult(job.filename, 'skipped')
+
+        # Sources on hosts with an open circuit go last (stable, so ranking holds otherwise)
+        urls = sorted(urls, key=lambda u: self.breaker.is_open(host_of(u)))
+
+        started = time.monotonic()
+        errors = []
+        for url in urls:
+            attempt = time.monotonic()
+            status, size = self._attempt(job.filename, url, filepath, errors)
+            if status == 'rejected':
+                continue
+            if status is None:
+                if self.stats:
+                    self.stats.record(url, False, time.monotonic() - attempt)
+                continue
+            if self.stats:
+                self.stats.record(url, True, time.monotonic() - attempt)
+            return FetchResult(job.filename, status, url, size,
+                               time.monotonic() - started, errors)
+        return FetchResult(job.filename, 'failed', None, 0,
+                           time.monotonic() - started, errors)
+
+    def run(self, jobs, on_result=None):
+        """Fetch all jobs concurrently; results come back in job order."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        jobs = interleave_by_host(jobs)
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(self.fetch, job): job for job in jobs}
+            for future in as_completed(futures):
+                result = future.result()
+                results[result.filename] = result
+                if on_result:
+                    on_result(result)
+        return [results[job.filename] for job in jobs]
+
+
+def interleave_by_host(jobs):
+    """Round-robin jobs across hosts so one busy host can't hog the pool."""
+    queues = OrderedDict()
+    for job in jobs:
+        queues.setdefault(host_of(job.urls[0]) if job.urls else '', []).append(job)
+    ordered = []
+    while queues:
+        for host in list(queues):
+            ordered.append(queues[host].pop(0))
+            if not queues[host]:
+                del queues[host]
+    return ordered
+
+
+def build_jobs(catalog, names):
+    """
+    One job per file in the named catalogs, with every known source URL for
+    that file. A file is overwritten if any catalog listing it says so.
+    """
+    jobs = OrderedDict()
+    for name in names:
+        group = catalog['catalogs'][name]
+        for filename in group['files']:
+            job = jobs.setdefault(filename, FetchJob(filename, list(catalog['images'][filename])))
+            job.overwrite = job.overwrite or group['overwrite']
+    return list(jobs.values())
+
+
+def create_placeholders(catalog, names, output_dir=OUTPUT_DIR, store=None):
+    """Link existing images for unreleased models; returns (target, source) pairs."""
+    store = store or ImageStore(Path(output_dir).parent / '.store')
+    created = []
+    for name in names:
+        for target, source in catalog['catalogs'][name].get('placeholders', {}).items():
+            src_path = Path(output_dir) / source
+            tgt_path = Path(output_dir) / target
+            if tgt_path.exists() or not src_path.exists():
+                continue
+            store.put(src_path)
+            store.link(src_path, tgt_path)
+            print(f"  [OK] {target} <- {source}")
+            created.append((target, source))
+    return created
+
+
+def print_result(result):
+    if result.status == 'downloaded':
+        print(f"  [OK] {result.filename} ({result.size / 1024:.1f} KB, {result.elapsed:.2f}s)")
+    elif result.status == 'unchanged':
+        print(f"  [SAME] {result.filename} (not modified)")
+    elif result.status == 'skipped':
+        print(f"  [SKIP] {result.filename} (already exists)")
+    else:
+        print(f"  [FAIL] {result.filename}")
+        for error in result.errors:
+            print(f"         {error[:120]}")
+
+
+def run_catalogs(names, output_dir=OUTPUT_DIR, workers=DEFAULT_WORKERS,
+                 per_host=DEFAULT_PER_HOST, rate=DEFAULT_RATE,
+                 manifest_path=MANIFEST_PATH, revalidate=True, only=None,
+                 max_bytes=MAX_IMAGE_BYTES, sources_path=SOURCES_PATH,
+                 report_path=REPORT_PATH, log_path=LOG_PATH, prometheus_path=None):
+    """
+    Download and create placeholders for the named catalogs. With only (a
+    set of filenames), just those files are fetched, replacing what exists.
+    Request metrics go to report_path, log_path and prometheus_path (each
+    optional; see tools/fetchmetrics.py).
+    """
+    catalog = load_catalog(sources_path)
+    jobs = build_jobs(catalog, names)
+    if only is not None:
+        jobs = [job for job in jobs if job.filename in only]
+        for job in jobs:
+            job.overwrite = True
+    manifest = Manifest(manifest_path)
+    store = ImageStore(Path(output_dir).parent / '.store')
+    stats = SourceStats()
+    metrics = FetchMetrics()
+    breaker = HostBreaker()
+
+    print("=" * 80)
+    print(f"FETCHING {len(jobs)} IMAGES ({', '.join(names)})")
+    print("=" * 80)
+    print(f"Output: {output_dir}")
+    print(f"Workers: {workers}, per host: {per_host}, rate: {rate}/s per host\n")
+
+    started = time.monotonic()
+    try:
+        with Fetcher(output_dir, workers, per_host, rate, manifest, revalidate, store,
+                     max_bytes, stats, metrics=metrics, breaker=breaker) as fetcher:
+            results = fetcher.run(jobs, on_result=print_result)
+    finally:
+        manifest.save()
+        stats.save()
+        report = metrics.write(report_path, log_path, prometheus_path)
+    elapsed = time.monotonic() - started
+
+    placeholders = []
+    if any(catalog['catalogs'][name].get('placeholders') for name in names):
+        print("\nCREATING PLACEHOLDERS...")
+        placeholders = create_placeholders(catalog, names, output_dir, store)
+
+    if Path(output_dir).resolve() == IMAGES_DIR:
+        write_aliases(output_dir)
+
+    counts = {status: sum(1 for r in results if r.status == status)
+              for status in ('downloaded', 'unchanged', 'skipped', 'failed')}
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Downloaded: {counts['downloaded']}")
+    print(f"Not modified: {counts['unchanged']}")
+    print(f"Placeholders: {len(placeholders)}")
+    print(f"Skipped: {counts['skipped']}")
+    print(f"Failed: {counts['failed']}")
+    print(f"Transferred: {sum(r.size for r in results) / 1024:.1f} KB")
+    print(f"Time: {elapsed:.1f}s")
+    print(f"Requests: {report['totals']['requests']} ({report['totals']['retries']} retried or resumed)")
+    for host, entry in breaker.tripped().items():
+        print(f"[WARN] Circuit opened for {host} ({entry['trips']}x, {entry['rejected']} request(s) "
+              f"skipped, now {entry['state']})")
+    print_hosts(report)
+    for path in (report_path, log_path, prometheus_path):
+        if path:
+            print(f"Metrics: {path}")
+
+    failed = [r for r in results if r.status == 'failed']
+    if failed:
+        print("\nFAILED DOWNLOADS:")
+        for r in failed:
+            print(f"  - {r.filename}")
+
+    return results, placeholders
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.fetch',
+        description='Download phone images for one or more catalogs.')
+    parser.add_argument('catalogs', nargs='*', metavar='CATALOG',
+                        help='catalog names (default: all, newest fixes first)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'worker threads (default: {DEFAULT_WORKERS})')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                        help=f'concurrent requests per host (default: {DEFAULT_PER_HOST})')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help=f'request starts per second per host, 0 = unlimited (default: {DEFAULT_RATE})')
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR,
+                        help='output directory (default: images/phones)')
+    parser.add_argument('--manifest', type=Path, default=MANIFEST_PATH,
+                        help='fetch manifest (default: data/image-manifest.json)')
+    parser.add_argument('--force', action='store_true',
+                        help='skip conditional requests and re-download every file')
+    parser.add_argument('--max-kb', type=int, default=MAX_IMAGE_BYTES // 1024,
+                        help=f'reject images larger than this (default: {MAX_IMAGE_BYTES // 1024})')
+    parser.add_argument('--flagged', action='store_true',
+                        help='only re-fetch files flagged in data/image-clusters.json')
+    parser.add_argument('--sources', type=Path, default=SOURCES_PATH,
+                        help='source catalog (default: data/image-sources.json)')
+    parser.add_argument('--report', type=Path, default=REPORT_PATH,
+                        help='JSON run report with per-host histograms (default: .cache/fetch-report.json)')
+    parser.add_argument('--metrics-log', type=Path, default=LOG_PATH,
+                        help='NDJSON request log to append to (default: .cache/fetch-metrics.ndjson)')
+    parser.add_argument('--prometheus', type=Path,
+                        help='also write the metrics in Prometheus text format')
+    parser.add_argument('--list', action='store_true', help='list catalogs and exit')
+    args = parser.parse_args(argv)
+
+    args.catalog = load_catalog(args.sources)
+    unknown = [name for name in args.catalogs if name not in args.catalog['catalogs']]
+    if unknown:
+        parser.error(f"unknown catalog(s): {', '.join(unknown)} (see --list)")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    refresh_order = args.catalog['refreshOrder']
+
+    if args.list:
+        for name in refresh_order:
+            group = args.catalog['catalogs'][name]
+            print(f"{name:22} {len(group['files']):3} images  ({group['script']})")
+        return 0
+
+    only = None
+    if args.flagged:
+        from tools.phash import load_flagged
+        only = load_flagged()
+        print(f"{len(only)} flagged file(s) in data/image-clusters.json\n")
+
+    names = args.catalogs or refresh_order
+    results, _ = run_catalogs(names, args.output, args.workers, args.per_host, args.rate,
+                              args.manifest, not args.force, only, args.max_kb * 1024,
+                              args.sources, args.report, args.metrics_log, args.prometheus)
+    return 1 if any(not r.ok for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
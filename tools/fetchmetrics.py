@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+"""
+Fetch Metrics
+
+Per-request timing for the image fetch engine (tools/fetch.py). Every
+attempt at a URL becomes one RequestMetric:
+
+    host, url, file     where the request went and for which image
+    attempt             0 for the first try of a URL, 1+ for retries and resumes
+    outcome             downloaded, unchanged, interrupted or failed
+    status, bytes       HTTP status and body bytes received
+    queued              waiting for the host's concurrency / rate slot
+    dns, connect, tls   only when the request opened a new connection
+                        (null on a reused keep-alive connection)
+    ttfb                request start to response headers
+    total               request start to the end of the body
+
+DNS, TCP connect and TLS handshake are timed inside the connection pool
+(TimedAdapter), so a slow resolver, a slow handshake and a slow server
+show up separately.
+
+A run's metrics are aggregated per host into histograms with fixed
+buckets (cumulative, Prometheus style) plus p50 / p95 / max, and written
+as:
+
+    .cache/fetch-report.json     this run: totals and per-host histograms
+    .cache/fetch-metrics.ndjson  every request of every run, one JSON
+                                 object per line, tagged with the run id
+    --prometheus PATH            optional text-format dump, e.g. for the
+                                 node_exporter textfile collector
+
+The NDJSON log is appended to, so slow hosts can be trended across
+catalog refreshes.
+"""
+import json
+import socket
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import connection
+
+from tools.manifest import write_json_atomic, write_text_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+REPORT_PATH = ROOT / '.cache' / 'fetch-report.json'
+LOG_PATH = ROOT / '.cache' / 'fetch-metrics.ndjson'
+
+# Histogram upper bounds in seconds; +Inf is implied
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PHASES = ('queued', 'dns', 'connect', 'tls', 'ttfb', 'total')
+
+# The metric of the request running on this thread, for the timed connections
+_local = threading.local()
+
+
+@dataclass
+class RequestMetric:
+    run: str
+    file: str
+    url: str
+    host: str
+    attempt: int
+    at: str
+    outcome: str = None
+    status: int = None
+    bytes: int = 0
+    queued: float = None
+    dns: float = None
+    connect: float = None
+    tls: float = None
+    ttfb: float = None
+    total: float = None
+    error: str = None
+
+    def __post_init__(self):
+        self._started = time.perf_counter()
+        self._sent = None
+
+    def sent(self):
+        """The host slot was granted and the request is about to go out."""
+        self._sent = time.perf_counter()
+        self.queued = self._sent - self._started
+
+    def to_json(self):
+        data = asdict(self)
+        for phase in PHASES:
+            if data[phase] is not None:
+                data[phase] = round(data[phase], 4)
+        return data
+
+
+class _TimedConnectionMixin:
+    """Records DNS, TCP connect and TLS time into the current thread's metric."""
+
+    def _new_conn(self):
+        metric = getattr(_local, 'metric', None)
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, connection.allowed_gai_family(),
+                                           socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            if metric:
+                metric.dns = time.perf_counter() - started
+            raise NameResolutionError(self.host, self, e) from e
+        resolved = time.perf_counter()
+
+        # Connect to the resolved addresses in order, as create_connection() would
+        for number, (_, _, _, _, address) in enumerate(addresses):
+            try:
+                sock = connection.create_connection((address[0], self.port), self.timeout,
+                                                    source_address=self.source_address,
+                                                    socket_options=self.socket_options)
+                break
+            except OSError as e:
+                if number < len(addresses) - 1:
+                    continue
+                if isinstance(e, socket.timeout):
+                    raise ConnectTimeoutError(
+                        self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})") from e
+                raise NewConnectionError(self, f"Failed to establish a new connection: {e}") from e
+        if metric:
+            metric.dns = resolved - started
+            metric.connect = time.perf_counter() - resolved
+        return sock
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        metric = getattr(_local, 'metric', None)
+        if metric and isinstance(self, HTTPSConnection) and metric.dns is not None:
+            metric.tls = time.perf_counter() - started - metric.dns - metric.connect
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedAdapter(HTTPAdapter):
+    """HTTPAdapter whose new connections report DNS / connect / TLS time."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {'http': TimedHTTPConnectionPool,
+                                                   'https': TimedHTTPSConnectionPool}
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of values (0 <= q <= 1); None when empty."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(q * (len(ordered) - 1)))]
+
+
+def histogram(values):
+    """Cumulative bucket counts, sum and percentiles of a list of seconds."""
+    buckets = {str(bound): sum(1 for v in values if v <= bound) for bound in BUCKETS}
+    buckets['+Inf'] = len(values)
+    return {
+        'count': len(values),
+        'sum': round(sum(values), 4),
+        'p50': percentile(values, 0.5),
+        'p95': percentile(values, 0.95),
+        'max': max(values) if values else None,
+        'buckets': buckets,
+    }
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class FetchMetrics:
+    """Thread-safe collector of RequestMetrics for one fetch run."""
+
+    def __init__(self):
+        self.run = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ') + '-' + uuid.uuid4().hex[:6]
+        self.started = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self.requests = []
+
+    @contextmanager
+    def measure(self, filename, url, attempt):
+        """
+        Time one attempt at url. The caller sets outcome, status and bytes
+        on the yielded metric; an exception marks it failed (unless the
+        caller already chose an outcome) and propagates.
+        """
+        metric = RequestMetric(self.run, filename, url, urlsplit(url).hostname or '', attempt,
+                               datetime.now(timezone.utc).isoformat(timespec='seconds'))
+        _local.metric = metric
+        try:
+            yield metric
+        except Exception as e:
+            metric.outcome = metric.outcome or 'failed'
+            metric.error = str(e)[:300]
+            raise
+        finally:
+            _local.metric = None
+            if metric._sent is not None:
+                metric.total = time.perf_counter() - metric._sent
+            with self._lock:
+                self.requests.append(metric)
+
+    def by_host(self):
+        with self._lock:
+            requests = list(self.requests)
+        hosts = {}
+        for metric in requests:
+            hosts.setdefault(metric.host, []).append(metric)
+        return dict(sorted(hosts.items()))
+
+    def summary(self):
+        """JSON-ready run report: totals and per-host histograms."""
+        hosts = {}
+        for host, metrics in self.by_host().items():
+            outcomes = Counter(m.outcome for m in metrics)
+            hosts[host] = {
+                'requests': len(metrics),
+                'retries': sum(1 for m in metrics if m.attempt),
+                'newConnections': sum(1 for m in metrics if m.dns is not None),
+                'bytes': sum(m.bytes for m in metrics),
+                'outcomes': dict(sorted(outcomes.items())),
+                'statuses': dict(sorted(Counter(str(m.status) for m in metrics if m.status).items())),
+                'latency': {phase: histogram([round(getattr(m, phase), 4) for m in metrics
+                                              if getattr(m, phase) is not None])
+                            for phase in PHASES},
+            }
+        return {
+            'version': 1,
+            'run': self.run,
+            'started': self.started.isoformat(timespec='seconds'),
+            'elapsed': round((datetime.now(timezone.utc) - self.started).total_seconds(), 3),
+            'totals': {
+                'requests': sum(h['requests'] for h in hosts.values()),
+                'retries': sum(h['retries'] for h in hosts.values()),
+                'failures': sum(h['outcomes'].get('failed', 0) for h in hosts.values()),
+                'bytes': sum(h['bytes'] for h in hosts.values()),
+            },
+            'buckets': list(BUCKETS),
+            'hosts': hosts,
+        }
+
+    def ndjson(self):
+        with self._lock:
+            requests = list(self.requests)
+        return ''.join(json.dumps(m.to_json(), ensure_ascii=False, separators=(',', ':')) + '\n'
+                       for m in requests)
+
+    def prometheus(self, report=None):
+        """The run's metrics in the Prometheus text exposition format."""
+        report = report or self.summary()
+        lines = [
+            '# HELP fetch_phase_seconds Image fetch request latency by phase.',
+            '# TYPE fetch_phase_seconds histogram',
+        ]
+        for host, entry in report['hosts'].items():
+            for phase, hist in entry['latency'].items():
+                labels = f'host="{_label(host)}",phase="{phase}"'
+                for bound, count in hist['buckets'].items():
+                    lines.append(f'fetch_phase_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'fetch_phase_seconds_sum{{{labels}}} {hist["sum"]}')
+                lines.append(f'fetch_phase_seconds_count{{{labels}}} {hist["count"]}')
+        counters = [
+            ('fetch_requests_total', 'Image fetch requests by outcome.',
+             lambda host, e: [(f'host="{_label(host)}",outcome="{outcome}"', n)
+                              for outcome, n in e['outcomes'].items()]),
+            ('fetch_retries_total', 'Resumed attempts at a URL.',
+             lambda host, e: [(f'host="{_label(host)}"', e['retries'])]),
+            ('fetch_response_bytes_total', 'Body bytes received.',
+             lambda host, e: [(f'host="{_label(host)}"', e['bytes'])]),
+        ]
+        for name, help_text, samples in counters:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for host, entry in report['hosts'].items():
+                for labels, value in samples(host, entry):
+                    lines.append(f'{name}{{{labels}}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, report_path=REPORT_PATH, log_path=LOG_PATH, prometheus_path=None):
+        """Write the run report, append to the request log, optionally dump Prometheus text."""
+        report = self.summary()
+        if report_path:
+            write_json_atomic(report_path, report)
+        if log_path:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(log_path, 'a', encoding='utf-8') as f:
+                f.write(self.ndjson())
+        if prometheus_path:
+            write_text_atomic(prometheus_path, self.prometheus(report))
+        return report
+
+
+def print_hosts(report, limit=10):
+    """Per-host latency table, slowest p95 first."""
+    hosts = sorted(report['hosts'].items(), key=lambda item: -(item[1]['latency']['total']['p95'] or 0))
+    if not hosts:
+        return
+
+    def ms(value):
+        return f"{value * 1000:.0f}" if value is not None else '-'
+
+    print(f"\n{'host':<36} {'req':>5} {'retry':>5} {'fail':>5} {'dns':>6} {'conn':>6} "
+          f"{'ttfb p50':>8} {'p95':>6} {'total p95':>9}")
+    for host, entry in hosts[:limit]:
+        latency = entry['latency']
+        print(f"{host[:36]:<36} {entry['requests']:>5} {entry['retries']:>5} "
+              f"{entry['outcomes'].get('failed', 0):>5} {ms(latency['dns']['p50']):>6} "
+              f"{ms(latency['connect']['p50']):>6} {ms(latency['ttfb']['p50']):>8} "
+              f"{ms(latency['ttfb']['p95']):>6} {ms(latency['total']['p95']):>9}")
+    if len(hosts) > limit:
+        print(f"... and {len(hosts) - limit} more host(s) in the JSON report")
+    print("(milliseconds; dns / conn are medians over new connections)")
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+Offline Fixture Image Server
+
+A local stand-in for the Apple/Samsung/GSMArena image hosts. It replays
+the images in a directory (images/phones by default) as recorded
+responses. Each response carries an ETag, a Last-Modified date and
+byte-range support, like the real CDNs.
+
+Failure modes are injected per request, at configurable rates:
+
+    --latency / --jitter   delay before the response headers
+    --error-rate           503 Service Unavailable
+    --html-rate            200 text/html landing page instead of the image
+    --slow-rate / --slow-kbps
+                           body trickles at the given bandwidth
+    --stall-rate / --stall-seconds
+                           half the body, then silence, then the
+                           connection drops
+
+Conditional requests (If-None-Match / If-Modified-Since) get 304 Not
+Modified, and Range requests get 206 Partial Content. Those exercise the
+revalidation and resume paths of tools/fetch.py. Faults are drawn from a
+seeded RNG, so runs are repeatable. Used by tools/bench.py.
+
+Run:
+    python -m tools.fixtureserver --port 8765
+    python -m tools.fixtureserver --latency 0.2 --error-rate 0.1 --stall-rate 0.05
+"""
+import argparse
+import hashlib
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+
+CONTENT_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg',
+                 '.png': 'image/png', '.webp': 'image/webp'}
+HTML_PAGE = b'<!DOCTYPE html><html><head><title>iPhone</title></head><body>Not an image</body></html>'
+LAST_MODIFIED = formatdate(1_700_000_000, usegmt=True)
+WRITE_CHUNK = 16 * 1024
+
+
+@dataclass
+class Faults:
+    latency: float = 0.0        # seconds before headers
+    jitter: float = 0.0         # +/- uniform seconds on top of latency
+    error_rate: float = 0.0
+    html_rate: float = 0.0
+    slow_rate: float = 0.0
+    slow_kbps: float = 64.0
+    stall_rate: float = 0.0
+    stall_seconds: float = 35.0  # longer than the fetcher's read timeout
+    seed: int = 0
+
+
+def load_fixtures(directory=IMAGES_DIR):
+    """filename -> (body, content type, etag) for every image in directory."""
+    fixtures = {}
+    for path in sorted(Path(directory).iterdir()):
+        content_type = CONTENT_TYPES.get(path.suffix.lower())
+        if content_type and path.is_file() and not path.name.startswith('.'):
+            body = path.read_bytes()
+            fixtures[path.name] = (body, content_type, f'"{hashlib.sha256(body).hexdigest()[:16]}"')
+    return fixtures
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'FixtureServer/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _fault(self):
+        """Pick at most one fault for this request."""
+        faults = self.server.faults
+        with self.server.lock:
+            roll = self.server.rng.random()
+            delay = faults.latency + self.server.rng.uniform(-faults.jitter, faults.jitter)
+        for name, rate in (('error', faults.error_rate), ('html', faults.html_rate),
+                           ('stall', faults.stall_rate), ('slow', faults.slow_rate)):
+            if roll < rate:
+                return name, max(0.0, delay)
+            roll -= rate
+        return None, max(0.0, delay)
+
+    def _send_body(self, body, fault):
+        faults = self.server.faults
+        if fault == 'stall':
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            time.sleep(faults.stall_seconds)
+            self.close_connection = True
+            return
+        pause = WRITE_CHUNK / (faults.slow_kbps * 1024) if fault == 'slow' else 0
+        for start in range(0, len(body), WRITE_CHUNK):
+            self.wfile.write(body[start:start + WRITE_CHUNK])
+            if pause:
+                self.wfile.flush()
+                time.sleep(pause)
+
+    def do_GET(self):
+        self.server.count()
+        name = unquote(urlsplit(self.path).path.lstrip('/'))
+        fault, delay = self._fault()
+        if delay:
+            time.sleep(delay)
+
+        fixture = self.server.fixtures.get(name)
+        if fixture is None:
+            return self._simple(404, b'Not Found')
+        if fault == 'error':
+            return self._simple(503, b'Service Unavailable')
+        if fault == 'html':
+            return self._simple(200, HTML_PAGE, 'text/html; charset=utf-8')
+
+        body, content_type, etag = fixture
+        if self.headers.get('If-None-Match') == etag or (
+                not self.headers.get('If-None-Match')
+                and self.headers.get('If-Modified-Since') == LAST_MODIFIED):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        status, payload = 200, body
+        match = re.match(r'bytes=(\d+)-$', self.headers.get('Range', ''))
+        if match and self.headers.get('If-Range', etag) in (etag, LAST_MODIFIED) \
+                and int(match.group(1)) < len(body):
+            start = int(match.group(1))
+            status, payload = 206, body[start:]
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', LAST_MODIFIED)
+        self.send_header('Accept-Ranges', 'bytes')
+        if status == 206:
+            self.send_header('Content-Range', f'bytes {start}-{len(body) - 1}/{len(body)}')
+        self.end_headers()
+        try:
+            self._send_body(payload, fault)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _simple(self, status, body, content_type='text/plain'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Serves fixtures on 127.0.0.1; use as a context manager to run it in a thread."""
+
+    daemon_threads = True
+
+    def __init__(self, directory=IMAGES_DIR, faults=None, port=0, verbose=False):
+        super().__init__(('127.0.0.1', port), FixtureHandler)
+        self.fixtures = load_fixtures(directory)
+        self.faults = faults or Faults()
+        self.rng = random.Random(self.faults.seed)
+        self.lock = threading.Lock()
+        self.verbose = verbose
+        self.requests = 0
+        self._thread = None
+
+    def count(self):
+        with self.lock:
+            self.requests += 1
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def url(self, filename):
+        return f"{self.base_url}/{filename}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def add_fault_arguments(parser):
+    defaults = Faults()
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR,
+                        help='directory of recorded responses (default: images/phones)')
+    parser.add_argument('--latency', type=float, default=defaults.latency, help='seconds before headers')
+    parser.add_argument('--jitter', type=float, default=defaults.jitter, help='+/- seconds of latency jitter')
+    parser.add_argument('--error-rate', type=float, default=defaults.error_rate, help='share of 503 responses')
+    parser.add_argument('--html-rate', type=float, default=defaults.html_rate, help='share of HTML pages')
+    parser.add_argument('--slow-rate', type=float, default=defaults.slow_rate, help='share of slow bodies')
+    parser.add_argument('--slow-kbps', type=float, default=defaults.slow_kbps, help='bandwidth of slow bodies')
+    parser.add_argument('--stall-rate', type=float, default=defaults.stall_rate, help='share of stalled bodies')
+    parser.add_argument('--stall-seconds', type=float, default=defaults.stall_seconds,
+                        help='how long a stalled body hangs before the connection drops')
+    parser.add_argument('--seed', type=int, default=defaults.seed, help='fault RNG seed')
+
+
+def faults_from_args(args):
+    return Faults(args.latency, args.jitter, args.error_rate, args.html_rate, args.slow_rate,
+                  args.slow_kbps, args.stall_rate, args.stall_seconds, args.seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.fixtureserver',
+                                     description='Serve recorded phone images with injected faults.')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    add_fault_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if not args.images.is_dir():
+        print(f"[FAIL] Fixture directory not found: {args.images}")
+        return 1
+    server = FixtureServer(args.images, faults_from_args(args), args.port, args.verbose)
+    print(f"Serving {len(server.fixtures)} images from {args.images} at {server.base_url}/<filename>")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print(f"\n{server.requests} requests served")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Host Health: Retries and Circuit Breaker
+
+Per-host failure handling for the image fetch engine (tools/fetch.py).
+
+Transient errors (429, 500, 502, 503, 504, connection resets) are retried
+on the same URL after a jittered exponential backoff (full jitter:
+uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2^n))). A Retry-After header
+(seconds or an HTTP date) overrides the backoff, and also holds back the
+host's other requests; one longer than MAX_RETRY_AFTER skips to the next
+source instead. Timeouts are not retried: waiting out another timeout on
+the same host is what the breaker exists to avoid.
+
+Each host has a circuit breaker:
+
+    closed     requests flow; FAILURE_THRESHOLD consecutive failures
+               (timeouts, connection errors, 429 / 5xx) open it
+    open       the host's URLs are skipped, so files fall through to
+               their alternate sources at once, for a cooldown that
+               doubles on every re-trip (COOLDOWN .. MAX_COOLDOWN)
+    half-open  after the cooldown one probe request is let through;
+               success closes the circuit, failure opens it again
+
+Any response that shows the host is up (2xx / 3xx / 4xx, or a body that
+failed validation) resets the failure count. A dead CDN then costs about
+one timeout per concurrent slot, instead of one per file.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+
+RETRY_ATTEMPTS = 2           # extra attempts per URL on transient errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+BACKOFF_BASE = 0.5           # seconds
+BACKOFF_CAP = 8.0
+MAX_RETRY_AFTER = 60.0       # longer waits go to the next source instead
+
+FAILURE_THRESHOLD = 3        # consecutive failures that open a circuit
+COOLDOWN = 30.0              # seconds a circuit stays open, doubled per re-trip
+MAX_COOLDOWN = 300.0
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+
+class CircuitOpen(Exception):
+    """The host's circuit opened while the request waited for its slot."""
+
+
+def status_of(error):
+    response = getattr(error, 'response', None)
+    return response.status_code if response is not None else None
+
+
+def is_host_failure(error):
+    """Whether an exception counts against the host's circuit."""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout,
+                          requests.exceptions.ChunkedEncodingError)):
+        return True
+    return status_of(error) in RETRY_STATUSES
+
+
+def retry_after(error, now=None):
+    """Seconds from a Retry-After header on the error's response, or None."""
+    response = getattr(error, 'response', None)
+    value = response.headers.get('Retry-After', '').strip() if response is not None else ''
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when - (now if now is not None else time.time()))
+
+
+def backoff(retry, rng=random):
+    """Full-jitter exponential backoff for the retry-th retry (0-based)."""
+    return rng.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** retry))
+
+
+def retry_delay(error, retry, rng=random):
+    """
+    Seconds to wait before retrying the same URL after error, or None when
+    the error isn't transient, the retries are used up, or the server asked
+    for a longer wait than MAX_RETRY_AFTER.
+    """
+    if retry >= RETRY_ATTEMPTS or isinstance(error, requests.Timeout):
+        return None
+    status = status_of(error)
+    if status is None and not isinstance(error, (requests.ConnectionError,
+                                                 requests.exceptions.ChunkedEncodingError)):
+        return None
+    if status is not None and status not in RETRY_STATUSES:
+        return None
+    requested = retry_after(error)
+    if requested is not None:
+        return requested if requested <= MAX_RETRY_AFTER else None
+    return backoff(retry, rng)
+
+
+class HostBreaker:
+    """Thread-safe circuit breaker per host."""
+
+    def __init__(self, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN, max_cooldown=MAX_COOLDOWN,
+                 clock=time.monotonic):
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _entry(self, host):
+        return self._hosts.setdefault(host, {'state': CLOSED, 'failures': 0, 'trips': 0,
+                                             'opened': 0.0, 'cooldown': self.cooldown,
+                                             'rejected': 0, 'probing': False})
+
+    def is_open(self, host):
+        """Open and still cooling down (a caller would be turned away)."""
+        with self._lock:
+            entry = self._hosts.get(host)
+            return bool(entry) and entry['state'] != CLOSED and (
+                entry['probing'] or self.clock() - entry['opened'] < entry['cooldown'])
+
+    def rejects_waiting(self, host):
+        """Open (not probing): a request allowed earlier should not go out after all."""
+        with self._lock:
+            entry = self._hosts.get(host)
+            return bool(entry) and entry['state'] == OPEN
+
+    def allow(self, host):
+        """Whether a request to host may go out now. Every allowed request must be followed by record()."""
+        with self._lock:
+            entry = self._entry(host)
+            if entry['state'] == CLOSED:
+                return True
+            if not entry['probing'] and self.clock() - entry['opened'] >= entry['cooldown']:
+                entry['state'] = HALF_OPEN
+                entry['probing'] = True
+                return True
+            entry['rejected'] += 1
+            return False
+
+    def record(self, host, ok):
+        with self._lock:
+            entry = self._entry(host)
+            if ok:
+                if entry['state'] != CLOSED:
+                    entry['cooldown'] = self.cooldown
+                entry.update(state=CLOSED, failures=0, probing=False)
+                return
+            entry['failures'] += 1
+            if entry['state'] == HALF_OPEN:
+                entry['cooldown'] = min(self.max_cooldown, entry['cooldown'] * 2)
+            elif entry['state'] == OPEN or entry['failures'] < self.threshold:
+                return
+            entry.update(state=OPEN, opened=self.clock(), probing=False)
+            entry['trips'] += 1
+
+    def tripped(self):
+        """{host: {'state', 'trips', 'rejected'}} for hosts whose circuit opened this run."""
+        with self._lock:
+            return {host: {'state': entry['state'], 'trips': entry['trips'], 'rejected': entry['rejected']}
+                    for host, entry in sorted(self._hosts.items()) if entry['trips']}
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Image Quality Audit
+
+Checks every file in images/phones without a browser. Each image's
+header is read in a process pool (no pixel decode) and checked for:
+
+    format      the real format (JPEG / PNG / WebP) matches the extension
+    complete    the file ends where its format says it should (JPEG EOI
+                marker, PNG IEND chunk, WebP RIFF length), so a broken
+                download is caught without decoding it
+    dimensions  MIN_SIDE .. MAX_SIDE pixels on each side
+    aspect      the long side at most MAX_ASPECT times the short side
+                (vendor banners make tiny model cards)
+    bytes       at most MAX_BYTES
+    mode        a colour mode browsers render as-is (no CMYK, 16-bit...)
+    metadata    EXIF + ICC + XMP at most MAX_METADATA bytes
+    frames      a single frame (no animated product shots)
+
+Header facts are cached by file SHA-256 in .cache/image-audit.json and
+the rules are applied to the cached facts, so a rerun only opens new or
+changed files and a rule change needs no re-read. The cache only keeps
+the images of the directory audited last, so other directories get their
+own --cache file. Exits 1 when any image breaks a rule.
+
+The deploy audits the pruned, optimized artifact (see tools/imagerefs.py
+and tools/imageoptimize.py) with its own cache, so unreferenced leftovers
+don't fail it and the facts of images/phones stay cached.
+
+Requirements:
+    pip install pillow
+
+Run:
+    python -m tools.imageaudit
+    python -m tools.imageaudit --images _site/images/phones --cache .cache/image-audit-site.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, UnidentifiedImageError
+
+from tools.manifest import sha256_file, write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+CACHE_PATH = ROOT / '.cache' / 'image-audit.json'
+
+FACTS_VERSION = 1  # bump when inspect() records different facts
+BATCH_SIZE = 16
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
+FORMATS = {'.jpg': 'JPEG', '.jpeg': 'JPEG', '.png': 'PNG', '.webp': 'WEBP'}
+MODES = {'RGB', 'RGBA', 'L', 'LA', 'P'}
+
+MIN_SIDE = 150
+MAX_SIDE = 2000
+MAX_ASPECT = 3.0
+MAX_BYTES = 200 * 1024
+MAX_METADATA = 16 * 1024
+
+
+def complete(path, fmt, size):
+    """Whether the file ends where its format says it should."""
+    with open(path, 'rb') as f:
+        if fmt == 'WEBP':
+            f.seek(4)
+            return int.from_bytes(f.read(4), 'little') + 8 == size
+        f.seek(max(0, size - 12))
+        tail = f.read()
+    if fmt == 'JPEG':
+        return tail.rstrip(b'\x00').endswith(b'\xff\xd9')
+    if fmt == 'PNG':
+        return tail.endswith(b'IEND\xaeB`\x82')
+    return True
+
+
+def inspect(path):
+    """Worker: header facts of one image, or {'error': ...} if it isn't one."""
+    size = os.path.getsize(path)
+    try:
+        with Image.open(path) as img:
+            info = img.info
+            metadata = sum(len(info.get(key) or b'') for key in ('exif', 'icc_profile', 'xmp'))
+            return {
+                'format': img.format,
+                'width': img.width,
+                'height': img.height,
+                'mode': img.mode,
+                'frames': getattr(img, 'n_frames', 1),
+                'metadata': metadata,
+                'bytes': size,
+                'complete': complete(path, img.format, size),
+            }
+    except UnidentifiedImageError:
+        with open(path, 'rb') as f:
+            return {'error': f"unrecognised data (starts {f.read(12)!r})", 'bytes': size}
+    except (OSError, ValueError, SyntaxError) as e:
+        return {'error': str(e), 'bytes': size}
+
+
+def violations(name, facts):
+    """Human-readable rule violations for one image's facts."""
+    if 'error' in facts:
+        return [f"not a readable image: {facts['error'][:80]}"]
+    problems = []
+    expected = FORMATS.get(Path(name).suffix.lower())
+    if facts['format'] != expected:
+        problems.append(f"{facts['format']} data in a {Path(name).suffix} file")
+    if not facts['complete']:
+        problems.append("truncated (no end marker)")
+    width, height = facts['width'], facts['height']
+    if min(width, height) < MIN_SIDE or max(width, height) > MAX_SIDE:
+        problems.append(f"{width}x{height} outside {MIN_SIDE}..{MAX_SIDE} px")
+    elif max(width, height) > MAX_ASPECT * min(width, height):
+        problems.append(f"{width}x{height} is wider than {MAX_ASPECT:g}:1")
+    if facts['bytes'] > MAX_BYTES:
+        problems.append(f"{facts['bytes'] / 1024:.0f} KB over the {MAX_BYTES / 1024:.0f} KB budget")
+    if facts['mode'] not in MODES:
+        problems.append(f"colour mode {facts['mode']}")
+    if facts['metadata'] > MAX_METADATA:
+        problems.append(f"{facts['metadata'] / 1024:.0f} KB of EXIF/ICC/XMP metadata")
+    if facts['frames'] > 1:
+        problems.append(f"{facts['frames']} frames")
+    return problems
+
+
+def load_cache(path=CACHE_PATH):
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == FACTS_VERSION:
+            return data.get('facts', {})
+    return {}
+
+
+def audit(images_dir=IMAGES_DIR, cache_path=CACHE_PATH, jobs=None):
+    """Returns ({filename: facts}, {filename: [violation]}, number of files inspected)."""
+    sources = sorted(p for p in Path(images_dir).iterdir()
+                     if p.suffix.lower() in IMAGE_SUFFIXES and not p.name.startswith('.'))
+    shas = {p.name: sha256_file(p) for p in sources}
+    cache = load_cache(cache_path)
+
+    # One inspection per distinct image; aliases share the result
+    todo = {}
+    for path in sources:
+        if shas[path.name] not in cache:
+            todo.setdefault(shas[path.name], path)
+    if todo:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for sha, facts in zip(todo, pool.map(inspect, list(todo.values()), chunksize=BATCH_SIZE)):
+                cache[sha] = facts
+
+    facts = {path.name: cache[shas[path.name]] for path in sources}
+    problems = {name: found for name, entry in facts.items() if (found := violations(name, entry))}
+
+    live = set(shas.values())
+    write_json_atomic(cache_path, {
+        'version': FACTS_VERSION,
+        'facts': {sha: entry for sha, entry in cache.items() if sha in live},
+    })
+    return facts, problems, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.imageaudit',
+                                     description='Check format, size and metadata of every image in images/phones.')
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR,
+                        help='image directory (default: images/phones)')
+    parser.add_argument('--cache', type=Path, default=CACHE_PATH,
+                        help='header fact cache (default: .cache/image-audit.json)')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("IMAGE QUALITY AUDIT")
+    print("=" * 80)
+    started = time.perf_counter()
+    facts, problems, inspected = audit(args.images, args.cache, args.jobs)
+    elapsed = time.perf_counter() - started
+    for name, found in problems.items():
+        print(f"  [FAIL] {name}")
+        for problem in found:
+            print(f"         {problem}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Images: {len(facts)}")
+    print(f"Inspected: {inspected} distinct images (the rest from {args.cache.name})")
+    print(f"Total: {sum(entry['bytes'] for entry in facts.values()) / 1024:.1f} KB")
+    print(f"Violations: {len(problems)} image(s)")
+    print(f"Time: {elapsed:.2f}s")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""
+Lossless Image Optimizer
+
+Shrinks the images of a deploy artifact without changing a single pixel,
+so every page gets smaller images under the same file names:
+
+    JPEG   jpegtran -optimize -progressive (optimal Huffman tables,
+           progressive scans; the DCT coefficients are copied, not
+           re-encoded). Without jpegtran on PATH only the metadata is
+           stripped, by dropping marker segments.
+    PNG    re-deflated at the highest zlib level, text chunks dropped
+    WebP   left alone (no lossless re-encode of lossy WebP)
+
+The real format decides, not the extension, so a PNG saved as .jpg is
+recompressed as a PNG and keeps its name. EXIF, XMP, IPTC and comments
+are stripped; ICC profiles and the Adobe marker are kept because they
+change how colours render, and so is the EXIF of a file whose
+orientation tag rotates it. Every result is decoded and compared with the
+original pixel for pixel, and is only used when it is smaller.
+
+Results are cached by source SHA-256 in .cache/optimized/, so a deploy
+only re-encodes new images. The cache records the jpegtran version it
+was made with (or its absence), and is dropped when that changes, so
+strip-only results get redone once jpegtran is installed. Hardlinked duplicates in the target (see
+tools/imagestore.py) are optimized once and stay linked.
+
+Run this on the artifact, not on images/phones: the fetch manifest
+(tools/manifest.py) records the vendor bytes, and the next fetch would
+otherwise replace every optimized file with a fresh download.
+Before / after sizes per file go to .cache/image-optimize-report.json.
+
+Requirements:
+    pip install pillow
+    jpegtran (libjpeg-turbo-progs), optional
+
+Run:
+    python -m tools.imageoptimize _site/images/phones
+    python -m tools.imageoptimize _site/images/phones --jobs 4
+"""
+import argparse
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from tools.imagestore import link_or_copy
+from tools.manifest import sha256_file, write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = ROOT / '.cache' / 'optimized'
+CACHE_PATH = CACHE_DIR / 'results.json'
+REPORT_PATH = ROOT / '.cache' / 'image-optimize-report.json'
+
+RESULTS_VERSION = 1  # bump when the encoders change
+BATCH_SIZE = 8
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
+EXIF_ORIENTATION = 0x0112
+
+# JPEG marker segments kept when stripping: JFIF, ICC profile, Adobe (colour transform)
+JPEG_APP0, JPEG_APP2, JPEG_APP14 = 0xE0, 0xE2, 0xEE
+JPEG_SOS, JPEG_COM = 0xDA, 0xFE
+ICC_TAG = b'ICC_PROFILE\x00'
+
+
+def strip_jpeg_metadata(data):
+    """JPEG bytes without EXIF / XMP / IPTC / comment segments, or None if malformed."""
+    if not data.startswith(b'\xff\xd8'):
+        return None
+    out = [data[:2]]
+    i = 2
+    while i + 4 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if marker == JPEG_SOS:
+            out.append(data[i:])
+            return b''.join(out)
+        length = int.from_bytes(data[i + 2:i + 4], 'big')
+        segment = data[i:i + 2 + length]
+        metadata = marker == JPEG_COM or (0xE1 <= marker <= 0xEF and marker != JPEG_APP14
+                                          and not (marker == JPEG_APP2 and segment[4:16] == ICC_TAG))
+        if not metadata:
+            out.append(segment)
+        i += 2 + length
+    return None
+
+
+def jpegtran(data, keep_exif):
+    """Lossless jpegtran transcode of JPEG bytes, or None when jpegtran is unavailable or fails."""
+    binary = shutil.which('jpegtran')
+    if not binary:
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        source, target = Path(tmp) / 'in.jpg', Path(tmp) / 'out.jpg'
+        source.write_bytes(data)
+        command = [binary, '-copy', 'all' if keep_exif else 'icc', '-optimize', '-progressive',
+                   '-outfile', str(target), str(source)]
+        if subprocess.run(command, capture_output=True).returncode != 0 or not target.exists():
+            return None
+        return target.read_bytes()
+
+
+def jpegtran_version():
+    """First line of jpegtran's version banner, or None when it isn't on PATH."""
+    binary = shutil.which('jpegtran')
+    if not binary:
+        return None
+    proc = subprocess.run([binary, '-version'], stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    banner = (proc.stderr or proc.stdout).strip()
+    return banner.splitlines()[0] if banner else binary
+
+
+def pixels(data):
+    with Image.open(io.BytesIO(data)) as img:
+        return img.mode, img.size, img.tobytes()
+
+
+def optimize(path, output):
+    """
+    Worker: write a smaller, pixel-identical encoding of path to output.
+    Returns {'format', 'before', 'after', 'tool'} ('after' equals 'before'
+    and 'tool' is None when nothing smaller was found), or {'error': ...}.
+    """
+    data = Path(path).read_bytes()
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            fmt = img.format
+            info = dict(img.info)
+            keep_exif = img.getexif().get(EXIF_ORIENTATION, 1) != 1
+            if fmt == 'PNG' and not any(key in info for key in ('gamma', 'chromaticity')):
+                buffer = io.BytesIO()
+                options = {k: info[k] for k in ('icc_profile', 'transparency', 'dpi') if k in info}
+                img.save(buffer, format='PNG', optimize=True, **options)
+                candidates = [(buffer.getvalue(), 'png')]
+            elif fmt == 'JPEG':
+                stripped = data if keep_exif else strip_jpeg_metadata(data)
+                candidates = [(jpegtran(data, keep_exif), 'jpegtran'), (stripped, 'strip')]
+            else:
+                candidates = []
+        result = {'format': fmt, 'before': len(data), 'after': len(data), 'tool': None}
+        original = None
+        for encoded, tool in candidates:
+            if not encoded or len(encoded) >= result['after']:
+                continue
+            original = original or pixels(data)
+            if pixels(encoded) == original:
+                Path(output).parent.mkdir(parents=True, exist_ok=True)
+                Path(output).write_bytes(encoded)
+                result.update(after=len(encoded), tool=tool)
+        return result
+    except (OSError, ValueError, SyntaxError) as e:
+        return {'error': str(e)[:200], 'before': len(data)}
+
+
+def load_cache(path=CACHE_PATH, encoders=None):
+    """Cached results, or {} if they were made by another RESULTS_VERSION or other encoders."""
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == RESULTS_VERSION and data.get('encoders') == encoders:
+            return data.get('results', {})
+    return {}
+
+
+def optimized_path(cache_dir, sha):
+    return Path(cache_dir) / sha[:2] / sha
+
+
+def run(target_dir, cache_dir=CACHE_DIR, jobs=None):
+    """
+    Optimize every image in target_dir in place. Returns
+    ({filename: result}, number of distinct images encoded).
+    """
+    target_dir, cache_dir = Path(target_dir), Path(cache_dir)
+    cache_path = cache_dir / CACHE_PATH.name
+    sources = sorted(p for p in target_dir.iterdir()
+                     if p.suffix.lower() in IMAGE_SUFFIXES and not p.name.startswith('.') and p.is_file())
+    shas = {p.name: sha256_file(p) for p in sources}
+    encoders = {'jpegtran': jpegtran_version()}
+    cache = load_cache(cache_path, encoders)
+
+    # One encode per distinct image; hardlinked and identical copies share it
+    todo = {}
+    for path in sources:
+        sha = shas[path.name]
+        if sha not in cache or (cache[sha].get('tool') and not optimized_path(cache_dir, sha).exists()):
+            todo.setdefault(sha, path)
+    if todo:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outputs = [optimized_path(cache_dir, sha) for sha in todo]
+            for sha, result in zip(todo, pool.map(optimize, list(todo.values()), outputs,
+                                                  chunksize=BATCH_SIZE)):
+                cache[sha] = result
+
+    results, first = {}, {}
+    for path in sources:
+        sha = shas[path.name]
+        result = results[path.name] = cache[sha]
+        if not result.get('tool'):
+            continue
+        if sha in first:
+            link_or_copy(first[sha], path)
+        else:
+            tmp = path.with_name('.' + path.name + '.opt')
+            shutil.copyfile(optimized_path(cache_dir, sha), tmp)
+            os.replace(tmp, path)
+            first[sha] = path
+
+    live = set(shas.values())
+    for blob in cache_dir.glob('*/*'):
+        if blob.name not in live or not cache.get(blob.name, {}).get('tool'):
+            blob.unlink()
+    write_json_atomic(cache_path, {
+        'version': RESULTS_VERSION,
+        'encoders': encoders,
+        'results': {sha: result for sha, result in cache.items() if sha in live},
+    })
+    return results, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.imageoptimize',
+                                     description='Losslessly shrink the images of a deploy artifact in place.')
+    parser.add_argument('directory', type=Path, help='image directory, e.g. _site/images/phones')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--report', type=Path, default=REPORT_PATH,
+                        help='per-file sizes (default: .cache/image-optimize-report.json)')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("OPTIMIZING IMAGES")
+    print("=" * 80)
+    if not shutil.which('jpegtran'):
+        print("[WARN] jpegtran not found: JPEGs only get their metadata stripped\n")
+    started = time.perf_counter()
+    results, encoded = run(args.directory, jobs=args.jobs)
+    elapsed = time.perf_counter() - started
+
+    for name, result in results.items():
+        if 'error' in result:
+            print(f"  [SKIP] {name}: {result['error'][:100]}")
+        elif result['tool']:
+            print(f"  [OK] {name}: {result['before'] / 1024:.1f} -> {result['after'] / 1024:.1f} KB "
+                  f"({result['tool']})")
+    write_json_atomic(args.report, {name: {'before': r['before'], 'after': r.get('after', r['before'])}
+                                    for name, r in results.items()})
+
+    before = sum(r['before'] for r in results.values())
+    after = sum(r.get('after', r['before']) for r in results.values())
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Images: {len(results)}")
+    print(f"Encoded: {encoded} distinct images (the rest from {CACHE_DIR.name}/)")
+    print(f"Smaller: {sum(1 for r in results.values() if r.get('tool'))}")
+    print(f"Size: {before / 1024:.1f} -> {after / 1024:.1f} KB "
+          f"(-{(before - after) / max(1, before):.1%})")
+    print(f"Time: {elapsed:.2f}s")
+    print(f"\nReport saved to: {args.report}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Image Reference Index
+
+Indexes every reference to images/phones in the site source against the
+files on disk:
+
+    pages      "images/phones/<name>" in the HTML / JS / CSS files, plus
+               bare file names of existing images (sell-phones.html and
+               script.js prefix those themselves)
+    catalog    images/phones/<id>.jpg for every model in the Excel price
+               catalog (import-exact-prices.js and data/bundles build the
+               path from the id, so the text never names the file)
+
+Template paths such as `images/phones/${model.image}` can't be resolved
+statically; they are listed as dynamic so a reviewer can check them.
+Doc comments are not scanned.
+
+The report lists dangling references (no such file: a 404 on a customer
+page) and orphans (files nothing references). The index is written to
+.cache/image-references.json.
+
+images/phones itself is left alone: the fetch tooling (tools/fetch.py)
+would just download orphans again. Instead --prune removes them from the
+deploy artifact, together with their images/responsive variants and
+data/responsive-images.json entries. Orphans hardlinked to a referenced
+file (see tools/imagestore.py) cost nothing in the artifact, so only the
+bytes of other orphans are reported as saved.
+
+Requirements:
+    pip install openpyxl pillow
+
+Run:
+    python -m tools.imagerefs
+    python -m tools.imagerefs --strict     # exit 1 on dangling references
+    python -m tools.imagerefs --prune _site
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from tools.manifest import write_json_atomic
+from tools.prices import EXCEL_DIR, WORKBOOK_GLOB, WorkbookError, read_workbooks
+from tools.responsive import ENCODERS, IMAGE_SUFFIXES, output_name
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+INDEX_PATH = ROOT / '.cache' / 'image-references.json'
+
+SOURCE_SUFFIXES = {'.html', '.js', '.css'}
+SKIP_DIRS = {'.git', '.cache', '.github', '_site', 'images', 'data', 'node_modules', 'tools'}
+
+IMAGE_NAME = r'[A-Za-z0-9][A-Za-z0-9._-]*\.(?:jpe?g|png|webp|avif|gif)'
+PATH_REF = re.compile(rf'images/phones/({IMAGE_NAME})')
+DYNAMIC_REF = re.compile(r'images/phones/\$\{[^}]*\}[^\'"`\s)]*')
+BARE_NAME = re.compile(rf'[\'"`]({IMAGE_NAME})[\'"`]')
+COMMENT_LINE = re.compile(r'^\s*(//|/\*|\*)')
+
+
+def source_files(root=ROOT):
+    """Site HTML / JS / CSS outside the tooling, data and image directories."""
+    for path in sorted(Path(root).rglob('*')):
+        if path.suffix in SOURCE_SUFFIXES and path.is_file() \
+                and not SKIP_DIRS.intersection(path.relative_to(root).parts[:-1]):
+            yield path
+
+
+def scan_source(path, root, existing, references, dynamic):
+    """Add path's references to references ({name: [location]}) and dynamic ([location])."""
+    rel = path.relative_to(root).as_posix()
+    text = path.read_text(encoding='utf-8', errors='replace')
+    for number, line in enumerate(text.splitlines(), start=1):
+        if COMMENT_LINE.match(line):
+            continue
+        location = f"{rel}:{number}"
+        names = set(PATH_REF.findall(line))
+        names.update(name for name in BARE_NAME.findall(line) if name in existing)
+        for name in sorted(names):
+            references.setdefault(name, []).append(location)
+        for match in DYNAMIC_REF.findall(line):
+            dynamic.append(f"{location} {match}")
+
+
+def build_index(root=ROOT, images_dir=IMAGES_DIR, excel_dir=EXCEL_DIR):
+    images_dir = Path(images_dir)
+    existing = {p.name: p.stat().st_size for p in images_dir.iterdir()
+                if p.is_file() and p.suffix.lower() in IMAGE_SUFFIXES}
+    references, dynamic = {}, []
+    for path in source_files(root):
+        scan_source(path, Path(root), existing, references, dynamic)
+
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, _, _ = read_workbooks(paths)
+    for pid in phones:
+        references.setdefault(f"{pid}.jpg", []).append(f"catalog:{pid}")
+
+    return {
+        'version': 1,
+        'references': dict(sorted(references.items())),
+        'dangling': sorted(name for name in references if name not in existing),
+        'orphans': sorted(name for name in existing if name not in references),
+        'dynamic': dynamic,
+    }
+
+
+def orphan_bytes(images_dir, index):
+    """Bytes the orphans add to an artifact, ignoring hardlinks of kept files."""
+    images_dir = Path(images_dir)
+    orphans = set(index['orphans'])
+    kept_inodes = {(p.stat().st_dev, p.stat().st_ino) for p in images_dir.iterdir()
+                   if p.is_file() and p.name not in orphans}
+    seen, total = set(), 0
+    for name in index['orphans']:
+        stat = (images_dir / name).stat()
+        inode = (stat.st_dev, stat.st_ino)
+        if inode not in kept_inodes and inode not in seen:
+            seen.add(inode)
+            total += stat.st_size
+    return total
+
+
+def prune(site_dir, orphans):
+    """
+    Delete orphan images and their responsive variants from a deploy
+    artifact and drop them from its responsive manifest.
+    Returns the number of files removed.
+    """
+    site_dir = Path(site_dir)
+    manifest_path = site_dir / 'data' / 'responsive-images.json'
+    manifest = None
+    if manifest_path.exists():
+        with open(manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    removed = 0
+    for name in orphans:
+        targets = [site_dir / 'images' / 'phones' / name]
+        entry = manifest['images'].pop(name, None) if manifest else None
+        if entry:
+            targets += [site_dir / 'images' / 'responsive' / output_name(name, width, fmt, entry['sha256'])
+                        for width in entry['widths'] for fmt in manifest['formats'] if fmt in ENCODERS]
+        for target in targets:
+            if target.exists():
+                target.unlink()
+                removed += 1
+    if manifest:
+        write_json_atomic(manifest_path, manifest)
+    return removed
+
+
+def print_report(index, images_dir):
+    print(f"Referenced: {len(index['references'])} file name(s)")
+    for name in index['dangling']:
+        print(f"  [FAIL] {name} missing, referenced from {', '.join(index['references'][name][:4])}")
+    print(f"\nOrphans: {len(index['orphans'])} ({orphan_bytes(images_dir, index) / 1024:.1f} KB "
+          f"not shared with a referenced file)")
+    for name in index['orphans']:
+        print(f"  [SKIP] {name}")
+    if index['dynamic']:
+        print(f"\nDynamic references (check by hand): {len(index['dynamic'])}")
+        for location in index['dynamic']:
+            print(f"  {location}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.imagerefs',
+                                     description='Index image references and find dangling or orphan images.')
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR,
+                        help='image directory (default: images/phones)')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    parser.add_argument('--index', type=Path, default=INDEX_PATH,
+                        help='reference index (default: .cache/image-references.json)')
+    parser.add_argument('--prune', type=Path, metavar='SITE_DIR',
+                        help='remove orphan images from this deploy artifact')
+    parser.add_argument('--strict', action='store_true',
+                        help='exit 1 when a reference points to a missing file')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("IMAGE REFERENCES")
+    print("=" * 80)
+    try:
+        index = build_index(ROOT, args.images, args.excel)
+    except WorkbookError as e:
+        print(f"[FAIL] {e}")
+        return 1
+    write_json_atomic(args.index, index)
+    print_report(index, args.images)
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Dangling references: {len(index['dangling'])}")
+    print(f"Orphan images: {len(index['orphans'])}")
+    if args.prune:
+        removed = prune(args.prune, index['orphans'])
+        print(f"\n[OK] Pruned {removed} file(s) from {args.prune}")
+    print(f"\nIndex saved to: {args.index}")
+    return 1 if args.strict and index['dangling'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
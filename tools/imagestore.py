@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Content-Addressed Image Store
+
+Keeps one blob per distinct image under images/.store/<sha256[:2]>/, and
+turns every public filename in images/phones into a hardlink to its blob.
+Identical images (placeholders, apple-*/iphone-* and galaxy-*/samsung-*
+twins) are stored once, and a placeholder is a single link operation.
+
+Writes to images/phones must replace files (os.replace) rather than edit
+them in place, otherwise every alias of the blob changes with them.
+Where hardlinks are not supported the store falls back to plain copies.
+
+data/image-aliases.json maps each public filename to its SHA-256 and each
+SHA-256 to one canonical filename, for tooling that wants to reference or
+ship a single copy.
+
+Run:
+    python -m tools.imagestore status              # duplicate report
+    python -m tools.imagestore collapse            # ingest + hardlink duplicates
+    python -m tools.imagestore link SOURCE TARGET  # O(1) placeholder
+    python -m tools.imagestore gc                  # drop unreferenced blobs
+"""
+import argparse
+import os
+import shutil
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from tools.manifest import sha256_file, write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+STORE_DIR = ROOT / 'images' / '.store'
+ALIASES_PATH = ROOT / 'data' / 'image-aliases.json'
+
+
+def link_or_copy(source, target):
+    """Atomically make target a hardlink to source (or a copy if linking fails)."""
+    source, target = Path(source), Path(target)
+    tmp = target.with_name('.' + target.name + '.link')
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        os.link(source, tmp)
+    except OSError:
+        shutil.copy2(source, tmp)
+    os.replace(tmp, target)
+
+
+def same_file(a, b):
+    try:
+        return os.path.samefile(a, b)
+    except FileNotFoundError:
+        return False
+
+
+class ImageStore:
+    """SHA-256 keyed blob directory shared by all public image names."""
+
+    def __init__(self, root=STORE_DIR):
+        self.root = Path(root)
+
+    def blob_path(self, sha256, suffix='.jpg'):
+        return self.root / sha256[:2] / (sha256 + suffix)
+
+    def put(self, path, sha256=None):
+        """
+        Ingest path into the store and make it an alias of its blob.
+        Returns the SHA-256.
+        """
+        path = Path(path)
+        sha256 = sha256 or sha256_file(path)
+        blob = self.blob_path(sha256, path.suffix.lower())
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            link_or_copy(path, blob)
+        elif not same_file(path, blob):
+            link_or_copy(blob, path)
+        return sha256
+
+    def link(self, source, target):
+        """Point target at the same blob as source (placeholder images)."""
+        source, target = Path(source), Path(target)
+        if not same_file(source, target):
+            link_or_copy(source, target)
+
+    def gc(self):
+        """Remove blobs no public filename links to any more; returns bytes freed."""
+        freed = 0
+        if not self.root.exists():
+            return freed
+        for blob in self.root.glob('*/*'):
+            st = blob.stat()
+            if st.st_nlink == 1:
+                freed += st.st_size
+                blob.unlink()
+        return freed
+
+
+def group_by_hash(directory=IMAGES_DIR):
+    """sha256 -> sorted filenames for every image in directory."""
+    groups = defaultdict(list)
+    for path in sorted(Path(directory).iterdir()):
+        if path.is_file() and not path.name.startswith('.'):
+            groups[sha256_file(path)].append(path.name)
+    return groups
+
+
+def write_aliases(directory=IMAGES_DIR, path=ALIASES_PATH, groups=None):
+    """Write data/image-aliases.json; the canonical name is the first sorted one."""
+    groups = groups if groups is not None else group_by_hash(directory)
+    files = {name: sha for sha, names in groups.items() for name in names}
+    canonical = {sha: names[0] for sha, names in groups.items()}
+    write_json_atomic(path, {
+        'version': 1,
+        'files': dict(sorted(files.items())),
+        'canonical': dict(sorted(canonical.items())),
+    })
+    return files, canonical
+
+
+def collapse(directory=IMAGES_DIR, store=None):
+    """Ingest every image and hardlink identical files; returns (groups, bytes saved)."""
+    store = store or ImageStore()
+    groups = group_by_hash(directory)
+    saved = 0
+    for sha, names in groups.items():
+        for name in names:
+            path = Path(directory) / name
+            was_linked = path.stat().st_nlink > 1
+            store.put(path, sha)
+            if name != names[0] and not was_linked:
+                saved += path.stat().st_size
+    return groups, saved
+
+
+def print_status(groups, directory=IMAGES_DIR):
+    duplicates = {sha: names for sha, names in groups.items() if len(names) > 1}
+    total = sum(len(names) for names in groups.values())
+    wasted = 0
+    for sha, names in sorted(duplicates.items(), key=lambda item: item[1][0]):
+        size = (Path(directory) / names[0]).stat().st_size
+        wasted += size * (len(names) - 1)
+        print(f"  {names[0]} ({size / 1024:.1f} KB)")
+        for name in names[1:]:
+            print(f"    = {name}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Files: {total}")
+    print(f"Distinct images: {len(groups)}")
+    print(f"Duplicate groups: {len(duplicates)}")
+    print(f"Bytes in duplicate copies: {wasted / 1024:.1f} KB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.imagestore',
+                                     description='Content-addressed store for images/phones.')
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR,
+                        help='public image directory (default: images/phones)')
+    parser.add_argument('--store', type=Path, default=STORE_DIR,
+                        help='blob directory (default: images/.store)')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('status', help='report duplicate images')
+    sub.add_parser('collapse', help='ingest all images and hardlink duplicates')
+    link = sub.add_parser('link', help='create TARGET as an alias of SOURCE')
+    link.add_argument('source')
+    link.add_argument('target')
+    sub.add_parser('gc', help='remove blobs with no public filename')
+    args = parser.parse_args(argv)
+
+    store = ImageStore(args.store)
+
+    if args.command == 'status':
+        print_status(group_by_hash(args.images), args.images)
+    elif args.command == 'collapse':
+        groups, saved = collapse(args.images, store)
+        write_aliases(args.images, groups=groups)
+        print(f"[OK] {sum(len(n) for n in groups.values())} files -> {len(groups)} blobs")
+        print(f"[OK] Reclaimed {saved / 1024:.1f} KB of duplicate copies")
+    elif args.command == 'link':
+        source = args.images / args.source
+        if not source.exists():
+            print(f"[FAIL] {args.source} does not exist")
+            return 1
+        store.put(source)
+        store.link(source, args.images / args.target)
+        write_aliases(args.images)
+        print(f"[OK] {args.target} <- {args.source}")
+    elif args.command == 'gc':
+        print(f"[OK] Freed {store.gc() / 1024:.1f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Image Fetch Manifest
+
+Persistent record of every file the fetch engine has written to
+images/phones: source URL, ETag, Last-Modified, size and SHA-256.
+Reruns use it to send If-None-Match / If-Modified-Since so unchanged
+images come back as 304 Not Modified instead of a full download.
+
+Stored as JSON in data/image-manifest.json. The file is not in the tree
+yet: the first fetch run creates it (and revalidation starts cold until
+then). Commit it together with the images it describes.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = ROOT / 'data' / 'image-manifest.json'
+MANIFEST_VERSION = 1
+
+
+def sha256_file(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_text_atomic(path, text):
+    """Write text next to path and rename into place so readers never see half a file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8', newline='\n') as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def write_json_atomic(path, data):
+    write_text_atomic(path, json.dumps(data, indent=2, sort_keys=True) + '\n')
+
+
+class Manifest:
+    """Thread-safe filename -> entry map backed by a JSON file."""
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get('files', {})
+
+    def get(self, filename):
+        with self._lock:
+            entry = self.entries.get(filename)
+            return dict(entry) if entry else None
+
+    def record(self, filename, url, etag, last_modified, size, sha256):
+        with self._lock:
+            self.entries[filename] = {
+                'url': url,
+                'etag': etag,
+                'lastModified': last_modified,
+                'size': size,
+                'sha256': sha256,
+            }
+
+    def forget(self, filename):
+        with self._lock:
+            self.entries.pop(filename, None)
+
+    def validators(self, filename, url, filepath):
+        """
+        Conditional request headers for url, or {} when the file on disk
+        no longer matches what the manifest recorded for it.
+        """
+        entry = self.get(filename)
+        if not entry or entry['url'] != url:
+            return {}
+        try:
+            if filepath.stat().st_size != entry['size']:
+                return {}
+        except FileNotFoundError:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('lastModified'):
+            headers['If-Modified-Since'] = entry['lastModified']
+        return headers
+
+    def save(self):
+        with self._lock:
+            data = {'version': MANIFEST_VERSION, 'files': dict(sorted(self.entries.items()))}
+        write_json_atomic(self.path, data)
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+Perceptual-Hash Duplicate Detector
+
+Finds duplicate and wrong images in images/phones. Every image is decoded
+once into a 32x32 grayscale thumbnail. dHash and pHash fingerprints are
+computed for the whole batch as NumPy arrays, and one vectorized Hamming
+distance matrix groups near-identical images into clusters.
+
+A cluster that spans more than one model (e.g. galaxy-s21.jpg and
+galaxy-s23.jpg) means a model is showing another model's picture. Those
+files are written to data/image-clusters.json, which the fetch engine
+reads via ``python -m tools.fetch --flagged``.
+
+Fingerprints are cached by file SHA-256 in .cache/phash.json, so reruns
+only decode new or changed images.
+
+Requirements:
+    pip install numpy pillow
+
+Run:
+    python -m tools.phash
+    python -m tools.phash --threshold 6 --all
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from tools.manifest import sha256_file, write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+CACHE_PATH = ROOT / '.cache' / 'phash.json'
+REPORT_PATH = ROOT / 'data' / 'image-clusters.json'
+
+HASH_SIZE = 8      # 64-bit fingerprints
+DCT_SIZE = 32      # pHash works on a 32x32 thumbnail
+DEFAULT_THRESHOLD = 8
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
+
+# Byte -> number of set bits, for vectorized popcount
+POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+# Leftover download variants of one model (apple-iphone-16-pro-max-hq.jpg)
+VARIANT_SUFFIX = re.compile(r'-(best|hq|latest|gsmarena-alt|gsmarena-pics)$')
+
+
+def model_key(filename):
+    """
+    Normalise a filename to the model it depicts, so that legacy twins
+    (iphone-15.jpg / apple-iphone-15.jpg, galaxy-z-flip3.jpg /
+    samsung-galaxy-z-flip-3-5g.jpg) count as the same model.
+    """
+    stem = Path(filename).stem.lower()
+    stem = VARIANT_SUFFIX.sub('', stem)
+    stem = re.sub(r'^(apple|samsung|google)-', '', stem)
+    stem = re.sub(r'-5g$', '', stem)
+    return stem.replace('-', '')
+
+
+def dct_matrix(n):
+    """Orthonormal DCT-II basis, so X -> D @ X @ D.T is a 2-D DCT."""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    d = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    d[0] /= np.sqrt(2.0)
+    return d
+
+
+def load_thumbnail(path):
+    """Decode once and return a DCT_SIZE x DCT_SIZE float32 grayscale array."""
+    with Image.open(path) as img:
+        img.draft('L', (DCT_SIZE * 2, DCT_SIZE * 2))  # JPEG: decode at reduced scale
+        img = img.convert('L').resize((DCT_SIZE, DCT_SIZE), Image.LANCZOS)
+        return np.asarray(img, dtype=np.float32)
+
+
+def fingerprint_batch(thumbs):
+    """
+    thumbs: (N, 32, 32) float32. Returns (dhash, phash), each an (N, 8)
+    uint8 array holding 64 packed bits per image.
+    """
+    n = thumbs.shape[0]
+
+    # dHash: compare horizontally adjacent pixels of a 9x8 downsample
+    cols = np.linspace(0, DCT_SIZE - 1, HASH_SIZE + 1).round().astype(int)
+    rows = np.linspace(0, DCT_SIZE - 1, HASH_SIZE).round().astype(int)
+    small = thumbs[:, rows][:, :, cols]
+    dbits = small[:, :, 1:] > small[:, :, :-1]
+
+    # pHash: low-frequency 8x8 DCT block against its median (DC excluded)
+    d = dct_matrix(DCT_SIZE).astype(np.float32)
+    coeffs = d @ thumbs @ d.T
+    low = coeffs[:, :HASH_SIZE, :HASH_SIZE].reshape(n, -1)
+    median = np.median(low[:, 1:], axis=1, keepdims=True)
+    pbits = low > median
+
+    return (np.packbits(dbits.reshape(n, -1), axis=1),
+            np.packbits(pbits, axis=1))
+
+
+def hamming_matrix(packed):
+    """(N, 8) packed bits -> (N, N) pairwise Hamming distances."""
+    return POPCOUNT[packed[:, None, :] ^ packed[None, :, :]].sum(axis=2, dtype=np.uint16)
+
+
+def load_cache(path=CACHE_PATH):
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def fingerprints(paths, cache):
+    """
+    Fingerprint paths, decoding only cache misses. Returns
+    (dhash, phash, shas, decoded count, undecodable paths); the hash arrays
+    only cover the decodable paths, in order.
+    """
+    shas = [sha256_file(p) for p in paths]
+    missing = [i for i, sha in enumerate(shas) if sha not in cache]
+    thumbs, decoded = [], []
+    for i in missing:
+        try:
+            thumbs.append(load_thumbnail(paths[i]))
+            decoded.append(i)
+        except (OSError, ValueError) as e:
+            cache[shas[i]] = {'error': str(e)}
+    if thumbs:
+        dh, ph = fingerprint_batch(np.stack(thumbs))
+        for row, i in enumerate(decoded):
+            cache[shas[i]] = {'dhash': dh[row].tobytes().hex(), 'phash': ph[row].tobytes().hex()}
+
+    good = [sha for sha in shas if 'error' not in cache[sha]]
+    bad = [p for p, sha in zip(paths, shas) if 'error' in cache[sha]]
+
+    def unpack(key):
+        return np.array([np.frombuffer(bytes.fromhex(cache[sha][key]), dtype=np.uint8)
+                         for sha in good], dtype=np.uint8).reshape(len(good), HASH_SIZE)
+
+    return unpack('dhash'), unpack('phash'), good, len(missing), bad
+
+
+def cluster(distance, threshold):
+    """Connected components of the graph distance <= threshold; lists of indices."""
+    n = distance.shape[0]
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in np.argwhere(np.triu(distance <= threshold, k=1)):
+        parent[find(i)] = find(j)
+
+    groups = {}
+    for i in range(n):
+        groups.setdefault(find(i), []).append(i)
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+
+def audit(directory=IMAGES_DIR, threshold=DEFAULT_THRESHOLD, cache_path=CACHE_PATH):
+    paths = sorted(p for p in Path(directory).iterdir()
+                   if p.suffix.lower() in IMAGE_SUFFIXES and not p.name.startswith('.'))
+    cache = load_cache(cache_path)
+    dhash, phash, shas, decoded, undecodable = fingerprints(paths, cache)
+    write_json_atomic(cache_path, cache)
+    paths = [p for p in paths if p not in undecodable]
+
+    distance = np.maximum(hamming_matrix(dhash), hamming_matrix(phash))
+    clusters = []
+    for members in cluster(distance, threshold):
+        names = [paths[i].name for i in members]
+        sub = distance[np.ix_(members, members)]
+        models = sorted({model_key(name) for name in names})
+        clusters.append({
+            'files': names,
+            'models': models,
+            'exact': len({shas[i] for i in members}) == 1,
+            'maxDistance': int(sub.max()),
+            'suspect': len(models) > 1,
+        })
+    clusters.sort(key=lambda c: (not c['suspect'], c['files'][0]))
+    return {'threshold': threshold, 'images': len(paths) + len(undecodable),
+            'decoded': decoded, 'undecodable': [p.name for p in undecodable],
+            'clusters': clusters}
+
+
+def load_flagged(path=REPORT_PATH):
+    """
+    Filenames in suspect clusters or that could not be decoded in the last
+    report (used by tools.fetch --flagged).
+    """
+    if not Path(path).exists():
+        return set()
+    with open(path, encoding='utf-8') as f:
+        report = json.load(f)
+    flagged = {name for c in report['clusters'] if c['suspect'] for name in c['files']}
+    return flagged | set(report.get('undecodable', []))
+
+
+def print_report(report, show_all=False):
+    suspects = [c for c in report['clusters'] if c['suspect']]
+    shown = report['clusters'] if show_all else suspects
+    for c in shown:
+        tag = '[SUSPECT]' if c['suspect'] else '[ALIAS]'
+        kind = 'identical' if c['exact'] else f"distance <= {c['maxDistance']}"
+        print(f"\n{tag} {len(c['models'])} model(s), {kind}")
+        for name in c['files']:
+            print(f"  - {name}")
+
+    if report['undecodable']:
+        print("\n[FAIL] Not a decodable image:")
+        for name in report['undecodable']:
+            print(f"  - {name}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Images: {report['images']} ({report['decoded']} decoded, rest cached)")
+    print(f"Undecodable: {len(report['undecodable'])}")
+    print(f"Duplicate clusters: {len(report['clusters'])}")
+    print(f"Clusters spanning different models: {len(suspects)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.phash',
+                                     description='Find duplicate and wrong images in images/phones.')
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR)
+    parser.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help=f'max Hamming distance of 64-bit hashes (default: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--report', type=Path, default=REPORT_PATH,
+                        help='cluster report (default: data/image-clusters.json)')
+    parser.add_argument('--all', action='store_true',
+                        help='also print clusters of the same model under different names')
+    args = parser.parse_args(argv)
+
+    report = audit(args.images, args.threshold)
+    write_json_atomic(args.report, report)
+    print_report(report, args.all)
+    print(f"\nReport saved to: {args.report}")
+    return 1 if report['undecodable'] or any(c['suspect'] for c in report['clusters']) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
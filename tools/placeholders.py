@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""
+Low-Quality Image Placeholders
+
+Computes a tiny preview of every image in images/phones: the image scaled
+to 16px on its longest side, encoded as WebP and inlined as a base64 data
+URI (typically ~120 bytes). tools/prices.py embeds the preview as the
+`placeholder` field of each catalog phone. Model and product cards
+paint it as the image's background, so a blurred phone shows at once
+and the real image covers it when it arrives, with no extra request.
+
+Previews are computed in a process pool and cached by image content
+hash in .cache/placeholders.json, so only new or changed images are
+decoded. The result, data/image-placeholders.json (filename -> data
+URI), is committed with the images like image-aliases.json.
+
+Requirements:
+    pip install pillow openpyxl
+
+Run:
+    python -m tools.placeholders
+    python -m tools.placeholders --jobs 4
+"""
+import argparse
+import base64
+import io
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from tools.manifest import sha256_file, write_json_atomic
+from tools.prices import PLACEHOLDERS_PATH, load_placeholders
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+CACHE_PATH = ROOT / '.cache' / 'placeholders.json'
+
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
+PREVIEW_SIZE = 16
+PREVIEW_QUALITY = 40
+BATCH_SIZE = 16
+
+
+def preview(path):
+    """Worker: (data URI, None) for path, or (None, error)."""
+    try:
+        with Image.open(path) as img:
+            img.draft('RGB', (PREVIEW_SIZE * 4, PREVIEW_SIZE * 4))  # JPEG: decode at reduced scale
+            has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+            img = img.convert('RGBA' if has_alpha else 'RGB')
+        img.thumbnail((PREVIEW_SIZE, PREVIEW_SIZE), Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format='WEBP', quality=PREVIEW_QUALITY, method=6)
+    except (OSError, ValueError) as e:
+        return None, str(e)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii'), None
+
+
+def load_cache(path=CACHE_PATH):
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('size') == PREVIEW_SIZE and data.get('quality') == PREVIEW_QUALITY:
+            return data.get('previews', {})
+    return {}
+
+
+def build(images_dir=IMAGES_DIR, cache_path=CACHE_PATH, jobs=None):
+    """Returns ({filename: data URI}, {filename: error}, number of images decoded)."""
+    sources = sorted(p for p in Path(images_dir).iterdir()
+                     if p.suffix.lower() in IMAGE_SUFFIXES and not p.name.startswith('.'))
+    shas = {p.name: sha256_file(p) for p in sources}
+    cache = load_cache(cache_path)
+
+    # One decode per distinct image; aliases share the result
+    todo = {}
+    for path in sources:
+        if shas[path.name] not in cache:
+            todo.setdefault(shas[path.name], path)
+
+    errors_by_sha = {}
+    if todo:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(preview, list(todo.values()), chunksize=BATCH_SIZE)
+            for sha, (uri, error) in zip(todo, results):
+                if uri:
+                    cache[sha] = uri
+                else:
+                    errors_by_sha[sha] = error
+
+    placeholders, errors = {}, {}
+    for path in sources:
+        sha = shas[path.name]
+        if sha in cache:
+            placeholders[path.name] = cache[sha]
+        else:
+            errors[path.name] = errors_by_sha.get(sha, 'not decoded')
+
+    live = set(shas.values())
+    write_json_atomic(cache_path, {
+        'size': PREVIEW_SIZE,
+        'quality': PREVIEW_QUALITY,
+        'previews': {sha: uri for sha, uri in cache.items() if sha in live},
+    })
+    return placeholders, errors, len(todo)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.placeholders',
+                                     description='Compute inline preview placeholders for images/phones.')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--output', type=Path, default=PLACEHOLDERS_PATH,
+                        help='placeholder map (default: data/image-placeholders.json)')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING IMAGE PLACEHOLDERS")
+    print("=" * 80)
+    placeholders, errors, decoded = build(jobs=args.jobs)
+    for name, error in errors.items():
+        print(f"  [SKIP] {name}: {error[:100]}")
+
+    previous = load_placeholders(args.output)
+    if previous == placeholders:
+        print(f"\n[SAME] {args.output}")
+    else:
+        write_json_atomic(args.output, placeholders)
+        print(f"\n[OK] Written: {args.output}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Images: {len(placeholders) + len(errors)}")
+    print(f"Decoded: {decoded} distinct images (the rest from {CACHE_PATH.name})")
+    print(f"Skipped: {len(errors)}")
+    print(f"Average preview: {sum(map(len, placeholders.values())) / max(1, len(placeholders)):.0f} chars")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
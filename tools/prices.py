@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Excel Price Catalog Build
+
+Compiles data/excel-reference/*_USED_NEW_FULL_REVIEW.xlsx into
+import-exact-prices.js, the catalog price-database.js imports on a
+customer's first visit. The JS file is generated; edit the workbooks (or
+data/phone-colors.json for colour swatches) and rerun this instead.
+Image previews come from data/image-placeholders.json (see
+tools/placeholders.py).
+
+Workbooks are opened in read-only mode and read row by row, so memory
+stays flat however long the sheets grow. Per workbook:
+
+    USED_HIGHEST_ALL   Brand | Model | Storage | Highest Used Price (SGD)
+    NEW_HIGHEST_ALL    Brand | Model | Storage | Highest New Price (SGD)
+
+Every model in the USED sheet becomes a phone; its NEW rows fill
+newPhonePrices. NEW-only rows (tablets, watches) are reported and skipped.
+Buyback prices are derived for all storages at once:
+excellent = used, good = floor(used x 0.95), fair = floor(used x 0.85).
+
+Requirements:
+    pip install openpyxl
+
+Run:
+    python -m tools.prices
+    python -m tools.prices --check    # exit 1 if import-exact-prices.js is stale
+"""
+import argparse
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from tools.manifest import sha256_file, write_text_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+EXCEL_DIR = ROOT / 'data' / 'excel-reference'
+WORKBOOK_GLOB = '*_USED_NEW_FULL_REVIEW.xlsx'
+COLORS_PATH = ROOT / 'data' / 'phone-colors.json'
+PLACEHOLDERS_PATH = ROOT / 'data' / 'image-placeholders.json'
+OUTPUT_PATH = ROOT / 'import-exact-prices.js'
+
+USED_SHEET = 'USED_HIGHEST_ALL'
+NEW_SHEET = 'NEW_HIGHEST_ALL'
+HEADER = ('Brand', 'Model', 'Storage')
+
+GOOD_FACTOR = 0.95
+FAIR_FACTOR = 0.85
+
+
+class WorkbookError(Exception):
+    """A workbook is missing a sheet or has an unexpected layout."""
+
+
+def phone_id(brand, model):
+    """'Samsung', 'Galaxy S25+ 5G' -> 'samsung-galaxy-s25-plus-5g'"""
+    slug = f"{brand} {model}".lower().replace('+', ' plus')
+    return re.sub(r'[^a-z0-9]+', '-', slug).strip('-')
+
+
+def read_sheet(workbook, name, path):
+    """Yield (brand, model, storage, price) rows, streaming."""
+    if name not in workbook.sheetnames:
+        raise WorkbookError(f"{path.name}: no sheet {name!r}")
+    rows = workbook[name].iter_rows(values_only=True)
+    header = next(rows, ())
+    if tuple(header[:3]) != HEADER:
+        raise WorkbookError(f"{path.name}/{name}: expected columns {HEADER}, got {header[:3]}")
+    for number, row in enumerate(rows, start=2):
+        if not row or not row[1]:
+            continue
+        brand, model, storage, price = row[:4]
+        if not isinstance(price, (int, float)) or price < 0:
+            raise WorkbookError(f"{path.name}/{name} row {number}: bad price {price!r}")
+        yield str(brand).strip(), str(model).strip(), str(storage or 'Base').strip(), int(price)
+
+
+def read_workbooks(paths):
+    """Returns (phones in sheet order, NEW-only rows, source file hashes)."""
+    phones = {}
+    new_only = []
+    sources = {}
+    for path in paths:
+        sources[path.name] = sha256_file(path)[:12]
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            for brand, model, storage, price in read_sheet(workbook, USED_SHEET, path):
+                phone = phones.setdefault(phone_id(brand, model), {
+                    'brand': brand, 'model': model, 'storages': [], 'used': [], 'new': {}})
+                if storage in phone['storages']:
+                    raise WorkbookError(f"{path.name}/{USED_SHEET}: {model} {storage} listed twice")
+                phone['storages'].append(storage)
+                phone['used'].append(price)
+            for brand, model, storage, price in read_sheet(workbook, NEW_SHEET, path):
+                phone = phones.get(phone_id(brand, model))
+                if phone is None:
+                    new_only.append(f"{brand} {model} {storage}")
+                else:
+                    phone['new'][storage] = price
+        finally:
+            workbook.close()
+    return phones, new_only, sources
+
+
+def derive_buy_prices(phones):
+    """Good/fair buyback prices for every storage of every phone in one pass."""
+    for phone in phones.values():
+        phone['good'] = [math.floor(price * GOOD_FACTOR) for price in phone['used']]
+        phone['fair'] = [math.floor(price * FAIR_FACTOR) for price in phone['used']]
+
+
+def load_colors(path=COLORS_PATH):
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def load_placeholders(path=PLACEHOLDERS_PATH):
+    """Image filename -> preview data URI, written by tools/placeholders.py."""
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def compact(phones, colors, placeholders=None):
+    """One short JSON record per phone; import-exact-prices.js expands them."""
+    placeholders = placeholders or {}
+    records = []
+    for pid, phone in phones.items():
+        record = {'id': pid, 'brand': phone['brand'], 'model': phone['model'],
+                  'storages': phone['storages'], 'used': phone['used'],
+                  'good': phone['good'], 'fair': phone['fair']}
+        if phone['new']:
+            record['new'] = phone['new']
+        if colors.get(pid):
+            record['colors'] = colors[pid]
+        if placeholders.get(f"{pid}.jpg"):
+            record['placeholder'] = placeholders[f"{pid}.jpg"]
+        records.append(record)
+    return records
+
+
+def expand(record):
+    """Full phone entry for a compact record; same as expandCatalogPhone() in the JS."""
+    def zip_storages(values):
+        return {storage: values(i) for i, storage in enumerate(record['storages'])}
+
+    return {
+        'id': record['id'],
+        'brand': record['brand'],
+        'model': record['model'],
+        'image': f"images/phones/{record['id']}.jpg",
+        'storages': list(record['storages']),
+        'basePrice': record['used'][0],
+        'storagePrices': zip_storages(lambda i: record['used'][i]),
+        'newPhonePrices': dict(record.get('new', {})),
+        'buyPrices': zip_storages(lambda i: {'excellent': record['used'][i], 'good': record['good'][i],
+                                             'fair': record['fair'][i]}),
+        'quantities': zip_storages(lambda i: {'excellent': 0, 'good': 0, 'fair': 0}),
+        'colors': [dict(color) for color in record.get('colors', [])],
+        'placeholder': record.get('placeholder', ''),
+        'display': True,
+        'available': True,
+    }
+
+
+def render(records, sources):
+    def dumps(value):
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+    counts = {}
+    for record in records:
+        counts[record['brand']] = counts.get(record['brand'], 0) + 1
+    lines = [f"    {dumps(record)}" for record in records]
+    source_list = '\n'.join(f" * - {name} ({sha})" for name, sha in sources.items())
+    return JS_TEMPLATE.format(
+        sources=source_list,
+        summary=', '.join(f"{brand}: {n}" for brand, n in counts.items()),
+        good=GOOD_FACTOR, fair=FAIR_FACTOR,
+        records=',\n'.join(lines),
+    )
+
+
+JS_TEMPLATE = '''/**
+ * Import Exact Prices - GENERATED, DO NOT EDIT
+ *
+ * Built by `python -m tools.prices` from:
+{sources}
+ *
+ * Phones: {summary}
+ *
+ * Each record expands to a full phone entry:
+ * - storagePrices: USED prices from the USED_HIGHEST_ALL sheet
+ * - newPhonePrices: NEW prices from the NEW_HIGHEST_ALL sheet ({{}} if the model isn't listed there)
+ * - buyPrices: Excellent: USED, Good: floor(USED×{good}), Fair: floor(USED×{fair})
+ * - placeholder: 16px WebP preview of the image, shown while it loads
+ */
+
+const PRICE_CATALOG = [
+{records}
+];
+
+function expandCatalogPhone(record) {{
+    const zip = values => Object.fromEntries(record.storages.map((storage, i) => [storage, values(i)]));
+
+    return {{
+        id: record.id,
+        brand: record.brand,
+        model: record.model,
+        image: `images/phones/${{record.id}}.jpg`,
+        storages: record.storages.slice(),
+        basePrice: record.used[0],
+        storagePrices: zip(i => record.used[i]),
+        newPhonePrices: Object.assign({{}}, record.new),
+        buyPrices: zip(i => ({{ excellent: record.used[i], good: record.good[i], fair: record.fair[i] }})),
+        quantities: zip(() => ({{ excellent: 0, good: 0, fair: 0 }})),
+        colors: (record.colors || []).map(color => Object.assign({{}}, color)),
+        placeholder: record.placeholder || '',
+        display: true,
+        available: true
+    }};
+}}
+
+function importExactPrices() {{
+    const phones = PRICE_CATALOG.map(expandCatalogPhone);
+
+    // Save to localStorage
+    localStorage.setItem('ktmobile_phones', JSON.stringify(phones));
+
+    console.log('Imported ' + phones.length + ' phones to localStorage');
+
+    return {{
+        added: phones.length,
+        updated: 0,
+        total: phones.length
+    }};
+}}
+
+// Make function available globally
+if (typeof window !== 'undefined') {{
+    window.importExactPrices = importExactPrices;
+}}
+'''
+
+
+def build(excel_dir=EXCEL_DIR, colors_path=COLORS_PATH, placeholders_path=PLACEHOLDERS_PATH):
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, new_only, sources = read_workbooks(paths)
+    derive_buy_prices(phones)
+    colors = load_colors(colors_path)
+    unknown = sorted(set(colors) - set(phones))
+    records = compact(phones, colors, load_placeholders(placeholders_path))
+    return render(records, sources), phones, new_only, unknown
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.prices',
+                                     description='Compile the Excel price lists into import-exact-prices.js.')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_PATH,
+                        help='generated catalog (default: import-exact-prices.js)')
+    parser.add_argument('--check', action='store_true',
+                        help='only check that the output is up to date')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING PRICE CATALOG")
+    print("=" * 80)
+    try:
+        text, phones, new_only, unknown = build(args.excel)
+    except WorkbookError as e:
+        print(f"[FAIL] {e}")
+        return 1
+
+    for row in new_only:
+        print(f"  [SKIP] {row} (NEW sheet only, no used price)")
+    for pid in unknown:
+        print(f"  [SKIP] colors for {pid} (not in any workbook)")
+
+    current = args.output.read_text(encoding='utf-8') if args.output.exists() else None
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Phones: {len(phones)}")
+    print(f"Storage entries: {sum(len(p['storages']) for p in phones.values())}")
+    print(f"With new prices: {sum(1 for p in phones.values() if p['new'])}")
+
+    if args.check:
+        if current != text:
+            print(f"\n[FAIL] {args.output.name} is out of date; run python -m tools.prices")
+            return 1
+        print(f"\n[OK] {args.output.name} is up to date")
+        return 0
+
+    if current == text:
+        print(f"\n[SAME] {args.output}")
+    else:
+        write_text_atomic(args.output, text)
+        print(f"\n[OK] Written: {args.output} ({len(text.encode('utf-8')) / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+Local Quote API
+
+A small HTTP service that answers sell-quotes the way the quote page does
+(calculateQuote() in quote.js), for in-store kiosks and partner scripts
+that would otherwise have to drive the page:
+
+    GET  /health     table sources, SKU count, cache hits and reloads
+    GET  /quote      one quote from query parameters
+                     ?id=apple-iphone-15-pro&storage=256GB&body=B&issues=camera,wifi
+    POST /quotes     a batch: a JSON list of quote objects (or
+                     {"quotes": [...]}), answered in the same order
+
+A quote object has id and storage (as in the catalog) and optionally
+deviceType (used / new-sealed / new-activated, default used), country
+(local / export), body, screen, battery, receipt (yes / no), issues and
+accessories (lists). Missing grades default to the best condition. Each
+answer carries the price, or an error naming the unknown field.
+
+Prices come from data/quote-table.json (python -m tools.quotetable),
+loaded once; the receipt, issue and accessory values come from the
+conditionModifiers in data/admin-data.json over the quote.js defaults.
+The table's country, grade and activation deductions are fixed when it
+is built. If admin-data.json has different ones (the table hasn't been
+rebuilt since), the grid is rebuilt in memory from the table's base
+prices, so quotes never mix old and new modifiers; /health reports this
+as "regridded". quote.js makes the same check and calculates directly.
+
+Quotes are cached in an LRU keyed by the normalized condition tuple
+(issue and accessory order and duplicates don't matter, and grades are
+ignored for new devices). When either file changes on disk the service
+loads both again and drops the cache; a file that fails to load keeps
+the previous prices in service.
+
+Everything runs offline; --bench times random quotes in-process and over
+HTTP on a local port.
+
+Requirements:
+    pip install numpy
+
+Run:
+    python -m tools.quoteapi --port 8766
+    python -m tools.quoteapi --host 0.0.0.0      # serve kiosks on the shop network
+    python -m tools.quoteapi --bench 100000
+"""
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from tools.quotetable import ADMIN_DATA_PATH, OUTPUT_PATH as TABLE_PATH, assemble, build_grid, load_modifiers
+
+TABLE_VERSION = 1
+CACHE_SIZE = 65536           # distinct quotes kept
+RELOAD_INTERVAL = 1.0        # seconds between checks of the files on disk
+MAX_BATCH = 1000             # quotes per POST /quotes
+MAX_BODY = 1024 * 1024       # bytes per request body
+
+# Same defaults as loadConditionModifiers() in quote.js; the grid groups
+# (country, body, ...) are baked into the quote table
+DEFAULT_EXTRAS = {
+    'receipt': {'yes': 30, 'no': 0},
+    'issue': {'power': -300, 'faceid': -150, 'display': -200, 'touch': -180,
+              'camera': -120, 'speaker': -80, 'wifi': -100, 'charging': -90},
+    'accessory': {'cable': 10, 'box': 20},
+}
+GRADE_DEFAULTS = {'country': 'local', 'body': 'A', 'screen': 'A', 'battery': '91-100'}
+
+
+def load_extras(path=ADMIN_DATA_PATH):
+    """Receipt, issue and accessory modifiers: defaults merged with the exported admin overrides."""
+    extras = {group: dict(values) for group, values in DEFAULT_EXTRAS.items()}
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            overrides = json.load(f).get('data', {}).get('conditionModifiers') or {}
+        for group in extras:
+            extras[group].update(overrides.get(group, {}))
+    return extras
+
+
+def load_table(path=TABLE_PATH):
+    with open(path, encoding='utf-8') as f:
+        table = json.load(f)
+    if table.get('version') != TABLE_VERSION:
+        raise ValueError(f"{path}: quote table version {table.get('version')}, expected {TABLE_VERSION}")
+    return table
+
+
+def modifiers_match(table, modifiers):
+    """Whether the table was built with these grid modifiers (signs ignored, like quote.js)."""
+    return all({key: abs(value) for key, value in values.items()}
+               == {key: abs(value) for key, value in modifiers[group].items()}
+               for group, values in table['modifiers'].items())
+
+
+def regrid(table, modifiers):
+    """The table with its grids rebuilt from its base prices and other modifiers."""
+    base_used, base_new = table['base']['used'], table['base']['new']
+    phones = {pid: {'storages': list(rows),
+                    'used': [base_used[row] for row in rows.values()],
+                    'new': {storage: base_new[row] for storage, row in rows.items() if base_new[row] is not None}}
+              for pid, rows in table['skus'].items()}
+    return assemble(table.get('sources', {}), modifiers, build_grid(phones, modifiers))
+
+
+def fingerprint(paths):
+    """(mtime, size) of each path, None for a missing one."""
+    stamps = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def _names(value):
+    """Sorted, de-duplicated names from a list or a comma-separated string."""
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.split(',')
+    elif not isinstance(value, (list, tuple)):
+        value = [value]
+    return tuple(sorted({str(name).strip() for name in value} - {''}))
+
+
+class Pricer:
+    """Quotes from one loaded table; a reload builds a new Pricer (and cache) instead of mutating this one."""
+
+    def __init__(self, table, extras, cache_size=CACHE_SIZE, regridded=False):
+        self.table = table
+        self.extras = extras
+        self.regridded = regridded
+        self.dims = table['dims']
+        self.skus = table['skus']
+        self.used = table['used']
+        self.new = table['new']
+        self.used_shape = table['usedShape']
+        self.new_shape = table['newShape']
+        self.price = lru_cache(maxsize=cache_size)(self._price)
+
+    @staticmethod
+    def normalize(request):
+        """Cache key for a quote object: (id, storage, deviceType, country, grades, receipt, issues, accessories)."""
+        device = str(request.get('deviceType') or 'used')
+        grades = None
+        issues = accessories = ()
+        if device == 'used':
+            grades = tuple(str(request.get(group) or GRADE_DEFAULTS[group]) for group in ('body', 'screen', 'battery'))
+            issues = _names(request.get('issues'))
+            accessories = _names(request.get('accessories'))
+        return (str(request.get('id', '')), str(request.get('storage', '')), device,
+                str(request.get('country') or GRADE_DEFAULTS['country']), grades,
+                str(request.get('receipt') or 'no'), issues, accessories)
+
+    def _price(self, key):
+        """{'price': ...} or {'error': ...} for a normalized key; mirrors calculateQuote()."""
+        pid, storage, device, country, grades, receipt, issues, accessories = key
+        rows = self.skus.get(pid)
+        if rows is None:
+            return {'error': f"unknown id {pid!r}"}
+        row = rows.get(storage)
+        if row is None:
+            return {'error': f"unknown storage {storage!r} for {pid} (have {', '.join(rows)})"}
+        dims = self.dims
+        if country not in dims['country']:
+            return {'error': f"unknown country {country!r}"}
+        if receipt not in self.extras['receipt']:
+            return {'error': f"unknown receipt {receipt!r}"}
+        c = dims['country'][country]
+
+        if device == 'used':
+            for group, grade in zip(('body', 'screen', 'battery'), grades):
+                if grade not in dims[group]:
+                    return {'error': f"unknown {group} {grade!r}"}
+            b, s, t = (dims[group][grade] for group, grade in zip(('body', 'screen', 'battery'), grades))
+            _, nc, nb, ns, nt = self.used_shape
+            price = self.used[(((row * nc + c) * nb + b) * ns + s) * nt + t]
+            for name in issues:
+                if name not in self.extras['issue']:
+                    return {'error': f"unknown issue {name!r}"}
+                price -= abs(self.extras['issue'][name])
+            for name in accessories:
+                if name not in self.extras['accessory']:
+                    return {'error': f"unknown accessory {name!r}"}
+                price += self.extras['accessory'][name]
+        else:
+            if device not in dims['deviceType']:
+                return {'error': f"unknown deviceType {device!r}"}
+            _, nd, nc = self.new_shape
+            price = self.new[(row * nd + dims['deviceType'][device]) * nc + c]
+            if price is None:
+                return {'error': f"no new price for {pid} {storage}"}
+
+        # quote.js only applies the receipt modifier for 'yes'
+        if receipt == 'yes':
+            price += self.extras['receipt']['yes']
+        return {'price': max(0, price)}
+
+    def quote(self, request):
+        if not isinstance(request, dict):
+            return {'error': 'a quote must be a JSON object'}
+        key = self.normalize(request)
+        return {'id': key[0], 'storage': key[1], 'deviceType': key[2], **self.price(key)}
+
+    def quote_many(self, requests):
+        return [self.quote(request) for request in requests]
+
+
+class QuoteService:
+    """The current Pricer, reloaded when the quote table or the admin data change on disk."""
+
+    def __init__(self, table_path=TABLE_PATH, admin_data=ADMIN_DATA_PATH, cache_size=CACHE_SIZE,
+                 interval=RELOAD_INTERVAL, clock=time.monotonic):
+        self.paths = (Path(table_path), Path(admin_data))
+        self.cache_size = cache_size
+        self.interval = interval
+        self.clock = clock
+        self.reloads = 0
+        self._lock = threading.Lock()
+        self._stamp = fingerprint(self.paths)
+        self.pricer = self._load()
+        self._checked = clock()
+
+    def _load(self):
+        table_path, admin_data = self.paths
+        table = load_table(table_path)
+        modifiers = load_modifiers(admin_data)
+        regridded = not modifiers_match(table, modifiers)
+        if regridded:
+            table = regrid(table, modifiers)
+            print(f"[WARN] {table_path.name} was built with other condition modifiers than {admin_data.name}: "
+                  f"grid rebuilt in memory (run python -m tools.quotetable)")
+        return Pricer(table, load_extras(admin_data), self.cache_size, regridded)
+
+    def current(self):
+        """The Pricer to use, reloading first if a file changed (checked at most every interval)."""
+        if self.clock() - self._checked < self.interval:
+            return self.pricer
+        with self._lock:
+            if self.clock() - self._checked >= self.interval:
+                self._checked = self.clock()
+                stamp = fingerprint(self.paths)
+                if stamp != self._stamp:
+                    self._stamp = stamp
+                    try:
+                        self.pricer = self._load()
+                        self.reloads += 1
+                        print(f"[OK] Reloaded {self.paths[0].name}: {len(self.pricer.skus)} models")
+                    except (OSError, ValueError, KeyError) as e:
+                        print(f"[WARN] Reload failed, keeping the previous prices: {e}")
+        return self.pricer
+
+    def health(self):
+        pricer = self.current()
+        info = pricer.price.cache_info()
+        return {
+            'status': 'ok',
+            'sources': pricer.table.get('sources', {}),
+            'models': len(pricer.skus),
+            'skus': pricer.used_shape[0],
+            'reloads': self.reloads,
+            'regridded': pricer.regridded,
+            'cache': {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max': info.maxsize},
+        }
+
+
+class QuoteHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server_version = 'QuoteAPI/1.0'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _json(self, status, payload):
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            return self._json(200, self.server.service.health())
+        if url.path == '/quote':
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            result = self.server.service.current().quote(params)
+            return self._json(400 if 'error' in result else 200, result)
+        self._json(404, {'error': f"no such endpoint {url.path}"})
+
+    def do_POST(self):
+        if urlsplit(self.path).path != '/quotes':
+            return self._json(404, {'error': f"no such endpoint {self.path}"})
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if not 0 < length <= MAX_BODY:
+            self.close_connection = True
+            return self._json(413 if length > MAX_BODY else 400,
+                              {'error': f"send a JSON body of 1..{MAX_BODY} bytes with a Content-Length"})
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except (UnicodeDecodeError, ValueError) as e:
+            return self._json(400, {'error': f"invalid JSON: {e}"})
+        requests = payload.get('quotes') if isinstance(payload, dict) else payload
+        if not isinstance(requests, list):
+            return self._json(400, {'error': 'expected a list of quotes or {"quotes": [...]}'})
+        if len(requests) > MAX_BATCH:
+            return self._json(413, {'error': f"at most {MAX_BATCH} quotes per request"})
+        pricer = self.server.service.current()
+        self._json(200, {'sources': pricer.table.get('sources', {}), 'quotes': pricer.quote_many(requests)})
+
+
+class QuoteServer(ThreadingHTTPServer):
+    """Serves a QuoteService; use as a context manager to run it in a thread."""
+
+    daemon_threads = True
+
+    def __init__(self, service, host='127.0.0.1', port=0, verbose=False):
+        super().__init__((host, port), QuoteHandler)
+        self.service = service
+        self.verbose = verbose
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+def random_requests(pricer, count, seed=0):
+    """count random quote objects over every SKU and condition in the table."""
+    rng = random.Random(seed)
+    skus = [(pid, storage) for pid, rows in pricer.skus.items() for storage in rows]
+    new_skus = [(pid, storage) for pid, storage in skus
+                if pricer.table['base']['new'][pricer.skus[pid][storage]] is not None]
+    dims, extras = pricer.dims, pricer.extras
+    requests = []
+    for _ in range(count):
+        pid, storage = rng.choice(skus)
+        request = {'id': pid, 'storage': storage, 'country': rng.choice(list(dims['country'])),
+                   'receipt': rng.choice(list(extras['receipt']))}
+        if rng.random() < 0.8:
+            request.update({group: rng.choice(list(dims[group])) for group in ('body', 'screen', 'battery')})
+            request['issues'] = rng.sample(list(extras['issue']), rng.randint(0, 2))
+            request['accessories'] = rng.sample(list(extras['accessory']), rng.randint(0, 2))
+        elif new_skus:
+            request['id'], request['storage'] = rng.choice(new_skus)
+            request['deviceType'] = rng.choice(list(dims['deviceType']))
+        requests.append(request)
+    return requests
+
+
+def bench(service, count):
+    """Print in-process and HTTP quote rates for count random quotes."""
+    requests = random_requests(service.pricer, count)
+    for label in ('cold cache', 'warm cache'):
+        started = time.perf_counter()
+        service.pricer.quote_many(requests)
+        elapsed = time.perf_counter() - started
+        print(f"  [OK] In-process, {label}: {count / elapsed:,.0f} quotes/s")
+
+    with QuoteServer(service) as server:
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        started = time.perf_counter()
+        for start in range(0, count, MAX_BATCH):
+            body = json.dumps(requests[start:start + MAX_BATCH])
+            connection.request('POST', '/quotes', body, {'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                print(f"  [FAIL] POST /quotes: HTTP {response.status}")
+                return 1
+        elapsed = time.perf_counter() - started
+        connection.close()
+    print(f"  [OK] HTTP, batches of {MAX_BATCH}: {count / elapsed:,.0f} quotes/s")
+
+    info = service.pricer.price.cache_info()
+    errors = sum(1 for result in service.pricer.quote_many(requests) if 'error' in result)
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Quotes: {count} ({errors} errors)")
+    print(f"Distinct quotes cached: {info.currsize}")
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.quoteapi',
+                                     description='Serve sell-quotes from the quote table over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--table', type=Path, default=TABLE_PATH,
+                        help='quote table (default: data/quote-table.json)')
+    parser.add_argument('--admin-data', type=Path, default=ADMIN_DATA_PATH,
+                        help='exported admin data with receipt, issue and accessory modifiers')
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE, help='distinct quotes kept in the LRU')
+    parser.add_argument('--bench', type=int, metavar='N', help='time N random quotes instead of serving')
+    parser.add_argument('--verbose', action='store_true', help='log every request')
+    args = parser.parse_args(argv)
+
+    try:
+        service = QuoteService(args.table, args.admin_data, args.cache_size)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[FAIL] Cannot load the quote table: {e}")
+        print("       Build it with: python -m tools.quotetable")
+        return 1
+
+    if args.bench:
+        print("=" * 80)
+        print("QUOTE API BENCHMARK")
+        print("=" * 80)
+        return bench(service, args.bench)
+
+    server = QuoteServer(service, args.host, args.port, args.verbose)
+    print(f"Serving quotes for {len(service.pricer.skus)} models from {args.table} at {server.base_url}")
+    print("  GET /health, GET /quote?id=...&storage=..., POST /quotes")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+Precomputed Quote Table
+
+Builds data/quote-table.json, a dense grid holding every sell-quote the
+quote page can produce before issues, accessories and receipt:
+
+    used   [sku][country][body][screen][battery]
+           used price - country - body - screen - battery deduction
+    new    [sku][deviceType][country]
+           new price - activation deduction - country deduction
+           (null where the model has no new price)
+
+A sku is one model + storage from the Excel price lists (see
+tools/prices.py). The grids are NumPy broadcasts of the base prices
+against the condition modifiers: the defaults from quote.js, overridden by
+conditionModifiers in data/admin-data.json. Each dimension is a small
+value -> index dictionary, so quote.js answers a quote with one offset
+computation into a flat integer array.
+
+The build fails when a model's best-condition used or sealed quote is not
+positive, and warns about condition combinations that quote below zero
+(quote.js shows those as $0).
+
+Requirements:
+    pip install numpy openpyxl
+
+Run:
+    python -m tools.quotetable
+    python -m tools.quotetable --strict    # warnings fail the build too
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from tools.manifest import write_text_atomic
+from tools.prices import EXCEL_DIR, WORKBOOK_GLOB, WorkbookError, read_workbooks
+
+ROOT = Path(__file__).resolve().parent.parent
+ADMIN_DATA_PATH = ROOT / 'data' / 'admin-data.json'
+OUTPUT_PATH = ROOT / 'data' / 'quote-table.json'
+
+# Same defaults as loadConditionModifiers() in quote.js
+DEFAULT_MODIFIERS = {
+    'country': {'local': 0, 'export': -50},
+    'deviceType': {'new-sealed': 0, 'new-activated': -150},
+    'body': {'A': 0, 'B': -20, 'C': -60, 'D': -120},
+    'screen': {'A': 0, 'B': 0, 'C': -40, 'D': -150},
+    'battery': {'91-100': 0, '86-90': -20, '81-85': -50, '80-below': -100},
+}
+
+# Grid axes in storage order; quote.js reads the shapes, not these names
+USED_AXES = ('country', 'body', 'screen', 'battery')
+NEW_AXES = ('deviceType', 'country')
+
+
+def load_modifiers(path=ADMIN_DATA_PATH):
+    """Default modifiers merged with the exported admin overrides."""
+    modifiers = {group: dict(values) for group, values in DEFAULT_MODIFIERS.items()}
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            overrides = json.load(f).get('data', {}).get('conditionModifiers') or {}
+        for group in modifiers:
+            modifiers[group].update(overrides.get(group, {}))
+    return modifiers
+
+
+def deductions(modifiers, group):
+    """Axis values as a positive deduction vector (quote.js applies Math.abs)."""
+    return np.abs(np.array(list(modifiers[group].values()), dtype=np.int32))
+
+
+def build_grid(phones, modifiers):
+    """Returns (skus, used base, new base, used grid, new grid, new mask)."""
+    skus = {}
+    used_base, new_base = [], []
+    for pid, phone in phones.items():
+        skus[pid] = {}
+        for storage, price in zip(phone['storages'], phone['used']):
+            skus[pid][storage] = len(used_base)
+            used_base.append(price)
+            new_base.append(phone['new'].get(storage, -1))
+
+    used = np.array(used_base, dtype=np.int32)
+    new = np.array(new_base, dtype=np.int32)
+    country, body, screen, battery, device = (deductions(modifiers, group) for group in
+                                              ('country', 'body', 'screen', 'battery', 'deviceType'))
+
+    used_grid = (used[:, None, None, None, None]
+                 - country[None, :, None, None, None]
+                 - body[None, None, :, None, None]
+                 - screen[None, None, None, :, None]
+                 - battery[None, None, None, None, :])
+    new_grid = new[:, None, None] - device[None, :, None] - country[None, None, :]
+    has_new = new >= 0
+    return skus, used, new, used_grid, new_grid, has_new
+
+
+def validate(skus, used, new, used_grid, new_grid, has_new):
+    """Returns (errors, warnings) as printable lines."""
+    names = {row: f"{pid} {storage}" for pid, rows in skus.items() for storage, row in rows.items()}
+    errors, warnings = [], []
+
+    for row in np.flatnonzero(used <= 0):
+        errors.append(f"{names[row]}: used price {used[row]}")
+    best_used = used_grid[:, 0, 0, 0, 0]
+    for row in np.flatnonzero(best_used <= 0):
+        errors.append(f"{names[row]}: best used quote is ${best_used[row]}")
+    for row in np.flatnonzero(has_new & (new_grid[:, 0, 0] <= 0)):
+        errors.append(f"{names[row]}: new-sealed quote is ${new_grid[row, 0, 0]}")
+
+    clamped = (used_grid < 0).reshape(len(used), -1).sum(axis=1)
+    for row in np.flatnonzero(clamped):
+        warnings.append(f"{names[row]}: {clamped[row]} used condition combinations quote below $0 (shown as $0)")
+    activated = new_grid[:, 1, 0]
+    for row in np.flatnonzero(has_new & (activated < 0)):
+        warnings.append(f"{names[row]}: new-activated quote is ${activated[row]} (shown as $0)")
+    return errors, warnings
+
+
+def build(excel_dir=EXCEL_DIR, admin_data=ADMIN_DATA_PATH):
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, _, sources = read_workbooks(paths)
+    modifiers = load_modifiers(admin_data)
+    grid = build_grid(phones, modifiers)
+    errors, warnings = validate(*grid)
+    return assemble(sources, modifiers, grid), errors, warnings
+
+
+def assemble(sources, modifiers, grid):
+    """The quote-table.json document for a build_grid() result."""
+    skus, used, new, used_grid, new_grid, has_new = grid
+    new_mask = np.broadcast_to(has_new[:, None, None], new_grid.shape).ravel().tolist()
+    return {
+        'version': 1,
+        'sources': sources,
+        'modifiers': {group: modifiers[group] for group in USED_AXES + NEW_AXES[:1]},
+        'dims': {group: {key: i for i, key in enumerate(modifiers[group])}
+                 for group in USED_AXES + NEW_AXES[:1]},
+        'skus': skus,
+        'base': {'used': used.tolist(), 'new': [int(p) if p >= 0 else None for p in new]},
+        'usedShape': list(used_grid.shape),
+        'used': used_grid.ravel().tolist(),
+        'newShape': list(new_grid.shape),
+        'new': [value if ok else None for value, ok in zip(new_grid.ravel().tolist(), new_mask)],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.quotetable',
+                                     description='Precompute the quote price grid for quote.js.')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    parser.add_argument('--admin-data', type=Path, default=ADMIN_DATA_PATH,
+                        help='exported admin data with condition modifier overrides')
+    parser.add_argument('--output', type=Path, default=OUTPUT_PATH,
+                        help='quote table (default: data/quote-table.json)')
+    parser.add_argument('--strict', action='store_true', help='treat warnings as errors')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING QUOTE TABLE")
+    print("=" * 80)
+    try:
+        table, errors, warnings = build(args.excel, args.admin_data)
+    except WorkbookError as e:
+        print(f"[FAIL] {e}")
+        return 1
+
+    for line in errors:
+        print(f"  [FAIL] {line}")
+    for line in warnings:
+        print(f"  [WARN] {line}")
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"SKUs: {table['usedShape'][0]}")
+    print(f"Used quotes: {len(table['used'])}")
+    print(f"New quotes: {sum(1 for v in table['new'] if v is not None)}")
+    print(f"Errors: {len(errors)}, warnings: {len(warnings)}")
+
+    if errors or (args.strict and warnings):
+        print("\n[FAIL] Quote table not written")
+        return 1
+    text = json.dumps(table, separators=(',', ':')) + '\n'
+    write_text_atomic(args.output, text)
+    print(f"\n[OK] Written: {args.output} ({len(text) / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
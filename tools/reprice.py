@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""
+Batch Repricing Scenarios
+
+Evaluates what-if pricing rules against the whole Excel price catalog
+(see tools/prices.py) at once. The catalog is loaded into columnar NumPy
+arrays, one row per model x storage, and every rule is a vectorized
+operation over the rows it matches. One catalog load serves any number
+of scenarios; each takes well under a millisecond.
+
+A scenario file holds one scenario or {"scenarios": [...]}:
+
+    {
+      "name": "spring-promo",
+      "rules": [
+        {"match": {"brand": "Apple", "model": "^iPhone 1[56]"}, "shift": -5},
+        {"match": {"brand": "Samsung"}, "add": 20, "target": "used"},
+        {"floor": 30, "ceiling": 2500},
+        {"minSpread": 10},
+        {"round": 10, "mode": "down"}
+      ]
+    }
+
+Rules apply in order to the rows they match (all rows without "match"):
+
+    match      brand (exact), model (regex), storage (exact or a list)
+    target     "used", "new" or "both" (default); price columns to change
+    shift      percentage change
+    add        amount in SGD
+    floor, ceiling
+    round      step in SGD, with mode "nearest" (default), "down" or "up"
+    minSpread  lift new prices to at least used x (1 + minSpread / 100)
+
+Models without a new price keep none. Prices end as whole dollars, and
+good / fair buyback prices are derived from the result exactly as
+tools/prices.py does.
+
+For each scenario the summary reports how many SKUs changed and by how
+much. --output-dir also writes <name>.diff.json (changed SKUs, old and new
+prices) and <name>.js, a catalog in the import-exact-prices.js format,
+ready to try out in place of the real one. The Excel workbooks stay the
+source of truth; copy the prices you keep back into them.
+
+Requirements:
+    pip install numpy openpyxl
+
+Run:
+    python -m tools.reprice scenarios.json
+    python -m tools.reprice scenarios.json --output-dir /tmp/scenarios
+"""
+import argparse
+import json
+import math
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from tools.bundles import brand_slug
+from tools.manifest import write_json_atomic, write_text_atomic
+from tools.prices import (COLORS_PATH, EXCEL_DIR, FAIR_FACTOR, GOOD_FACTOR, WORKBOOK_GLOB, WorkbookError,
+                          compact, load_colors, load_placeholders, read_workbooks, render)
+
+TARGETS = {'used': ('used',), 'new': ('new',), 'both': ('used', 'new')}
+ROUND_MODES = {'nearest': np.round, 'down': np.floor, 'up': np.ceil}
+
+
+class ScenarioError(Exception):
+    """A scenario file has an unknown rule or a bad value."""
+
+
+@dataclass
+class Catalog:
+    """Columnar catalog: one row per model x storage."""
+    phones: dict            # phone id -> read_workbooks() entry, for rendering
+    sources: dict
+    ids: np.ndarray         # phone id per row
+    model_of: np.ndarray    # row -> index into models
+    models: list            # (brand, model) per phone, in catalog order
+    brands: np.ndarray
+    storages: np.ndarray
+    used: np.ndarray        # float64
+    new: np.ndarray         # float64, NaN where the model has no new price
+
+
+def load_catalog(excel_dir=EXCEL_DIR):
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, _, sources = read_workbooks(paths)
+
+    ids, model_of, brands, storages, used, new = [], [], [], [], [], []
+    models = []
+    for pid, phone in phones.items():
+        for storage, price in zip(phone['storages'], phone['used']):
+            ids.append(pid)
+            model_of.append(len(models))
+            brands.append(phone['brand'])
+            storages.append(storage)
+            used.append(price)
+            new.append(phone['new'].get(storage, math.nan))
+        models.append((phone['brand'], phone['model']))
+    return Catalog(phones, sources, np.array(ids), np.array(model_of, dtype=np.int32), models,
+                   np.array(brands), np.array(storages),
+                   np.array(used, dtype=np.float64), np.array(new, dtype=np.float64))
+
+
+def load_scenarios(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    scenarios = data.get('scenarios', [data]) if isinstance(data, dict) else data
+    for number, scenario in enumerate(scenarios, start=1):
+        scenario.setdefault('name', f"scenario-{number}")
+        if not isinstance(scenario.get('rules'), list):
+            raise ScenarioError(f"{scenario['name']}: no rules list")
+    return scenarios
+
+
+def rule_mask(catalog, match):
+    """Boolean row mask for a rule's match block."""
+    mask = np.ones(len(catalog.used), dtype=bool)
+    for key in match:
+        if key not in ('brand', 'model', 'storage'):
+            raise ScenarioError(f"unknown match key {key!r}")
+    if 'brand' in match:
+        mask &= catalog.brands == match['brand']
+    if 'model' in match:
+        # One regex test per model, broadcast to its storage rows
+        try:
+            pattern = re.compile(match['model'])
+        except re.error as e:
+            raise ScenarioError(f"bad model pattern {match['model']!r}: {e}")
+        by_model = np.array([bool(pattern.search(model)) for _, model in catalog.models])
+        mask &= by_model[catalog.model_of]
+    if 'storage' in match:
+        wanted = match['storage'] if isinstance(match['storage'], list) else [match['storage']]
+        mask &= np.isin(catalog.storages, wanted)
+    return mask
+
+
+def apply_rules(catalog, rules):
+    """Returns (used, new) whole-dollar price arrays after the rules."""
+    prices = {'used': catalog.used.copy(), 'new': catalog.new.copy()}
+    for rule in rules:
+        known = {'match', 'target', 'shift', 'add', 'floor', 'ceiling', 'round', 'mode', 'minSpread'}
+        if set(rule) - known:
+            raise ScenarioError(f"unknown rule keys {sorted(set(rule) - known)}")
+        if rule.get('target', 'both') not in TARGETS or rule.get('mode', 'nearest') not in ROUND_MODES:
+            raise ScenarioError(f"bad target or mode in {rule}")
+        mask = rule_mask(catalog, rule.get('match', {}))
+
+        for column in TARGETS[rule.get('target', 'both')]:
+            values = prices[column]
+            if 'shift' in rule:
+                values[mask] *= 1 + rule['shift'] / 100
+            if 'add' in rule:
+                values[mask] += rule['add']
+            if 'floor' in rule:
+                values[mask] = np.maximum(values[mask], rule['floor'])
+            if 'ceiling' in rule:
+                values[mask] = np.minimum(values[mask], rule['ceiling'])
+            if 'round' in rule:
+                step = rule['round']
+                values[mask] = ROUND_MODES[rule.get('mode', 'nearest')](values[mask] / step) * step
+        if 'minSpread' in rule:
+            lowest = prices['used'][mask] * (1 + rule['minSpread'] / 100)
+            prices['new'][mask] = np.maximum(prices['new'][mask], lowest)  # NaN stays NaN
+
+    return np.rint(prices['used']), np.rint(prices['new'])
+
+
+def diff_rows(catalog, used, new):
+    """Changed SKUs as JSON-ready dicts."""
+    used_changed = used != catalog.used
+    new_changed = ~(np.isnan(new) & np.isnan(catalog.new)) & (new != catalog.new)
+    rows = []
+    for row in np.flatnonzero(used_changed | new_changed):
+        entry = {'id': str(catalog.ids[row]), 'storage': str(catalog.storages[row])}
+        if used_changed[row]:
+            entry['used'] = [int(catalog.used[row]), int(used[row])]
+        if new_changed[row]:
+            entry['new'] = [int(catalog.new[row]), int(new[row])]
+        rows.append(entry)
+    return rows
+
+
+def to_phones(catalog, used, new):
+    """read_workbooks()-shaped phones carrying the scenario's prices."""
+    phones = {}
+    for pid, phone in catalog.phones.items():
+        phones[pid] = dict(phone, used=[], new={})
+    new_prices = {}
+    for row, pid in enumerate(catalog.ids.tolist()):
+        phones[pid]['used'].append(int(used[row]))
+        if not np.isnan(new[row]):
+            new_prices[pid, str(catalog.storages[row])] = int(new[row])
+    for pid, phone in phones.items():
+        # Keep the NEW sheet's storage order; NEW-only storages have no row and keep their price
+        phone['new'] = {storage: new_prices.get((pid, storage), price)
+                        for storage, price in catalog.phones[pid]['new'].items()}
+        phone['good'] = [math.floor(price * GOOD_FACTOR) for price in phone['used']]
+        phone['fair'] = [math.floor(price * FAIR_FACTOR) for price in phone['used']]
+    return phones
+
+
+def summarize(catalog, used):
+    changed = used != catalog.used
+    if not changed.any():
+        return 0, 0.0, 0
+    percent = (used[changed] - catalog.used[changed]) / catalog.used[changed] * 100
+    return int(changed.sum()), float(percent.mean()), int((used - catalog.used).sum())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.reprice',
+                                     description='Evaluate bulk repricing scenarios against the price catalog.')
+    parser.add_argument('scenarios', type=Path, help='scenario JSON file')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    parser.add_argument('--output-dir', type=Path,
+                        help='write <name>.diff.json and <name>.js per scenario')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("REPRICING SCENARIOS")
+    print("=" * 80)
+    try:
+        catalog = load_catalog(args.excel)
+        scenarios = load_scenarios(args.scenarios)
+    except (WorkbookError, ScenarioError, OSError, ValueError) as e:
+        print(f"[FAIL] {e}")
+        return 1
+
+    extras = (load_colors(COLORS_PATH), load_placeholders()) if args.output_dir else None
+    started = time.perf_counter()
+    failed = 0
+    for scenario in scenarios:
+        try:
+            used, new = apply_rules(catalog, scenario['rules'])
+        except ScenarioError as e:
+            print(f"  [FAIL] {scenario['name']}: {e}")
+            failed += 1
+            continue
+        rows = diff_rows(catalog, used, new)
+        changed, mean_percent, total = summarize(catalog, used)
+        print(f"  [OK] {scenario['name']}: {len(rows)} SKU(s) changed; used prices: {changed} changed, "
+              f"mean {mean_percent:+.1f}%, total {total:+d} SGD")
+        if args.output_dir:
+            slug = brand_slug(scenario['name'])
+            write_json_atomic(args.output_dir / f"{slug}.diff.json", {'name': scenario['name'], 'changes': rows})
+            records = compact(to_phones(catalog, used, new), *extras)
+            write_text_atomic(args.output_dir / f"{slug}.js", render(records, catalog.sources))
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"SKUs: {len(catalog.used)} ({len(catalog.models)} models)")
+    print(f"Scenarios: {len(scenarios)} ({failed} failed) in {elapsed * 1000:.1f} ms")
+    if args.output_dir:
+        print(f"\n[OK] Written to {args.output_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Responsive Image Build
+
+Transcodes every image in images/phones into a few fixed widths as AVIF,
+WebP and a JPEG fallback (images/responsive/<name>-<width>w.<hash>.<format>),
+using a process pool. Sources are never upscaled. Identical sources (see
+tools/imagestore.py) are transcoded once and the outputs hardlinked.
+
+data/responsive-images.json lists the widths available per image. The
+browser helper responsive-images.js reads it and gives model cards and
+product images a srcset, so a 70px card no longer downloads a 1440px
+vendor hero banner. The <hash> is the start of the source's SHA-256, so a
+refetched image gets new variant URLs instead of stale cached ones.
+
+Images whose source hash is unchanged and whose outputs exist are skipped.
+
+Requirements:
+    pip install pillow
+
+Run:
+    python -m tools.responsive
+    python -m tools.responsive --jobs 4 --force
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from PIL import Image, features
+
+from tools.imagestore import link_or_copy
+from tools.manifest import sha256_file, write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+OUTPUT_DIR = ROOT / 'images' / 'responsive'
+MANIFEST_PATH = ROOT / 'data' / 'responsive-images.json'
+
+MANIFEST_VERSION = 2  # 2: source hash in the variant names
+WIDTHS = (160, 320, 640)
+HASH_LENGTH = 12
+IMAGE_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
+
+# format -> (file extension, Pillow save options)
+ENCODERS = {
+    'avif': ('avif', {'quality': 55, 'speed': 6}),
+    'webp': ('webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('jpg', {'quality': 82, 'optimize': True, 'progressive': True}),
+}
+
+
+def available_formats():
+    """AVIF needs a Pillow build with libavif; WebP and JPEG are always built."""
+    formats = ['webp', 'jpeg']
+    if features.check('avif'):
+        formats.insert(0, 'avif')
+    return formats
+
+
+def output_name(source_name, width, fmt, sha256):
+    return f"{Path(source_name).stem}-{width}w.{sha256[:HASH_LENGTH]}.{ENCODERS[fmt][0]}"
+
+
+def target_widths(source_width):
+    """Fixed widths below the source width, topped up with the source width itself."""
+    widths = [w for w in WIDTHS if w < source_width]
+    if source_width <= WIDTHS[-1]:
+        widths.append(source_width)
+    return widths
+
+
+def transcode(source, sha256, output_dir, formats):
+    """
+    Worker: decode source once and write every width/format.
+    Returns (name, width, height, widths) or (name, error).
+    """
+    source = Path(source)
+    try:
+        with Image.open(source) as img:
+            img.load()
+            width, height = img.size
+            has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+            base = img.convert('RGBA' if has_alpha else 'RGB')
+    except (OSError, ValueError) as e:
+        return source.name, f"{e}"
+
+    widths = target_widths(width)
+    for w in widths:
+        h = max(1, round(height * w / width))
+        resized = base.resize((w, h), Image.LANCZOS) if w != width else base
+        for fmt in formats:
+            ext, options = ENCODERS[fmt]
+            frame = resized
+            if fmt == 'jpeg' and has_alpha:
+                frame = Image.new('RGB', resized.size, (255, 255, 255))
+                frame.paste(resized, mask=resized.getchannel('A'))
+            out = Path(output_dir) / output_name(source.name, w, fmt, sha256)
+            tmp = out.with_name(out.name + '.tmp')
+            frame.save(tmp, format=fmt.upper(), **options)
+            os.replace(tmp, out)
+    return source.name, width, height, widths
+
+
+def outputs_exist(name, entry, formats, output_dir):
+    return all((output_dir / output_name(name, w, fmt, entry['sha256'])).exists()
+               for w in entry['widths'] for fmt in formats)
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if Path(path).exists():
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    return {}
+
+
+def build(images_dir=IMAGES_DIR, output_dir=OUTPUT_DIR, manifest_path=MANIFEST_PATH,
+          jobs=None, force=False):
+    images_dir, output_dir = Path(images_dir), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    formats = available_formats()
+
+    previous = load_manifest(manifest_path)
+    old_entries = previous.get('images', {}) \
+        if previous.get('version') == MANIFEST_VERSION and previous.get('formats') == formats else {}
+
+    sources = sorted(p for p in images_dir.iterdir()
+                     if p.suffix.lower() in IMAGE_SUFFIXES and not p.name.startswith('.'))
+    shas = {p.name: sha256_file(p) for p in sources}
+
+    entries, todo, errors = {}, {}, {}
+    for path in sources:
+        sha = shas[path.name]
+        old = old_entries.get(path.name)
+        if not force and old and old['sha256'] == sha and outputs_exist(path.name, old, formats, output_dir):
+            entries[path.name] = old
+        else:
+            todo.setdefault(sha, []).append(path)
+
+    # One transcode per distinct source; aliases get hardlinked outputs
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {sha: pool.submit(transcode, paths[0], sha, output_dir, formats)
+                   for sha, paths in todo.items()}
+        for sha, future in futures.items():
+            result = future.result()
+            paths = todo[sha]
+            if len(result) == 2:
+                for path in paths:
+                    errors[path.name] = result[1]
+                    print(f"  [FAIL] {path.name}: {result[1][:100]}")
+                continue
+            first, width, height, widths = result
+            for path in paths:
+                if path.name != first:
+                    for w in widths:
+                        for fmt in formats:
+                            link_or_copy(output_dir / output_name(first, w, fmt, sha),
+                                         output_dir / output_name(path.name, w, fmt, sha))
+                entries[path.name] = {'w': width, 'h': height, 'widths': widths, 'sha256': sha}
+                print(f"  [OK] {path.name} ({width}x{height} -> {', '.join(map(str, widths))})")
+
+    # Drop outputs of sources that no longer exist
+    expected = {output_name(name, w, fmt, e['sha256']) for name, e in entries.items()
+                for w in e['widths'] for fmt in formats}
+    removed = 0
+    for out in output_dir.iterdir():
+        if out.name not in expected:
+            out.unlink()
+            removed += 1
+
+    write_json_atomic(manifest_path, {
+        'version': MANIFEST_VERSION,
+        'path': 'images/responsive/{name}-{width}w.{hash}.{ext}',
+        'hashLength': HASH_LENGTH,
+        'formats': formats,
+        'extensions': {fmt: ENCODERS[fmt][0] for fmt in formats},
+        'images': dict(sorted(entries.items())),
+    })
+    return len(sources), sum(len(p) for p in todo.values()), len(todo), errors, removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.responsive',
+                                     description='Build multi-width WebP/AVIF/JPEG variants of images/phones.')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='rebuild every image')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING RESPONSIVE IMAGES")
+    print("=" * 80)
+    print(f"Formats: {', '.join(available_formats())}; widths: {', '.join(map(str, WIDTHS))}\n")
+
+    total, rebuilt, transcoded, errors, removed = build(jobs=args.jobs, force=args.force)
+
+    sizes = [p.stat().st_size for p in OUTPUT_DIR.iterdir()]
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Sources: {total}")
+    print(f"Rebuilt: {rebuilt} ({transcoded} distinct transcodes)")
+    print(f"Up to date: {total - rebuilt}")
+    print(f"Failed: {len(errors)}")
+    print(f"Stale outputs removed: {removed}")
+    print(f"Output: {len(sizes)} files, {sum(sizes) / 1024:.1f} KB in {OUTPUT_DIR}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
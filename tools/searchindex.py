@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Model Search Index
+
+Builds data/search-index.json, a prefix / trigram index over the Excel
+price catalog (see tools/prices.py) that model-search.js queries for the
+buy page search box and the quote page's direct links.
+
+Each model is indexed under:
+    - the words of its brand and model name ("galaxy", "s24", "ultra", "5g")
+    - generated aliases: without the series word and the 5G suffix
+      ("S24 Ultra"), with Ultra shortened ("Galaxy S24U", "S24U")
+    - each name and alias run together ("galaxys24ultra", "s24u")
+    - its storages ("256gb", "12") and colours ("titanium", "black")
+
+Text is lowercased, "+" becomes "plus" and everything else that isn't a
+letter or digit splits words, the same as normalize() in model-search.js.
+
+    {"version": 1, "sources": {...},
+     "models": [[brand, model], ...],       catalog order
+     "terms": ["128gb", "15", ...],         sorted
+     "postings": [[model, ...], ...],       models per term
+     "grams": {"s24": [term, ...], ...}}    terms per trigram
+
+A query word matches a term exactly, as a prefix (binary search over the
+sorted terms) or anywhere inside it (trigram postings). A model matches
+when every query word does; results are ranked by match quality, then
+catalog order, so the same query always gives the same list.
+
+Requirements:
+    pip install openpyxl
+
+Run:
+    python -m tools.searchindex
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+from tools.manifest import write_text_atomic
+from tools.prices import COLORS_PATH, EXCEL_DIR, WORKBOOK_GLOB, WorkbookError, load_colors, read_workbooks
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_PATH = ROOT / 'data' / 'search-index.json'
+
+GRAM = 3
+NETWORK_SUFFIX = re.compile(r'\s+5G$', re.IGNORECASE)
+
+
+def normalize(text):
+    """'Galaxy S24+ 5G' -> ['galaxy', 's24', 'plus', '5g']"""
+    return [word for word in re.split(r'[^a-z0-9]+', text.lower().replace('+', ' plus ')) if word]
+
+
+def aliases(model):
+    """Other names customers use for a model, e.g. 'Galaxy S24 Ultra 5G' -> 'S24U'."""
+    names = {model, NETWORK_SUFFIX.sub('', model)}
+    for name in list(names):
+        words = name.split()
+        # Drop a series word ("Galaxy", "iPhone") unless only a number would be left
+        if len(words) > 1 and re.search(r'[A-Za-z]', words[1]):
+            names.add(' '.join(words[1:]))
+    for name in list(names):
+        names.add(re.sub(r'(\w)\s+Ultra\b', r'\1U', name))
+    names.discard(model)
+    return sorted(names)
+
+
+def model_terms(brand, model, storages, colors):
+    terms = set(normalize(brand))
+    for name in [model, *aliases(model)]:
+        words = normalize(name)
+        terms.update(words)
+        terms.add(''.join(words))
+    for value in [*storages, *colors]:
+        terms.update(normalize(value))
+    return terms
+
+
+def build_index(phones, colors, sources):
+    models, postings = [], {}
+    for number, (pid, phone) in enumerate(phones.items()):
+        models.append([phone['brand'], phone['model']])
+        names = [color['name'] for color in colors.get(pid, [])]
+        for term in model_terms(phone['brand'], phone['model'], phone['storages'], names):
+            postings.setdefault(term, []).append(number)
+
+    terms = sorted(postings)
+    grams = {}
+    for number, term in enumerate(terms):
+        for gram in sorted({term[i:i + GRAM] for i in range(len(term) - GRAM + 1)}):
+            grams.setdefault(gram, []).append(number)
+    return {
+        'version': 1,
+        'sources': sources,
+        'models': models,
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+        'grams': dict(sorted(grams.items())),
+    }
+
+
+def build(excel_dir=EXCEL_DIR, colors_path=COLORS_PATH):
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, _, sources = read_workbooks(paths)
+    return build_index(phones, load_colors(colors_path), sources)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.searchindex',
+                                     description='Build the model search index for model-search.js.')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    parser.add_argument('--output', type=Path, default=OUTPUT_PATH,
+                        help='search index (default: data/search-index.json)')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING SEARCH INDEX")
+    print("=" * 80)
+    try:
+        index = build(args.excel)
+    except WorkbookError as e:
+        print(f"[FAIL] {e}")
+        return 1
+
+    text = json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n'
+    current = args.output.read_text(encoding='utf-8') if args.output.exists() else None
+
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Models: {len(index['models'])}")
+    print(f"Terms: {len(index['terms'])}")
+    print(f"Trigrams: {len(index['grams'])}")
+    if current == text:
+        print(f"\n[SAME] {args.output}")
+    else:
+        write_text_atomic(args.output, text)
+        print(f"\n[OK] Written: {args.output} ({len(text.encode('utf-8')) / 1024:.1f} KB)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
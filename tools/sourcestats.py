@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Image Source Statistics
+
+Remembers, per source URL and per host, how often fetches succeeded and
+how long they took (exponentially weighted), in .cache/source-stats.json.
+
+rank() uses that history to order a file's candidate URLs. Healthy
+sources keep their curated order from data/image-sources.json; slow
+sources come after them, and sources that keep failing (or whose host
+does) go last. A dead host then costs nothing on the next run instead of
+a connect timeout per file.
+"""
+import json
+import threading
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from tools.manifest import write_json_atomic
+
+ROOT = Path(__file__).resolve().parent.parent
+STATS_PATH = ROOT / '.cache' / 'source-stats.json'
+
+LATENCY_WEIGHT = 0.3   # EWMA weight of the newest sample
+SLOW_SECONDS = 5.0     # healthy but slower than this -> tried after fast sources
+MIN_SUCCESS_RATE = 0.5
+
+
+def _host(url):
+    return urlsplit(url).hostname or ''
+
+
+class SourceStats:
+    """Thread-safe success/latency history keyed by URL and by host."""
+
+    def __init__(self, path=STATS_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.urls = {}
+        self.hosts = {}
+        if self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            self.urls = data.get('urls', {})
+            self.hosts = data.get('hosts', {})
+
+    @staticmethod
+    def _update(entry, ok, elapsed):
+        entry['attempts'] = entry.get('attempts', 0) + 1
+        entry['successes'] = entry.get('successes', 0) + (1 if ok else 0)
+        if ok:
+            previous = entry.get('latency')
+            entry['latency'] = elapsed if previous is None else (
+                LATENCY_WEIGHT * elapsed + (1 - LATENCY_WEIGHT) * previous)
+
+    def record(self, url, ok, elapsed):
+        with self._lock:
+            self._update(self.urls.setdefault(url, {}), ok, elapsed)
+            self._update(self.hosts.setdefault(_host(url), {}), ok, elapsed)
+
+    @staticmethod
+    def success_rate(entry):
+        """Laplace-smoothed, so one failure doesn't condemn a source."""
+        if not entry:
+            return None
+        return (entry.get('successes', 0) + 1) / (entry.get('attempts', 0) + 2)
+
+    def tier(self, url):
+        """0 = healthy/unknown, 1 = healthy but slow, 2 = failing."""
+        with self._lock:
+            entry = self.urls.get(url)
+            host = self.hosts.get(_host(url))
+        rate = self.success_rate(entry)
+        if rate is None:
+            rate = self.success_rate(host)
+        if rate is not None and rate < MIN_SUCCESS_RATE:
+            return 2
+        latency = (entry or {}).get('latency')
+        if latency is not None and latency > SLOW_SECONDS:
+            return 1
+        return 0
+
+    def rank(self, urls):
+        """Candidate URLs ordered by tier; curated order breaks ties."""
+        return sorted(urls, key=lambda url: (self.tier(url), urls.index(url)))
+
+    def save(self):
+        with self._lock:
+            data = {'urls': dict(sorted(self.urls.items())),
+                    'hosts': dict(sorted(self.hosts.items()))}
+        write_json_atomic(self.path, data)
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Model Grid Sprite Atlases
+
+Packs the thumbnail of every catalog phone (images/phones/<id>.jpg, see
+tools/prices.py) into one sprite sheet per brand. Each sheet comes in two
+densities (70x90 and 140x180 px cells) and as WebP plus a JPEG fallback:
+
+    images/sprites/<brand>.<hash>.webp       1x
+    images/sprites/<brand>@2x.<hash>.webp    2x (retina)
+    images/sprites/<brand>.<hash>.jpg, <brand>@2x.<hash>.jpg
+
+data/sprites.json maps each image filename to its sheet and cell offset.
+model-sprites.js reads it, and the quote page's model grid paints every
+card of a brand from a single cached sheet instead of one image request
+per model. Sheet names carry a hash of their content, so an unchanged
+sheet stays in the browser cache. Cards whose image isn't in a sheet
+(admin uploads, images that fail to decode) keep their own <img>.
+
+Thumbnails are scaled to fit the cell, centred on white like the cards.
+Sheets no longer in the map are deleted.
+
+Requirements:
+    pip install pillow openpyxl
+
+Run:
+    python -m tools.sprites
+"""
+import argparse
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+from PIL import Image
+
+from tools.bundles import brand_slug
+from tools.manifest import write_json_atomic
+from tools.prices import EXCEL_DIR, WORKBOOK_GLOB, WorkbookError, read_workbooks
+
+ROOT = Path(__file__).resolve().parent.parent
+IMAGES_DIR = ROOT / 'images' / 'phones'
+OUTPUT_DIR = ROOT / 'images' / 'sprites'
+MAP_PATH = ROOT / 'data' / 'sprites.json'
+
+CELL = (70, 90)         # CSS pixels, same box as the model card <img>
+DENSITIES = (1, 2)
+COLUMNS = 8
+BACKGROUND = (255, 255, 255)
+HASH_LENGTH = 12
+
+# format -> (file extension, Pillow save options)
+ENCODERS = {
+    'webp': ('webp', {'quality': 82, 'method': 6}),
+    'jpeg': ('jpg', {'quality': 85, 'optimize': True, 'progressive': True}),
+}
+
+
+def catalog_images(excel_dir=EXCEL_DIR):
+    """Brand -> [image filename] in catalog order."""
+    paths = sorted(Path(excel_dir).glob(WORKBOOK_GLOB))
+    if not paths:
+        raise WorkbookError(f"no {WORKBOOK_GLOB} in {excel_dir}")
+    phones, _, _ = read_workbooks(paths)
+    brands = {}
+    for pid, phone in phones.items():
+        brands.setdefault(phone['brand'], []).append(f"{pid}.jpg")
+    return brands
+
+
+def load_thumbnail(path, size):
+    """Image scaled to fit size and centred on the card background."""
+    with Image.open(path) as img:
+        img.load()
+        has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
+        img = img.convert('RGBA' if has_alpha else 'RGB')
+    img.thumbnail(size, Image.LANCZOS)
+    cell = Image.new('RGB', size, BACKGROUND)
+    offset = ((size[0] - img.width) // 2, (size[1] - img.height) // 2)
+    cell.paste(img, offset, img.getchannel('A') if has_alpha else None)
+    return cell
+
+
+def pack(names, images_dir=IMAGES_DIR):
+    """
+    Lay the decodable images out on a grid.
+    Returns ({name: (x, y)} in CSS pixels, {density: sheet image}, {name: error}).
+    """
+    thumbs, errors = {}, {}
+    for name in names:
+        path = Path(images_dir) / name
+        try:
+            thumbs[name] = {d: load_thumbnail(path, (CELL[0] * d, CELL[1] * d)) for d in DENSITIES}
+        except (OSError, ValueError) as e:
+            errors[name] = str(e)
+
+    columns = min(COLUMNS, len(thumbs)) or 1
+    rows = -(-len(thumbs) // columns)
+    cells = {name: ((i % columns) * CELL[0], (i // columns) * CELL[1]) for i, name in enumerate(thumbs)}
+    sheets = {}
+    for d in DENSITIES:
+        sheet = Image.new('RGB', (columns * CELL[0] * d, rows * CELL[1] * d), BACKGROUND)
+        for name, (x, y) in cells.items():
+            sheet.paste(thumbs[name][d], (x * d, y * d))
+        sheets[d] = sheet
+    return cells, sheets, errors
+
+
+def encode(image, fmt):
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt.upper(), **ENCODERS[fmt][1])
+    return buffer.getvalue()
+
+
+def sheet_name(slug, density, data, fmt):
+    suffix = '' if density == 1 else f"@{density}x"
+    return f"{slug}{suffix}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.{ENCODERS[fmt][0]}"
+
+
+def build(excel_dir=EXCEL_DIR, images_dir=IMAGES_DIR, output_dir=OUTPUT_DIR):
+    """Write the sheets; returns (sprite map, {name: error})."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    sprite_map = {'version': 1, 'cell': list(CELL), 'sheets': {}, 'images': {}}
+    all_errors = {}
+    for brand, names in catalog_images(excel_dir).items():
+        cells, sheets, errors = pack(names, images_dir)
+        all_errors.update(errors)
+        if not cells:
+            continue
+        files = {}
+        for fmt in ENCODERS:
+            files[fmt] = {}
+            for d, sheet in sheets.items():
+                data = encode(sheet, fmt)
+                name = sheet_name(brand_slug(brand), d, data, fmt)
+                path = output_dir / name
+                if not path.exists():
+                    path.write_bytes(data)
+                files[fmt][f"{d}x"] = f"images/sprites/{name}"
+        sprite_map['sheets'][brand] = {'size': list(sheets[1].size), 'files': files}
+        for name, (x, y) in cells.items():
+            sprite_map['images'][name] = [brand, x, y]
+    return sprite_map, all_errors
+
+
+def remove_stale(sprite_map, output_dir=OUTPUT_DIR):
+    current = {Path(path).name for sheet in sprite_map['sheets'].values()
+               for by_density in sheet['files'].values() for path in by_density.values()}
+    removed = 0
+    for path in Path(output_dir).iterdir():
+        if path.name not in current:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m tools.sprites',
+                                     description='Pack per-brand model thumbnails into sprite sheets.')
+    parser.add_argument('--excel', type=Path, default=EXCEL_DIR,
+                        help='workbook directory (default: data/excel-reference)')
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BUILDING SPRITE ATLASES")
+    print("=" * 80)
+    try:
+        sprite_map, errors = build(args.excel)
+    except WorkbookError as e:
+        print(f"[FAIL] {e}")
+        return 1
+
+    for name, error in errors.items():
+        print(f"  [SKIP] {name}: {error[:100]}")
+    for brand, sheet in sprite_map['sheets'].items():
+        count = sum(1 for entry in sprite_map['images'].values() if entry[0] == brand)
+        print(f"  [OK] {brand}: {count} thumbnails, {sheet['size'][0]}x{sheet['size'][1]} "
+              f"-> {Path(sheet['files']['webp']['1x']).name}")
+    write_json_atomic(MAP_PATH, sprite_map)
+    removed = remove_stale(sprite_map)
+
+    sizes = [p.stat().st_size for p in OUTPUT_DIR.iterdir()]
+    print("\n" + "=" * 80)
+    print("SUMMARY")
+    print("=" * 80)
+    print(f"Brands: {len(sprite_map['sheets'])}")
+    print(f"Thumbnails: {len(sprite_map['images'])} (skipped: {len(errors)})")
+    print(f"Stale sheets removed: {removed}")
+    print(f"Output: {len(sizes)} files, {sum(sizes) / 1024:.1f} KB in {OUTPUT_DIR}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())